@@ -1,8 +1,78 @@
 import re
+import sys
+from collections import deque
 from .ulits import log
 
+UNSAFE_CHARACTERS = re.compile(r'[^\w\s]')
+
+class ScriptedInput:
+    """
+    Reads commands from a pipe or file in large blocks instead of one line per prompt.
+
+    Each block is split into lines and sanitized with a single regex pass, so a scripted
+    session costs a handful of reads however many commands it holds.
+
+    Attributes:
+        stream (BinaryIO): The binary stream commands are read from.
+    """
+
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.read_block = getattr(stream, "read1", stream.read)
+        self.raw_lines = deque()
+        self.sanitized_lines = deque()
+        self.partial = b""
+        self.exhausted = False
+
+    def fill(self):
+        """
+        Reads blocks until at least one complete line is buffered.
+
+        Raises:
+            EOFError: If the stream has no more lines.
+        """
+        while not self.raw_lines:
+            if self.exhausted:
+                raise EOFError("No more scripted input.")
+            block = self.read_block(self.BLOCK_SIZE)
+            if block:
+                data = self.partial + block
+                end = data.rfind(b"\n") + 1
+                if not end:
+                    self.partial = data
+                    continue
+                data, self.partial = data[:end - 1], data[end:]
+            else:
+                self.exhausted = True
+                if not self.partial:
+                    continue
+                data, self.partial = self.partial, b""
+            text = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+            # The sanitizer keeps whitespace, so the sanitized block splits into the same lines
+            self.raw_lines.extend(text.split("\n"))
+            self.sanitized_lines.extend(UNSAFE_CHARACTERS.sub("", text).split("\n"))
+
+    def read_line(self, sanitize=True):
+        """
+        Takes the next buffered line.
+
+        Args:
+            sanitize (bool): Whether to return the sanitized line rather than the raw one.
+
+        Returns:
+            str: The next line, without its line ending.
+        """
+        self.fill()
+        raw, sanitized = self.raw_lines.popleft(), self.sanitized_lines.popleft()
+        return sanitized if sanitize else raw
+
 class Security:
 
+    # None until the first read decides between the terminal and scripted input
+    script = None
+
     @staticmethod
     def sanitize_input(user_input):
         """
@@ -15,8 +85,33 @@ class Security:
             str: The sanitized input string.
         """
         # Remove potentially harmful characters or patterns
-        sanitized = re.sub(r'[^\w\s]', '', user_input)
+        sanitized = UNSAFE_CHARACTERS.sub('', user_input)
         return sanitized
+
+    @staticmethod
+    def read_line(prompt="", sanitize=True):
+        """
+        Reads a line of user input.
+
+        When stdin is a pipe or file, lines come from a ScriptedInput and the prompt is
+        not printed; otherwise this is `input(prompt)`.
+
+        Args:
+            prompt (str): The prompt to display to the user.
+            sanitize (bool): Whether to remove potentially harmful characters.
+
+        Returns:
+            str: The line entered, without its line ending.
+
+        Raises:
+            EOFError: If there is no more input.
+        """
+        if Security.script is None:
+            Security.script = False if sys.stdin.isatty() else ScriptedInput(sys.stdin.buffer)
+        if Security.script:
+            return Security.script.read_line(sanitize)
+        user_input = input(prompt)
+        return Security.sanitize_input(user_input) if sanitize else user_input
     
     @staticmethod
     def get_validated_int(prompt, valid_range):
@@ -32,7 +127,7 @@ class Security:
         """
         while True:
             try:
-                value = int(Security.sanitize_input(input(prompt)))
+                value = int(Security.read_line(prompt))
                 if value in valid_range:
                     return value
                 else:
@@ -53,7 +148,7 @@ class Security:
             str: The validated choice input.
         """
         while True:
-            choice = Security.sanitize_input(input(prompt).lower())
+            choice = Security.read_line(prompt).lower()
             if choice in valid_choices:
                 return choice
             else:
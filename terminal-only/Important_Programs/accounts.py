@@ -0,0 +1,138 @@
+import math
+from .ledger import Ledger
+
+HOUSE = "House"
+
+class AccountBook:
+    """
+    Accrues interest on players' bank and safe balances lazily.
+
+    Interest compounds once per completed round, but nothing sweeps over the players
+    at round boundaries. Each player's balances are stamped with the round they were
+    last brought up to date, and `accrue` applies every round missed since then in
+    closed form. The game only accrues a player when it reads or changes their money
+    (at the start of their turn, when they are stolen from, and when the game ends),
+    so a round costs nothing for players who are not involved in it.
+
+    Owning a House raises the safe's interest rate by `house_yield_bonus` and its
+    capacity by `house_safe_capacity` per House.
+
+    Interest is paid from the world account of the ledger.
+
+    Attributes:
+        scenario (Scenario): The game parameters holding the rates and capacities.
+        ledger (Ledger): The ledger interest payments are recorded in.
+        round (int): The number of completed rounds interest is owed for.
+        touched (dict): Player IDs mapped to the round their balances were last brought up to date.
+    """
+
+    def __init__(self, scenario, ledger=None):
+        self.scenario = scenario
+        self.ledger = Ledger() if ledger is None else ledger
+        self.round = 0
+        self.touched = {}
+
+    @staticmethod
+    def houses(player):
+        return sum(1 for item in player.inventory if item.name == HOUSE)
+
+    @staticmethod
+    def compound(amount, rate, rounds):
+        """
+        Compounds a positive balance over a number of rounds. Debts do not accrue interest.
+
+        Args:
+            amount (float): The balance.
+            rate (float): The interest rate per round.
+            rounds (int): The number of rounds to compound over.
+
+        Returns:
+            float: The compounded balance.
+        """
+        if amount <= 0 or not rate or rounds <= 0:
+            return amount
+        return amount * (1 + rate) ** rounds
+
+    @staticmethod
+    def compound_series(payment, rate, fewest_rounds, count):
+        """
+        Sums equal payments that each compounded over one round fewer than the last.
+
+        Args:
+            payment (float): The size of each payment.
+            rate (float): The interest rate per round.
+            fewest_rounds (int): The rounds the newest payment compounded over.
+            count (int): The number of payments.
+
+        Returns:
+            float: The compounded total, in closed form.
+        """
+        if count <= 0:
+            return 0.0
+        if not rate or payment <= 0:
+            return payment * count
+        growth = 1 + rate
+        return payment * growth ** fewest_rounds * (growth ** count - 1) / rate
+
+    def bank_rate(self, player):
+        return self.scenario.bank_interest_rate
+
+    def safe_rate(self, player):
+        return self.scenario.safe_interest_rate + self.houses(player) * self.scenario.house_yield_bonus
+
+    def safe_capacity(self, player):
+        """
+        Returns how much a player's safe can hold.
+
+        Args:
+            player (Player): The safe's owner.
+
+        Returns:
+            float: The capacity, or infinity if the scenario does not limit safes.
+        """
+        if not self.scenario.safe_capacity:
+            return math.inf
+        return self.scenario.safe_capacity + self.houses(player) * self.scenario.house_safe_capacity
+
+    def advance(self, rounds):
+        """
+        Records that rounds have been completed, without touching any balance.
+
+        Everything posted to the ledger so far is committed, as a completed round is never rolled back.
+
+        Args:
+            rounds (int): The number of completed rounds.
+        """
+        self.round = rounds
+        self.ledger.commit()
+
+    def accrue(self, player):
+        """
+        Brings a player's bank and safe up to date with the interest owed since they were last touched.
+
+        Args:
+            player (Player): The player to accrue interest for.
+        """
+        elapsed = self.round - self.touched.get(player.id, 0)
+        self.touched[player.id] = self.round
+        if elapsed <= 0:
+            return
+        bank_rate, safe_rate = self.bank_rate(player), self.safe_rate(player)
+        if bank_rate:
+            bank = self.ledger.balance(player)
+            self.ledger.pay(player, self.compound(bank, bank_rate, elapsed) - bank, "interest")
+        if safe_rate:
+            safe = self.ledger.balance(player, "safe")
+            # Interest stops once the safe is full, but a safe already over capacity keeps its contents
+            grown = max(min(self.compound(safe, safe_rate, elapsed), self.safe_capacity(player)), safe)
+            self.ledger.pay(player, grown - safe, "interest", "safe")
+
+    def accrue_all(self, players):
+        """
+        Brings every player up to date, e.g. before the final ranking.
+
+        Args:
+            players (list): The players to accrue interest for.
+        """
+        for player in players:
+            self.accrue(player)
@@ -0,0 +1,300 @@
+from .distribution import BankDistribution, action_effect, apply_effect, plan_spread
+from .game_logic import BankManagement
+from .game_play import GamePlay
+from .scenario import DEFAULT_SCENARIO
+from .simulation import SEARCH_KINDS
+
+# The actions a turn plan is built from; a steal always targets the player's rival
+PLAN_ACTIONS = (("work",), ("steal",), *(("search", kind) for kind in SEARCH_KINDS))
+
+def bucket(value):
+    """
+    Rounds a value to two significant figures, so nearby game states share a hint.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        float: The rounded value.
+    """
+    return float(f"{value:.2g}")
+
+def turn_plans(budget=GamePlay.TURN_LIMIT, actions=PLAN_ACTIONS):
+    """
+    Lists every distinct turn that fits in a turn budget, including ending it straight away.
+
+    The order of a turn's actions does not change what it pays, so each turn is listed
+    once, cheapest action first. That is also the order that fits the most actions in,
+    as another action can be taken whenever less than the budget has been used.
+
+    Args:
+        budget (int): The turn budget.
+        actions (iterable): The actions to choose from; each must cost something.
+
+    Returns:
+        list: Tuples of actions.
+    """
+    actions = sorted(actions, key=lambda action: GamePlay.ACTION_COSTS[action[0]])
+    plans = []
+
+    def extend(plan, first, used):
+        plans.append(plan)
+        if used >= budget:
+            return
+        for index in range(first, len(actions)):
+            extend(plan + (actions[index],), index, used + GamePlay.ACTION_COSTS[actions[index][0]])
+
+    extend((), 0, 0)
+    return plans
+
+def effect_mean(effect):
+    """
+    Returns the mean amount an effect from `action_effect` or `apply_effect` adds.
+
+    Args:
+        effect (tuple): The effect.
+
+    Returns:
+        float: The mean amount.
+    """
+    if effect[0] == "fixed":
+        return effect[1]
+    if effect[0] == "uniform":
+        return (effect[1] + effect[2]) / 2
+    if effect[0] == "chance":
+        return effect[1] * (effect[2] + effect[3]) / 2
+    return sum(amount * probability for amount, probability in effect[1])
+
+def describe_plan(plan):
+    """
+    Describes a turn plan for the advisor panel.
+
+    Args:
+        plan (tuple): The plan's actions, as HeadlessGame takes them.
+
+    Returns:
+        str: e.g. "Work, 2x Steal from #2".
+    """
+    names = []
+    for action in dict.fromkeys(plan):
+        if action[0] == "steal":
+            name = f"Steal from #{action[1]}"
+        elif action[0] == "search":
+            name = f"Search {action[1].title()}"
+        else:
+            name = action[0].title()
+        count = plan.count(action)
+        names.append(name if count == 1 else f"{count}x {name}")
+    return ", ".join(names) or "End Turn"
+
+class Advisor:
+    """
+    Suggests turn plans from each action's payout distribution and the current standings.
+
+    Every turn that fits in the turn budget is weighed against the player's rival (the
+    richest other player, whom any steal targets). The plan with the highest expected
+    gain is a small knapsack over the budget. The plan with the best chance to win is the
+    one that, repeated every remaining round, most often finishes above the rival, who is
+    assumed to gain their own best expected turn every round, with every bank taken as it
+    is now. That chance comes from the plan's exact gain distribution (see distribution.py),
+    in which a steal counts twice, as the rival loses what the player takes. Other players
+    and bank interest are left out.
+
+    Hints are memoised per state bucket (gap to the rival, incomes and banks rounded to
+    two significant figures) and rounds remaining. Gain distributions do not depend on
+    the player at all, only on the rival's bank when the plan steals, and the rival is
+    the same for nearly everyone, so even large games mostly hit the cache.
+
+    Attributes:
+        scenario (Scenario): The game parameters.
+        round_limit (int): The most rounds a hint looks ahead, which sets the grid step.
+        max_points (int): Roughly the most grid points in a gain distribution.
+        plans (list): Every turn plan, from `turn_plans`.
+        gains (dict): (plan, rival bank) mapped to the plan's effects and its gain distributions
+            after 0, 1, 2... rounds.
+        hints (dict): State buckets mapped to solved hints.
+    """
+
+    def __init__(self, scenario=None, round_limit=None, max_points=256):
+        """
+        Sets up an advisor for one scenario.
+
+        Args:
+            scenario (Scenario, optional): The game parameters.
+            round_limit (int, optional): The most rounds a hint looks ahead. Defaults to the longest round choice.
+            max_points (int): Roughly the most grid points in a gain distribution.
+        """
+        self.scenario = DEFAULT_SCENARIO if scenario is None else scenario
+        self.round_limit = max(self.scenario.round_choices) if round_limit is None else round_limit
+        self.max_points = max_points
+        self.plans = turn_plans()
+        self.gains = {}
+        self.hints = {}
+
+    def steal_effects(self, count, target_bank):
+        """
+        Describes a number of steals from the same player in a row.
+
+        Each steal is taken from the target's expected bank after the steals before it.
+        Steals that cannot succeed add nothing.
+
+        Args:
+            count (int): The number of steals.
+            target_bank (float): The target's bank before the first steal.
+
+        Returns:
+            list: A ("chance", probability, low, high) effect per steal that can succeed, for the
+            player's own bank.
+        """
+        chance = self.scenario.steal_success_chance
+        low, high = self.scenario.steal_fraction
+        effects = []
+        for _ in range(count if chance else 0):
+            amounts = sorted((low * target_bank, high * target_bank))
+            effects.append(("chance", chance, *amounts))
+            target_bank -= chance * (low + high) / 2 * target_bank
+        return effects
+
+    def plan_effects(self, plan, income, rival_bank):
+        """
+        Describes the amount each of a plan's actions adds to the player's bank.
+
+        Args:
+            plan (tuple): The plan's actions.
+            income (float): The player's job income.
+            rival_bank (float): The bank of the player the plan steals from.
+
+        Returns:
+            list: The effect of each action.
+        """
+        effects = [action_effect(action, self.scenario, income) for action in plan if action != ("steal",)]
+        return effects + self.steal_effects(plan.count(("steal",)), rival_bank)
+
+    def best_expected(self, income, rival_bank):
+        """
+        Finds the turn with the highest expected gain.
+
+        Args:
+            income (float): The player's job income.
+            rival_bank (float): The bank of the player any steal targets.
+
+        Returns:
+            tuple: The plan and its expected gain.
+        """
+        means = {plan: sum(map(effect_mean, self.plan_effects(plan, income, rival_bank))) for plan in self.plans}
+        best = max(self.plans, key=means.get)
+        return best, means[best]
+
+    def gain_distribution(self, plan, rival_bank, rounds):
+        """
+        Returns the distribution of how much a plan gains on the rival over some rounds.
+
+        Work is left out, as it shifts every outcome by the same amount.
+
+        Args:
+            plan (tuple): The plan's actions.
+            rival_bank (float): The rival's bank, which steals are taken from.
+            rounds (int): The number of rounds the plan is played.
+
+        Returns:
+            BankDistribution: The distribution of the gain.
+        """
+        steals = plan.count(("steal",))
+        key = (plan, rival_bank if steals else None)
+        cached = self.gains.get(key)
+        if cached is None:
+            # The rival loses whatever the player steals, so a steal gains on them twice
+            effects = [action_effect(action, self.scenario, 0.0) for action in plan if action[0] == "search"]
+            effects += [("chance", chance, 2 * low, 2 * high)
+                        for _, chance, low, high in self.steal_effects(steals, rival_bank)]
+            step = max(plan_spread(effects, self.round_limit, self.scenario) / self.max_points, 0.01)
+            cached = self.gains[key] = (effects, [BankDistribution.point(0.0, step)])
+        effects, distributions = cached
+        while len(distributions) <= rounds:
+            distribution = distributions[-1]
+            for effect in effects:
+                distribution = apply_effect(distribution, effect)
+            distributions.append(distribution)
+        return distributions[rounds]
+
+    def solve(self, gap, income, rival_bank, rival_income, rival_target, rounds):
+        """
+        Works out the hint for one state bucket.
+
+        Args:
+            gap (float): The player's bank minus the rival's.
+            income (float): The player's job income.
+            rival_bank (float): The rival's bank.
+            rival_income (float): The rival's job income.
+            rival_target (float): The bank of the player the rival would steal from.
+            rounds (int): The rounds remaining, including this one.
+
+        Returns:
+            dict: "Most Money" and "Best Chance", each a dictionary with the "Plan", its
+            expected "Gain" this turn and its "Win Chance".
+        """
+        rival_gain = self.best_expected(rival_income, rival_target)[1]
+        hints = {}
+        for plan in self.plans:
+            gain = sum(map(effect_mean, self.plan_effects(plan, income, rival_bank)))
+            shortfall = rounds * (rival_gain - plan.count(("work",)) * income) - gap
+            chance = 1.0 - self.gain_distribution(plan, rival_bank, rounds).cdf(shortfall)
+            hints[plan] = {"Plan": plan, "Gain": gain, "Win Chance": chance}
+        return {
+            "Most Money": max(hints.values(), key=lambda hint: hint["Gain"]),
+            # Chances that only differ by rounding are settled by the expected gain, then the shorter plan
+            "Best Chance": max(hints.values(), key=lambda hint: (round(hint["Win Chance"], 3), hint["Gain"],
+                                                                 -len(hint["Plan"])))
+        }
+
+    def advise(self, player, players, rounds):
+        """
+        Suggests a turn for a player from the current standings.
+
+        Args:
+            player (Player): The player whose turn it is.
+            players (list): Every player in the game.
+            rounds (int): The rounds remaining, including this one.
+
+        Returns:
+            dict: The "Rival" player and the "Most Money" and "Best Chance" hints, whose plans
+            are actions as HeadlessGame takes them, or None if there is no one to play against.
+        """
+        others = [other for other in players if other is not player]
+        if not others or rounds < 1:
+            return None
+        banks = {other.id: BankManagement.deformat_currency(other.bank) for other in players}
+        rival = max(others, key=lambda other: banks[other.id])
+        rival_target = max((banks[other.id] for other in players if other is not rival), default=0.0)
+        state = (bucket(banks[player.id] - banks[rival.id]), bucket(player.job_income), bucket(banks[rival.id]),
+                 bucket(rival.job_income), bucket(rival_target), min(rounds, self.round_limit))
+        solved = self.hints.get(state)
+        if solved is None:
+            solved = self.hints[state] = self.solve(*state)
+        advice = {"Rival": rival}
+        for name, hint in solved.items():
+            plan = tuple(("steal", rival.id) if action == ("steal",) else action for action in hint["Plan"])
+            advice[name] = {**hint, "Plan": plan}
+        return advice
+
+def format_advice(advice, rounds):
+    """
+    Lays out a hint from `Advisor.advise` for the advisor panel.
+
+    Args:
+        advice (dict): The hint.
+        rounds (int): The rounds remaining, including this one.
+
+    Returns:
+        list: The panel's lines.
+    """
+    if advice is None:
+        return ["No one to play against."]
+    rival = advice["Rival"]
+    lines = [f"Rival: #{rival.id} {rival.name}, {rounds} round(s) left"]
+    for name in ("Most Money", "Best Chance"):
+        hint = advice[name]
+        lines.append(f"{name}: {describe_plan(hint['Plan'])}")
+        lines.append(f"   {BankManagement.format_currency(hint['Gain'])} expected, "
+                     f"{hint['Win Chance']:.0%} to beat #{rival.id}")
+    return lines
@@ -0,0 +1,166 @@
+import json
+import threading
+from collections import OrderedDict, deque
+
+class Subscription:
+    """
+    One subscriber's bounded queue of serialised events.
+
+    Publishing never blocks: when the queue is full the subscription's policy decides
+    what gives way.
+
+    - "drop_oldest": the oldest queued event is discarded.
+    - "drop_newest": the incoming event is discarded.
+    - "coalesce": an event replaces any queued event with the same key (event type
+      and player), so a lagging viewer only sees the latest state of each; if the
+      queue is still full the oldest event is discarded.
+
+    Attributes:
+        maxsize (int): The most events held at once.
+        policy (str): The overflow policy.
+        dropped (int): How many events this subscriber has lost to the policy.
+    """
+
+    POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+    def __init__(self, maxsize=256, policy="drop_oldest"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}. Choose from {', '.join(self.POLICIES)}.")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self.condition = threading.Condition()
+        self.queue = OrderedDict() if policy == "coalesce" else deque()
+
+    def offer(self, key, data):
+        """
+        Queues a serialised event without blocking.
+
+        Args:
+            key (tuple): The coalescing key of the event.
+            data (bytes): The serialised event.
+        """
+        with self.condition:
+            if self.closed:
+                return
+            if self.policy == "coalesce":
+                if key in self.queue:
+                    del self.queue[key]
+                    self.dropped += 1
+                elif len(self.queue) >= self.maxsize:
+                    self.queue.popitem(last=False)
+                    self.dropped += 1
+                self.queue[key] = data
+            elif len(self.queue) >= self.maxsize:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return
+                self.queue.popleft()
+                self.queue.append(data)
+            else:
+                self.queue.append(data)
+            self.condition.notify()
+
+    def get(self, timeout=None):
+        """
+        Waits for the next event.
+
+        Args:
+            timeout (float, optional): The most seconds to wait.
+
+        Returns:
+            bytes: The next serialised event, or None on timeout or once closed.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.queue or self.closed, timeout):
+                return None
+            if not self.queue:
+                return None
+            if self.policy == "coalesce":
+                return self.queue.popitem(last=False)[1]
+            return self.queue.popleft()
+
+    def drain(self):
+        """
+        Takes every queued event at once.
+
+        Returns:
+            list: The serialised events, oldest first.
+        """
+        with self.condition:
+            events = list(self.queue.values()) if self.policy == "coalesce" else list(self.queue)
+            self.queue.clear()
+            return events
+
+    def close(self):
+        """
+        Stops accepting events and wakes any waiting reader.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+class Broadcaster:
+    """
+    Fans game events out to many subscribers.
+
+    Each event is serialised to JSON once and the same bytes are offered to every
+    subscriber. The subscriber list is copied on subscribe/unsubscribe so publishing
+    never takes the broadcaster's lock. A Broadcaster can be passed straight to
+    GamePlay or HeadlessGame as their `on_event` callback.
+
+    Attributes:
+        sequence (int): The number of events published so far.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = ()
+        self.sequence = 0
+
+    def subscribe(self, maxsize=256, policy="drop_oldest"):
+        """
+        Adds a subscriber.
+
+        Args:
+            maxsize (int): The most events the subscriber may have queued.
+            policy (str): What gives way when the queue is full (see Subscription).
+
+        Returns:
+            Subscription: The new subscription.
+        """
+        subscription = Subscription(maxsize, policy)
+        with self.lock:
+            self.subscribers = self.subscribers + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Removes a subscriber and closes its queue.
+
+        Args:
+            subscription (Subscription): The subscription to remove.
+        """
+        with self.lock:
+            self.subscribers = tuple(other for other in self.subscribers if other is not subscription)
+        subscription.close()
+
+    def publish(self, event_type, payload):
+        """
+        Serialises an event once and offers it to every subscriber.
+
+        Args:
+            event_type (str): The type of event, e.g. "turn_start".
+            payload (dict): The event's JSON-serialisable details.
+        """
+        self.sequence += 1
+        data = json.dumps({"type": event_type, "seq": self.sequence, **payload}, separators=(",", ":")).encode("utf-8")
+        key = (event_type, payload.get("player"))
+        for subscription in self.subscribers:
+            subscription.offer(key, data)
+
+    def __call__(self, event_type, payload):
+        self.publish(event_type, payload)
@@ -0,0 +1,319 @@
+import itertools
+import json
+import multiprocessing
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from .long_horizon import LongHorizonGame
+from .scenario import DEFAULT_SCENARIO, compile_scenario
+from .simulation import Aggregate, HeadlessGame, run_batch, split_seeds
+from .simultaneous import SimultaneousGame
+
+GAME_CLASSES = {
+    "headless": HeadlessGame,
+    "simultaneous": SimultaneousGame,
+    "long_horizon": LongHorizonGame
+}
+
+MESSAGE_HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 64 << 20
+
+def send_message(file, data):
+    """
+    Writes one length-prefixed JSON message.
+
+    Args:
+        file (BinaryIO): The socket file to write to.
+        data (dict): The message.
+    """
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    file.write(MESSAGE_HEADER.pack(len(body)) + body)
+    file.flush()
+
+def receive_message(file):
+    """
+    Reads one length-prefixed JSON message.
+
+    Args:
+        file (BinaryIO): The socket file to read from.
+
+    Returns:
+        dict: The message, or None if the connection was closed.
+
+    Raises:
+        ValueError: If the message is too large or not a JSON object.
+    """
+    header = file.read(MESSAGE_HEADER.size)
+    if len(header) < MESSAGE_HEADER.size:
+        return None
+    (size,) = MESSAGE_HEADER.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message of {size} bytes is too large.")
+    body = file.read(size)
+    if len(body) < size:
+        return None
+    message = json.loads(body)
+    if not isinstance(message, dict):
+        raise ValueError("Messages must be JSON objects.")
+    return message
+
+class Coordinator(socketserver.ThreadingTCPServer):
+    """
+    Hands out a simulation's seed range to workers over TCP and merges their aggregates.
+
+    The seed range is split into chunks that are leased to workers one at a time.
+    A lease goes back to the front of the queue if its worker disconnects, or if it
+    has not been returned within `lease_timeout` seconds, so a lost or stalled worker
+    only delays its own chunk. Games are deterministic, so when a chunk ends up being
+    played twice, the first result to come back is merged and the other is ignored.
+
+    The protocol is a series of length-prefixed JSON messages, each answered by one reply:
+        {"type": "hello"}                                   -> {"type": "job", ...game parameters}
+        {"type": "lease"}                                   -> a lease, "wait" or "done"
+        {"type": "result", "lease", "start", "stop", "aggregate"} -> a lease, "wait" or "done"
+    where a lease is {"type": "lease", "lease": id, "start": seed, "stop": seed} and "wait"
+    asks the worker to ask again after {"seconds"} while the last chunks are being played.
+
+    Attributes:
+        job (dict): The game parameters sent to every worker.
+        aggregate (Aggregate): The results merged so far.
+        pending (deque): (start, stop) chunks waiting for a worker.
+        active (dict): Lease IDs mapped to their (start, stop) chunk and deadline.
+        remaining (set): The (start, stop) chunks whose results have not come back yet.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    WAIT_SECONDS = 0.2
+
+    def __init__(self, address, seed_start, seed_stop, player_count=4, round_limit=None, strategies=("random",),
+                 scenario=DEFAULT_SCENARIO, game_class="headless", chunk_size=200, lease_timeout=300.0):
+        """
+        Sets up a coordinator for one simulation.
+
+        Args:
+            address (tuple): The (host, port) to listen on; port 0 picks a free port.
+            seed_start (int): The first seed (inclusive).
+            seed_stop (int): The last seed (exclusive).
+            player_count (int): The number of players per game.
+            round_limit (int, optional): The number of rounds per game.
+            strategies (iterable): Strategy names assigned to players in turn.
+            scenario (Scenario): The game parameters.
+            game_class (str): A key of GAME_CLASSES.
+            chunk_size (int): The number of seeds in each lease.
+            lease_timeout (float): Seconds before an unreturned lease is handed to another worker.
+        """
+        super().__init__(address, CoordinatorHandler)
+        self.job = {
+            "type": "job",
+            "scenario": scenario.to_dict(),
+            "player_count": player_count,
+            "round_limit": round_limit,
+            "strategies": list(strategies),
+            "game_class": game_class
+        }
+        self.lease_timeout = lease_timeout
+        self.aggregate = Aggregate()
+        chunks = split_seeds(seed_start, seed_stop, -(-(seed_stop - seed_start) // max(1, chunk_size)))
+        self.pending = deque(chunks)
+        self.active = {}
+        self.remaining = set(chunks)
+        self.lease_ids = itertools.count(1)
+        self.condition = threading.Condition()
+
+    def lease(self):
+        """
+        Leases the next chunk, first putting any expired leases back in the queue.
+
+        Returns:
+            dict: The reply to send the worker.
+        """
+        with self.condition:
+            now = time.monotonic()
+            for lease_id, (chunk, deadline) in list(self.active.items()):
+                if deadline < now:
+                    del self.active[lease_id]
+                    if chunk in self.remaining:
+                        self.pending.appendleft(chunk)
+            while self.pending and self.pending[0] not in self.remaining:
+                self.pending.popleft()
+            if self.pending:
+                chunk = self.pending.popleft()
+                lease_id = next(self.lease_ids)
+                self.active[lease_id] = (chunk, now + self.lease_timeout)
+                return {"type": "lease", "lease": lease_id, "start": chunk[0], "stop": chunk[1]}
+            if self.remaining:
+                return {"type": "wait", "seconds": self.WAIT_SECONDS}
+            return {"type": "done"}
+
+    def complete(self, lease_id, chunk, aggregate):
+        """
+        Merges a returned chunk, unless another worker has already returned it.
+
+        Args:
+            lease_id (int): The lease the chunk was played under.
+            chunk (tuple): The (start, stop) seeds played.
+            aggregate (Aggregate): The chunk's results.
+        """
+        with self.condition:
+            self.active.pop(lease_id, None)
+            if chunk in self.remaining:
+                self.remaining.discard(chunk)
+                self.aggregate.merge(aggregate)
+                if not self.remaining:
+                    self.condition.notify_all()
+
+    def release(self, lease_id):
+        """
+        Puts a lease back at the front of the queue, e.g. when its worker disconnects.
+
+        Args:
+            lease_id (int): The lease to give up.
+        """
+        with self.condition:
+            leased = self.active.pop(lease_id, None)
+            if leased is not None and leased[0] in self.remaining:
+                self.pending.appendleft(leased[0])
+
+    def wait(self, timeout=None):
+        """
+        Blocks until every chunk has come back.
+
+        Args:
+            timeout (float, optional): The most seconds to wait.
+
+        Returns:
+            Aggregate: The merged results, or None if the timeout passed first.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: not self.remaining, timeout):
+                return None
+            return self.aggregate
+
+class CoordinatorHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one worker's connection to a Coordinator.
+    """
+
+    def handle(self):
+        coordinator = self.server
+        held = None
+        try:
+            while True:
+                message = receive_message(self.rfile)
+                if message is None:
+                    break
+                kind = message.get("type")
+                if kind == "hello":
+                    send_message(self.wfile, coordinator.job)
+                    continue
+                if kind == "result":
+                    coordinator.complete(message["lease"], (message["start"], message["stop"]),
+                                         Aggregate.from_dict(message["aggregate"]))
+                    held = None
+                elif kind != "lease":
+                    break
+                reply = coordinator.lease()
+                held = reply.get("lease")
+                send_message(self.wfile, reply)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        finally:
+            if held is not None:
+                coordinator.release(held)
+
+def work(host, port, connect_timeout=10.0):
+    """
+    Plays leased chunks for a coordinator until it has nothing left.
+
+    Args:
+        host (str): The coordinator's address.
+        port (int): The coordinator's port.
+        connect_timeout (float): Seconds to wait for the connection.
+
+    Returns:
+        int: The number of chunks played.
+    """
+    with socket.create_connection((host, port), timeout=connect_timeout) as connection:
+        connection.settimeout(None)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        file = connection.makefile("rwb")
+        send_message(file, {"type": "hello"})
+        job = receive_message(file)
+        scenario = compile_scenario(job["scenario"])
+        game_class = GAME_CLASSES[job["game_class"]]
+        strategies = tuple(job["strategies"])
+        request = {"type": "lease"}
+        played = 0
+        while True:
+            send_message(file, request)
+            reply = receive_message(file)
+            if reply is None or reply["type"] == "done":
+                return played
+            if reply["type"] == "wait":
+                time.sleep(reply["seconds"])
+                request = {"type": "lease"}
+                continue
+            aggregate = run_batch(scenario, reply["start"], reply["stop"], job["player_count"], job["round_limit"],
+                                  strategies, game_class)
+            request = {"type": "result", "lease": reply["lease"], "start": reply["start"], "stop": reply["stop"],
+                       "aggregate": aggregate.to_dict()}
+            played += 1
+
+def start_local_workers(host, port, count):
+    """
+    Starts worker processes on this machine, e.g. to test a coordinator on loopback.
+
+    Args:
+        host (str): The coordinator's address.
+        port (int): The coordinator's port.
+        count (int): The number of workers.
+
+    Returns:
+        list: The started Process instances.
+    """
+    processes = [multiprocessing.Process(target=work, args=(host, port), daemon=True) for _ in range(count)]
+    for process in processes:
+        process.start()
+    return processes
+
+def run_cluster(seed_start, seed_stop, player_count=4, round_limit=None, strategies=("random",),
+                scenario=DEFAULT_SCENARIO, game_class="headless", host="127.0.0.1", port=0, local_workers=0,
+                chunk_size=200, lease_timeout=300.0, on_listen=None):
+    """
+    Coordinates a simulation until every chunk is played, optionally with local workers.
+
+    Args:
+        seed_start (int): The first seed (inclusive).
+        seed_stop (int): The last seed (exclusive).
+        player_count (int): The number of players per game.
+        round_limit (int, optional): The number of rounds per game.
+        strategies (iterable): Strategy names assigned to players in turn.
+        scenario (Scenario): The game parameters.
+        game_class (str): A key of GAME_CLASSES.
+        host (str): The address to listen on.
+        port (int): The port to listen on; 0 picks a free port.
+        local_workers (int): The number of worker processes to start on this machine.
+        chunk_size (int): The number of seeds in each lease.
+        lease_timeout (float): Seconds before an unreturned lease is handed to another worker.
+        on_listen (callable, optional): Called with the (host, port) being listened on.
+
+    Returns:
+        Aggregate: The merged results.
+    """
+    with Coordinator((host, port), seed_start, seed_stop, player_count, round_limit, strategies, scenario,
+                     game_class, chunk_size, lease_timeout) as coordinator:
+        host, port = coordinator.server_address[:2]
+        if on_listen is not None:
+            on_listen((host, port))
+        threading.Thread(target=coordinator.serve_forever, daemon=True).start()
+        processes = start_local_workers(host, port, local_workers)
+        try:
+            return coordinator.wait()
+        finally:
+            coordinator.shutdown()
+            for process in processes:
+                process.join(timeout=5)
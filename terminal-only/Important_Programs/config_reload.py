@@ -0,0 +1,147 @@
+import os
+import threading
+from .scenario import load_scenario
+from .ulits import log
+
+class ScenarioWatcher:
+    """
+    Watches a scenario file and reloads it while games are being played.
+
+    A background thread checks the file's modification time and size every `interval`
+    seconds. When either changes, it compiles a new immutable Scenario with load_scenario
+    and leaves it pending. A file that fails to load for any reason (e.g. a half-written
+    edit or an invalid jobs table) is logged and changes nothing; the thread keeps
+    watching and the next edit is tried again.
+
+    The live snapshot is a (version, Scenario) pair held in one attribute, so reading it
+    takes no lock and always sees a version and scenario that belong together. `swap`
+    makes the pending snapshot live with a single assignment. The terminal game calls it
+    between games only, while the API server also calls it from `round_boundary`, as its
+    games' event callback, so a long-running server picks up edits without waiting for a
+    game to end. Games keep the Scenario they were created with, as GameLogic holds it,
+    so a running game never sees a change.
+
+    Attributes:
+        path (str): The scenario file.
+        interval (float): The seconds between checks of the file.
+        live (tuple): The live (version, Scenario) pair.
+        pending (tuple): The latest (version, Scenario) pair loaded; the same object as
+            `live` once swapped in.
+    """
+
+    def __init__(self, path, interval=1.0):
+        """
+        Loads a scenario file to watch.
+
+        Args:
+            path (str): The path of a .toml or .json scenario file.
+            interval (float): The seconds between checks of the file.
+
+        Raises:
+            ValueError: If the file type is not supported or the scenario is invalid.
+        """
+        self.path = path
+        self.interval = interval
+        self.stamp = self.file_stamp()
+        self.live = self.pending = (1, load_scenario(path))
+        # Only swaps take this lock; reading the live snapshot never does
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    @property
+    def current(self):
+        """
+        Scenario: The live snapshot, which new games should be created with.
+        """
+        return self.live[1]
+
+    @property
+    def version(self):
+        """
+        int: The version of the live snapshot, counting up from 1 with every reload.
+        """
+        return self.live[0]
+
+    def file_stamp(self):
+        """
+        Returns:
+            tuple: The file's modification time and size, or None if it cannot be read right now.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self):
+        """
+        Loads the file again if it changed since the last check.
+
+        Returns:
+            bool: Whether a new snapshot is now pending.
+        """
+        stamp = self.file_stamp()
+        if stamp is None or stamp == self.stamp:
+            return False
+        self.stamp = stamp
+        try:
+            scenario = load_scenario(self.path)
+        # Anything a half-written file raises must not end the watching thread
+        except Exception as error:
+            log(f"Kept scenario version {self.pending[0]}; {self.path} could not be loaded: {error}")
+            return False
+        self.pending = (self.pending[0] + 1, scenario)
+        log(f"Loaded scenario version {self.pending[0]} from {self.path}; it goes live at the next round boundary.")
+        return True
+
+    def swap(self):
+        """
+        Makes the latest loaded snapshot live, if there is a newer one.
+
+        Returns:
+            Scenario: The live snapshot.
+        """
+        if self.pending is not self.live:
+            with self.lock:
+                if self.pending[0] > self.live[0]:
+                    self.live = self.pending
+        return self.live[1]
+
+    def round_boundary(self, event_type, payload):
+        """
+        Swaps in the latest snapshot whenever a round or game ends; usable as a game's `on_event`.
+        """
+        if event_type in ("round_complete", "game_over"):
+            self.swap()
+
+    def watch(self):
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def start(self):
+        """
+        Starts checking the file in a background thread.
+
+        Returns:
+            ScenarioWatcher: The watcher itself.
+        """
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.watch, name="scenario-watcher", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops checking the file.
+        """
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,346 @@
+import curses
+import random
+from collections import deque
+from .advisor import Advisor, format_advice
+from .game_logic import BankManagement
+from .registry import ACTIONS
+from .simulation import SEARCH_KINDS, HeadlessGame
+
+class Panel:
+    """
+    A bordered region of the screen that only repaints the lines that changed.
+
+    Attributes:
+        title (str): The title drawn on the border.
+        lines (list): The lines currently on screen.
+    """
+
+    def __init__(self, title, height, width, top, left):
+        self.title = title
+        self.window = curses.newwin(height, width, top, left)
+        self.lines = []
+        self.window.border()
+        self.window.addnstr(0, 2, f" {title} ", max(0, width - 4))
+        self.window.noutrefresh()
+
+    @property
+    def capacity(self):
+        height, _ = self.window.getmaxyx()
+        return height - 2
+
+    def update(self, lines):
+        """
+        Draws new content, touching only the rows that differ from what is on screen.
+
+        Args:
+            lines (list): The lines to show; extra lines are cut off.
+        """
+        height, width = self.window.getmaxyx()
+        lines = [line[:width - 2] for line in lines[:height - 2]]
+        if lines == self.lines:
+            return
+        for row in range(max(len(lines), len(self.lines))):
+            new = lines[row] if row < len(lines) else ""
+            old = self.lines[row] if row < len(self.lines) else ""
+            if new != old:
+                self.window.move(row + 1, 1)
+                self.window.addstr(new.ljust(width - 2))
+        self.lines = lines
+        self.window.noutrefresh()
+
+class Dashboard:
+    """
+    A full-screen curses front end for hot-seat games.
+
+    The screen is split into panels for the action menu, player profiles, live
+    standings, the current player's inventory and the event log, plus the strategy
+    advisor's hint below the standings when an Advisor is given. Game state comes
+    from a HeadlessGame and the event log is fed by its `on_event` callback; every
+    redraw only repaints changed panel lines and flushes them with a single
+    `curses.doupdate`.
+
+    The action menu is built from the action registry, like the terminal's, so plugin
+    actions show up too. Player descriptions are left out, as the Players panel always
+    shows them.
+    """
+
+    # Menu keys in order; "0" backs out of a prompt and "q" quits, so neither is used
+    MENU_KEYS = "123456789abcdefghijklmnoprstuvwxyz"
+    # Menu actions left out of the dashboard's menu
+    SKIPPED_ACTIONS = ("description",)
+
+    def __init__(self, screen, game, advisor=None):
+        self.screen = screen
+        self.game = game
+        self.advisor = advisor
+        self.events = deque(maxlen=200)
+        self.prompt = ""
+        game.on_event = self.record_event
+
+        curses.curs_set(0)
+        rows, columns = screen.getmaxyx()
+        if rows < 20 or columns < 70:
+            raise ValueError("The dashboard needs a terminal of at least 70x20.")
+        side = 30
+        middle = columns - 2 * side
+        upper = rows - 10
+        self.menu = Panel("Actions", upper // 2, side, 0, 0)
+        self.inventory = Panel("Inventory", upper - upper // 2, side, upper // 2, 0)
+        self.profiles = Panel("Players", upper, middle, 0, side)
+        if advisor is None:
+            self.standings = Panel("Standings", upper, side, 0, side + middle)
+            self.advice = None
+        else:
+            self.standings = Panel("Standings", upper // 2, side, 0, side + middle)
+            self.advice = Panel("Advisor", upper - upper // 2, side, upper // 2, side + middle)
+        self.log = Panel("Event Log", rows - upper, columns, upper, 0)
+        screen.noutrefresh()
+
+    def record_event(self, event_type, payload):
+        """
+        Turns a game event into an event log line.
+        """
+        names = {player.id: player.name for player in self.game.players}
+        if event_type == "turn_start":
+            line = f"Round {payload['round']}: {names[payload['player']]}'s turn."
+        elif event_type == "action":
+            line = f"{names[payload['player']]} used {payload['action']}"
+            if "amount" in payload:
+                line += f" ({BankManagement.format_currency(payload['amount'])})"
+            if "target" in payload:
+                line += f" on {names[payload['target']]}"
+            if "item" in payload and payload["item"]:
+                line += f" [{payload['item']}]"
+            line += f", bank {BankManagement.format_currency(payload['bank'])}."
+        elif event_type == "round_complete":
+            line = f"Round {payload['round']} completed."
+        else:
+            line = f"Game Over! The winner is {payload['rankings'][0]['name']}."
+        self.events.append(line)
+
+    def redraw(self):
+        """
+        Refreshes every panel from the game state and flushes the changes to the terminal.
+        """
+        game = self.game
+        player = game.current_player
+        header = "Game over" if player is None else (
+            f"Round {game.rounds + 1}/{game.round_limit} - Player #{player.id}, "
+            f"turn {game.turn_used}/{game.TURN_LIMIT}")
+        menu = [f"{key}. {entry.label}" for key, entry in self.actions().items()]
+        self.menu.update([header, ""] + menu + ["q. Quit", "", self.prompt])
+
+        self.inventory.update(
+            [f"{index}. {item.name}" for index, item in enumerate(player.inventory, start=1)] or ["(empty)"]
+            if player else [])
+
+        profiles = []
+        for other in game.players:
+            profile = other.leaked_profile() if other is player else other.normal_profile()
+            profiles.append(f"#{profile['ID']} {profile['Name']} ({profile['Age']}) - {profile['Job Title']}")
+            if other is player:
+                profiles.append(f"   Income {BankManagement.format_currency(profile['Job Income'])}, "
+                                f"Bank {BankManagement.format_currency(profile['Bank'])}, "
+                                f"Safe {BankManagement.format_currency(profile['Safe'])}")
+        self.profiles.update(profiles)
+
+        ranked = sorted(game.players, key=lambda other: BankManagement.deformat_currency(other.bank), reverse=True)
+        self.standings.update([f"{rank}. #{other.id} {BankManagement.format_currency(other.bank)}"
+                               for rank, other in enumerate(ranked, start=1)])
+
+        if self.advice is not None:
+            rounds = game.round_limit - game.rounds
+            self.advice.update(format_advice(self.advisor.advise(player, game.players, rounds), rounds)
+                               if player else [])
+
+        self.log.update(list(self.events)[-self.log.capacity:])
+        curses.doupdate()
+
+    def ask(self, prompt, valid):
+        """
+        Shows a prompt in the menu panel and waits for one of the valid keys.
+
+        Args:
+            prompt (str): The prompt.
+            valid (iterable): The keys that can be chosen, or None to accept any key.
+
+        Returns:
+            str: The key pressed, or None if the player pressed Escape or 0.
+        """
+        valid = None if valid is None else set(valid)
+        self.prompt = prompt
+        self.redraw()
+        while True:
+            key = self.screen.getkey()
+            if valid is None:
+                choice = key
+                break
+            if key in ("\x1b", "0"):
+                choice = None
+                break
+            if key in valid:
+                choice = key
+                break
+        self.prompt = ""
+        return choice
+
+    def ask_number(self, prompt, choices):
+        """
+        Shows a prompt in the menu panel and reads one of the valid numbers, which may have several digits.
+
+        A number is taken as soon as no other choice starts with it, so one key is enough
+        while there are fewer than ten choices; otherwise it is confirmed with Enter.
+
+        Args:
+            prompt (str): The prompt.
+            choices (iterable): The numbers that can be chosen.
+
+        Returns:
+            int: The number chosen, or None if the player pressed Escape or entered nothing or 0.
+        """
+        valid = {str(choice) for choice in choices}
+        typed = ""
+        choice = None
+        while True:
+            self.prompt = f"{prompt} {typed}"
+            self.redraw()
+            key = self.screen.getkey()
+            if key == "\x1b":
+                break
+            if key in ("\n", "\r", "KEY_ENTER"):
+                if typed in valid:
+                    choice = int(typed)
+                    break
+                if typed.strip("0") == "":
+                    break
+                typed = ""
+            elif key in ("KEY_BACKSPACE", "\x7f", "\b"):
+                typed = typed[:-1]
+            elif key.isdigit() and len(key) == 1:
+                typed += key
+                if typed == "0":
+                    break
+                starting = [other for other in valid if other.startswith(typed)]
+                if not starting:
+                    # Keys that cannot lead to a valid number are ignored
+                    typed = typed[:-1]
+                elif starting == [typed]:
+                    choice = int(typed)
+                    break
+        self.prompt = ""
+        return choice
+
+    def actions(self):
+        """
+        Lists the menu's actions from the action registry.
+
+        Returns:
+            dict: Menu keys mapped to action entries, in menu order.
+        """
+        entries = [entry for entry in ACTIONS.menu() if entry.name not in self.SKIPPED_ACTIONS]
+        return dict(zip(self.MENU_KEYS, entries))
+
+    def choose_action(self):
+        """
+        Reads the current player's next action from the keyboard.
+
+        Actions that need arguments ask for them; any other action that can be played
+        headless, e.g. from a plugin, is taken as it is.
+
+        Returns:
+            tuple: The action, None to quit, or an empty tuple if the player backed out.
+        """
+        actions = self.actions()
+        key = self.ask("Choose an action:", [*actions, "q"])
+        if key is None:
+            return ()
+        if key == "q":
+            return None
+        name = actions[key].name
+        handler = getattr(self, f"choose_{name}", None)
+        if handler is not None:
+            return handler()
+        # Loads the plugin behind the entry, if it has not been used yet
+        entry = ACTIONS.get(name)
+        if entry is None or not hasattr(entry, "resolve") or entry.arity:
+            self.events.append(f"{actions[key].label} cannot be played from the dashboard.")
+            return ()
+        return (name,)
+
+    def choose_steal(self):
+        game = self.game
+        targets = [other.id for other in game.players if other is not game.current_player]
+        target = self.ask_number("Steal from which player #?", targets)
+        return ("steal", target) if target else ()
+
+    def choose_search(self):
+        kind = self.ask("Search: t)reasure l)ottery s)tocks", "tls")
+        return ("search", SEARCH_KINDS["tls".index(kind)]) if kind else ()
+
+    def choose_use(self):
+        inventory = self.game.current_player.inventory
+        if not inventory:
+            self.events.append("You have no items in your inventory.")
+            return ()
+        if len(inventory) > self.inventory.capacity:
+            self.events.extend(f"Item {index}. {item.name}" for index, item in enumerate(inventory, start=1))
+        slot = self.ask_number(f"Use which item? (1-{len(inventory)})", range(1, len(inventory) + 1))
+        return ("use", slot - 1) if slot else ()
+
+    def choose_buy(self):
+        items = self.game.gamelogic.market.items
+        self.events.extend(f"Shop {index}. {item.name} - {BankManagement.format_currency(item.price)}"
+                           for index, item in enumerate(items, start=1))
+        slot = self.ask_number(f"Buy which item? (1-{len(items)})", range(1, len(items) + 1))
+        return ("buy", slot - 1) if slot else ()
+
+    def choose_advice(self):
+        # Asking for advice takes no action; the hint goes to the event log
+        game = self.game
+        if self.advisor is None:
+            self.advisor = Advisor(game.gamelogic.scenario, game.round_limit)
+        rounds = game.round_limit - game.rounds
+        self.events.extend(format_advice(self.advisor.advise(game.current_player, game.players, rounds), rounds))
+        return ()
+
+    def run(self):
+        """
+        Plays the game until it finishes or a player quits.
+        """
+        while not self.game.finished:
+            action = self.choose_action()
+            if action is None:
+                return
+            if action:
+                try:
+                    self.game.apply(action)
+                except ValueError as error:
+                    self.events.append(str(error))
+        self.ask("Game over! Press any key to exit.", None)
+
+def run_dashboard(player_count, round_limit, scenario=None, seed=None, advisor=None, memory_report=None):
+    """
+    Plays a hot-seat game in the curses dashboard.
+
+    Args:
+        player_count (int): The number of players.
+        round_limit (int): The number of rounds.
+        scenario (Scenario, optional): The game parameters.
+        seed (int, optional): The seed of the game.
+        advisor (Advisor, optional): Shows its hints in an advisor panel.
+        memory_report (MemoryReport, optional): Measures the game at every round boundary.
+
+    Returns:
+        HeadlessGame: The game that was played.
+    """
+    game = HeadlessGame(random.randrange(2 ** 63) if seed is None else seed, player_count, round_limit, scenario)
+
+    def play(screen):
+        dashboard = Dashboard(screen, game, advisor)
+        # Watched after the dashboard has taken the event callback, so the event log still fills
+        if memory_report is not None:
+            memory_report.watch(game)
+        dashboard.run()
+
+    curses.wrapper(play)
+    return game
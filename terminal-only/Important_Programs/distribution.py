@@ -0,0 +1,429 @@
+import math
+from collections import defaultdict
+from .game_play import GamePlay
+from .scenario import DEFAULT_SCENARIO
+
+# The turn each fixed-plan strategy plays every round
+STRATEGY_PLANS = {
+    "worker": (("work",), ("work",)),
+    "treasure": (("search", "treasure"),),
+    "gambler": (("search", "lottery ticket"),),
+    "investor": (("search", "stocks"),)
+}
+
+def _split(amount, step):
+    # Places an amount between the two grid points around it, keeping its mean
+    position = amount / step
+    low = math.floor(position)
+    upper = position - low
+    return low, 1.0 - upper, upper
+
+class BankDistribution:
+    """
+    The probability distribution of a bank balance over a grid of evenly spaced values.
+
+    The value of grid point k is k * step. An amount that falls between two grid points
+    is shared between them in proportion to how close it is, so every operation keeps
+    the distribution's total probability and its mean exact; only the shape is rounded
+    to the grid.
+
+    Attributes:
+        step (float): The distance between grid points.
+        start (int): The grid index of the first probability.
+        probabilities (list): The probability of each grid point from `start` on.
+    """
+
+    def __init__(self, step, start, probabilities):
+        self.step = step
+        self.start = start
+        self.probabilities = probabilities
+
+    @classmethod
+    def point(cls, value, step):
+        """
+        Creates a distribution holding a single value.
+
+        Args:
+            value (float): The value.
+            step (float): The grid step.
+
+        Returns:
+            BankDistribution: The distribution.
+        """
+        low, lower, upper = _split(value, step)
+        return cls(step, low, [lower, upper]).trimmed()
+
+    def trimmed(self):
+        """
+        Drops the zero probabilities at either end of the grid.
+
+        Returns:
+            BankDistribution: The trimmed distribution.
+        """
+        probabilities = self.probabilities
+        first = next((index for index, probability in enumerate(probabilities) if probability > 0), 0)
+        last = next((index for index in range(len(probabilities) - 1, -1, -1) if probabilities[index] > 0), 0)
+        return BankDistribution(self.step, self.start + first, probabilities[first:last + 1])
+
+    def plus_outcomes(self, outcomes):
+        """
+        Adds a discrete random amount.
+
+        Args:
+            outcomes (iterable): (amount, probability) pairs.
+
+        Returns:
+            BankDistribution: The distribution of the sum.
+        """
+        kernel = defaultdict(float)
+        for amount, probability in outcomes:
+            low, lower, upper = _split(amount, self.step)
+            kernel[low] += probability * lower
+            kernel[low + 1] += probability * upper
+        lowest = min(kernel)
+        size = len(self.probabilities)
+        result = [0.0] * (size + max(kernel) - lowest)
+        for offset, weight in kernel.items():
+            if weight:
+                base = offset - lowest
+                result[base:base + size] = [total + weight * probability for total, probability
+                                            in zip(result[base:base + size], self.probabilities)]
+        return BankDistribution(self.step, self.start + lowest, result).trimmed()
+
+    def plus_uniform(self, low, high):
+        """
+        Adds an amount drawn uniformly between two bounds.
+
+        The grid cells (one step wide, centred on each grid point) that the uniform covers
+        fully get an equal share of its probability and are summed with running totals, so
+        the cost does not depend on how wide the uniform is. The two partly covered cells
+        at its ends are placed at their own means, which keeps the mean exact.
+
+        Args:
+            low (float): The lowest amount.
+            high (float): The highest amount.
+
+        Returns:
+            BankDistribution: The distribution of the sum.
+        """
+        step = self.step
+        first = math.floor(low / step + 0.5)
+        last = math.floor(high / step + 0.5)
+        if last - first < 2:
+            return self.plus_outcomes([((low + high) / 2, 1.0)])
+        width = high - low
+        first_edge, last_edge = (first + 0.5) * step, (last - 0.5) * step
+        ends = self.plus_outcomes([((low + first_edge) / 2, (first_edge - low) / width),
+                                   ((last_edge + high) / 2, (high - last_edge) / width)])
+        # Cells first + 1 to last - 1 are covered fully
+        middle_mass = step / width
+        span = last - first - 2
+        probabilities = self.probabilities
+        size = len(probabilities)
+        totals = self.totals()
+        middle = [middle_mass * (totals[min(index + 1, size)] - totals[max(index - span, 0)])
+                  for index in range(size + span)]
+        start = min(self.start + first + 1, ends.start)
+        result = [0.0] * (max(self.start + first + 1 + len(middle), ends.start + len(ends.probabilities)) - start)
+        for offset, values in ((self.start + first + 1 - start, middle), (ends.start - start, ends.probabilities)):
+            result[offset:offset + len(values)] = [total + value for total, value
+                                                   in zip(result[offset:offset + len(values)], values)]
+        return BankDistribution(step, start, [max(value, 0.0) for value in result]).trimmed()
+
+    def mixed(self, other, weight):
+        """
+        Mixes in another distribution on the same step, e.g. the outcome of an action that may fail.
+
+        Args:
+            other (BankDistribution): The other distribution.
+            weight (float): The probability of the other distribution.
+
+        Returns:
+            BankDistribution: (1 - weight) of this distribution plus `weight` of the other.
+        """
+        start = min(self.start, other.start)
+        result = [0.0] * (max(self.start + len(self.probabilities), other.start + len(other.probabilities)) - start)
+        for distribution, share in ((self, 1.0 - weight), (other, weight)):
+            offset = distribution.start - start
+            for index, probability in enumerate(distribution.probabilities, start=offset):
+                result[index] += share * probability
+        return BankDistribution(self.step, start, result).trimmed()
+
+    def grown(self, rate):
+        """
+        Applies one round of interest to positive balances; debts do not accrue interest.
+
+        Args:
+            rate (float): The interest rate.
+
+        Returns:
+            BankDistribution: The distribution after interest.
+        """
+        if not rate:
+            return self
+        grown = defaultdict(float)
+        for index, probability in enumerate(self.probabilities, start=self.start):
+            if index <= 0:
+                grown[index] += probability
+                continue
+            low, lower, upper = _split(index * (1 + rate) * self.step, self.step)
+            grown[low] += probability * lower
+            grown[low + 1] += probability * upper
+        start = min(grown)
+        return BankDistribution(self.step, start,
+                                [grown.get(index, 0.0) for index in range(start, max(grown) + 1)]).trimmed()
+
+    def mean(self):
+        """
+        Returns the distribution's mean balance.
+
+        Returns:
+            float: The mean.
+        """
+        return sum(index * probability for index, probability in
+                   enumerate(self.probabilities, start=self.start)) * self.step
+
+    def totals(self):
+        """
+        Returns the running totals of the probabilities, starting from 0.
+
+        Returns:
+            list: totals[i] is the probability of the first i grid points.
+        """
+        if getattr(self, "_totals", None) is None:
+            totals = [0.0]
+            for probability in self.probabilities:
+                totals.append(totals[-1] + probability)
+            self._totals = totals
+        return self._totals
+
+    def cdf(self, value):
+        """
+        Returns the probability of a balance at or below a value.
+
+        Each grid point's probability is taken to be spread evenly across its cell, so the
+        CDF is continuous and rises linearly through each cell.
+
+        Args:
+            value (float): The balance.
+
+        Returns:
+            float: The cumulative probability.
+        """
+        position = value / self.step + 0.5 - self.start
+        cell = math.floor(position)
+        if cell < 0:
+            return 0.0
+        if cell >= len(self.probabilities):
+            return 1.0
+        return min(self.totals()[cell] + (position - cell) * self.probabilities[cell], 1.0)
+
+    def percentile(self, fraction):
+        """
+        Finds the balance with a fraction of the probability at or below it.
+
+        Args:
+            fraction (float): Between 0 and 1, e.g. 0.5 for the median.
+
+        Returns:
+            float: The balance.
+        """
+        totals = self.totals()
+        for cell, probability in enumerate(self.probabilities):
+            if totals[cell + 1] >= fraction and probability > 0:
+                return (self.start + cell - 0.5 + (fraction - totals[cell]) / probability) * self.step
+        return (self.start + len(self.probabilities) - 0.5) * self.step
+
+def action_effect(action, scenario, income):
+    """
+    Describes the random amount one action adds to the player's bank.
+
+    Args:
+        action (tuple): The action, e.g. ("work",) or ("search", "stocks").
+        scenario (Scenario): The game parameters.
+        income (float): The player's job income.
+
+    Returns:
+        tuple: ("fixed", amount), ("uniform", low, high) or ("outcomes", [(amount, probability)]).
+
+    Raises:
+        ValueError: If the action's outcome depends on other players or items.
+    """
+    if action == ("work",):
+        return ("fixed", income)
+    if action == ("search", "treasure"):
+        return ("uniform", *scenario.treasure_range)
+    if action == ("search", "stocks"):
+        return ("uniform", *scenario.stock_range)
+    if action == ("search", "lottery ticket"):
+        win = scenario.lottery_win_chance
+        return ("outcomes", [(-scenario.lottery_ticket_cost, 1 - win)] +
+                [(reward, win / len(scenario.lottery_rewards)) for reward in scenario.lottery_rewards])
+    raise ValueError(f"{action!r} does not have a fixed payout distribution.")
+
+def apply_effect(distribution, effect):
+    """
+    Adds an effect's random amount to a distribution.
+
+    Besides the effects of `action_effect`, ("chance", probability, low, high) adds an
+    amount drawn uniformly between low and high with the given probability, and nothing
+    otherwise, e.g. a steal.
+
+    Args:
+        distribution (BankDistribution): The distribution before the effect.
+        effect (tuple): The effect.
+
+    Returns:
+        BankDistribution: The distribution after the effect.
+    """
+    if effect[0] == "fixed":
+        return distribution.plus_outcomes([(effect[1], 1.0)])
+    if effect[0] == "uniform":
+        return distribution.plus_uniform(effect[1], effect[2])
+    if effect[0] == "chance":
+        return distribution.mixed(distribution.plus_uniform(effect[2], effect[3]), effect[1])
+    return distribution.plus_outcomes(effect[1])
+
+def plan_effects(plan, scenario, income):
+    """
+    Checks that a plan is a legal turn and describes the random amount each of its actions adds.
+
+    Args:
+        plan (iterable): The actions of one turn, e.g. (("work",), ("work",)), as HeadlessGame takes them.
+        scenario (Scenario): The game parameters.
+        income (float): The player's job income.
+
+    Returns:
+        list: The effect of each action, from `action_effect`.
+
+    Raises:
+        ValueError: If the plan uses an action whose outcome depends on other players or items,
+            or is not a complete turn.
+    """
+    effects = []
+    used = 0
+    ended = False
+    for action in plan:
+        action = tuple(action)
+        if ended or used >= GamePlay.TURN_LIMIT:
+            raise ValueError(f"{action!r} comes after the turn has ended.")
+        if action == ("end",):
+            ended = True
+        else:
+            effects.append(action_effect(action, scenario, income))
+        used += GamePlay.ACTION_COSTS.get(action[0], 0)
+    if not ended and used < GamePlay.TURN_LIMIT:
+        raise ValueError("A plan must use up the turn or end it with ('end',).")
+    return effects
+
+def plan_spread(effects, rounds, scenario):
+    """
+    Bounds how far a plan's final balance can spread, for picking a grid step.
+
+    Args:
+        effects (list): The plan's effects from `plan_effects`.
+        rounds (int): The number of rounds.
+        scenario (Scenario): The game parameters.
+
+    Returns:
+        float: An upper bound on the width of the final distribution.
+    """
+    spread = 0.0
+    for effect in effects:
+        if effect[0] == "uniform":
+            spread += effect[2] - effect[1]
+        elif effect[0] == "chance":
+            spread += max(effect[3], 0) - min(effect[2], 0)
+        elif effect[0] == "outcomes":
+            amounts = [amount for amount, _ in effect[1]]
+            spread += max(amounts) - min(amounts)
+    return spread * rounds * (1 + scenario.bank_interest_rate) ** rounds
+
+def plan_distribution(plan, rounds, income=0.0, scenario=None, step=1.0):
+    """
+    Computes the distribution of a player's final bank when they play the same turn every round.
+
+    Interest is applied at the end of every round, as the AccountBook accrues it.
+
+    Args:
+        plan (iterable): The actions of one turn.
+        rounds (int): The number of rounds.
+        income (float): The player's job income.
+        scenario (Scenario, optional): The game parameters.
+        step (float): The grid step.
+
+    Returns:
+        BankDistribution: The distribution of the final bank.
+    """
+    scenario = DEFAULT_SCENARIO if scenario is None else scenario
+    effects = plan_effects(plan, scenario, income)
+    distribution = BankDistribution.point(scenario.starting_bank, step)
+    for _ in range(rounds):
+        for effect in effects:
+            distribution = apply_effect(distribution, effect)
+        distribution = distribution.grown(scenario.bank_interest_rate)
+    return distribution
+
+def win_probabilities(distributions):
+    """
+    Computes each player's chance of finishing with the highest bank.
+
+    Players are independent. For each of a player's grid cells, the product of every other
+    player's CDF is integrated across the cell with Simpson's rule, which is exact for up to
+    four players sharing a grid and follows each other player's own grid otherwise.
+
+    Args:
+        distributions (list): Each player's BankDistribution.
+
+    Returns:
+        list: Each player's win probability.
+    """
+    wins = []
+    for player, distribution in enumerate(distributions):
+        others = [other for index, other in enumerate(distributions) if index != player]
+        half = distribution.step / 2
+        total = 0.0
+        for index, probability in enumerate(distribution.probabilities, start=distribution.start):
+            if not probability:
+                continue
+            centre = index * distribution.step
+            below = [math.prod(other.cdf(value) for other in others) for value in (centre - half, centre, centre + half)]
+            total += probability * (below[0] + 4 * below[1] + below[2]) / 6
+        wins.append(total)
+    return wins
+
+def analyse(plans, incomes=None, rounds=None, scenario=None, percentiles=(0.05, 0.25, 0.5, 0.75, 0.95),
+            max_points=2048):
+    """
+    Computes every player's exact final-bank distribution, win probability and percentiles.
+
+    Each player's grid step is chosen so their distribution fits in about `max_points`
+    grid points.
+
+    Args:
+        plans (list): Each player's turn plan, or a strategy name from STRATEGY_PLANS.
+        incomes (list, optional): Each player's job income. Defaults to 0 for everyone.
+        rounds (int, optional): The number of rounds. Defaults to the scenario's first round choice.
+        scenario (Scenario, optional): The game parameters.
+        percentiles (iterable): The percentiles to report, as fractions.
+        max_points (int): Roughly the most grid points in a distribution.
+
+    Returns:
+        list: A dictionary per player with "Mean", "Win Probability", "Percentiles" (fraction
+        mapped to value) and "Distribution" (the BankDistribution).
+    """
+    scenario = DEFAULT_SCENARIO if scenario is None else scenario
+    rounds = scenario.round_choices[0] if rounds is None else rounds
+    plans = [STRATEGY_PLANS[plan] if isinstance(plan, str) else plan for plan in plans]
+    incomes = [0.0] * len(plans) if incomes is None else incomes
+    distributions = [plan_distribution(plan, rounds, income, scenario,
+                                       max(plan_spread(plan_effects(plan, scenario, income), rounds, scenario)
+                                           / max_points, 0.01))
+                     for plan, income in zip(plans, incomes)]
+    wins = win_probabilities(distributions)
+    return [{
+        "Mean": distribution.mean(),
+        "Win Probability": win,
+        "Percentiles": {fraction: distribution.percentile(fraction) for fraction in percentiles},
+        "Distribution": distribution
+    } for distribution, win in zip(distributions, wins)]
@@ -1,7 +1,13 @@
+import math
 import random
+from dataclasses import replace
+from .accounts import AccountBook
 from .job_income import jobs
+from .scenario import DEFAULT_SCENARIO
 from .Input_Handling import Security
 from .item import Item
+from .ledger import Ledger
+from .registry import SEARCHES, ITEMS
 from .ulits import log, clear_terminal, new_line
 import sys
 
@@ -12,7 +18,7 @@ def new_window():
     Returns:
         str: The sanitized input from the user.
     """
-    return Security.sanitize_input(input("Press the [Enter Key] to continue..."))
+    return Security.read_line("Press the [Enter Key] to continue...")
 
 class BankManagement:
     """
@@ -91,36 +97,53 @@ class Employment:
     """
     Manages employment-related operations including getting a job and working.
     """
-    
+
+    def __init__(self, ledger=None):
+        self.ledger = Ledger() if ledger is None else ledger
+
     @staticmethod
-    def get_job():
+    def get_job(jobs_pool=jobs, rng=random):
         """
         Randomly selects a job title and job income from the jobs dictionary.
         
+        Args:
+            jobs_pool (dict): The job titles and incomes still available to hand out.
+            rng (random.Random): The random number generator picking the job.
+
         Returns:
             tuple: A tuple containing the job title and job income.
         """
-        shuffle_list = list(jobs.items())
-        random.shuffle(shuffle_list)
-        jobs_list = dict(shuffle_list)
-        jobs_list = jobs.popitem()
-        job_title = jobs_list[0].title()
-        job_income = jobs_list[1]
+        job_title = rng.choice(list(jobs_pool))
+        job_income = jobs_pool.pop(job_title)
         return job_title.title(), job_income
     
-    @staticmethod
-    def work(player):
+    def earn(self, player):
+        """
+        Adds the player's job income to their bank balance without logging anything.
+        
+        Args:
+            player (Player): The Player instance performing the work action.
+
+        Returns:
+            float: The amount earned.
+        """
+        self.ledger.pay(player, player.job_income, "work")
+        return player.job_income
+
+    def work(self, player):
         """
         Performs work action for the player, increasing their bank balance based on their job income.
         
         Args:
             player (Player): The Player instance performing the work action.
+
+        Returns:
+            float: The amount earned.
         """
-        player.bank = BankManagement.deformat_currency(player.bank)  # Ensure bank balance is a float
-        player.bank += player.job_income
-        player.bank = round(player.bank, 2)
+        earned = self.earn(player)
         log(f"{player.name} has worked and earned {BankManagement.format_currency(player.job_income)}."
             f"Bank balance updated to {BankManagement.format_currency(player.bank)}.")
+        return earned
 
 class PlayerManagement:
     
@@ -198,7 +221,34 @@ class CriminalActivity:
     """
     Manages criminal activities including stealing from other players.
     """
-    
+
+    def __init__(self, scenario=DEFAULT_SCENARIO, rng=random, accounts=None, ledger=None):
+        self.scenario = scenario
+        self.rng = rng
+        self.accounts = accounts
+        self.ledger = Ledger() if ledger is None else ledger
+
+    def attempt_steal(self, player, target_player):
+        """
+        Resolves a steal attempt against another player without logging anything.
+
+        Args:
+            player (Player): The Player instance attempting the steal.
+            target_player (Player): The Player instance being stolen from.
+
+        Returns:
+            tuple: The amount stolen and the percentage taken, or None if the attempt failed.
+        """
+        if self.rng.random() >= self.scenario.steal_success_chance:
+            return None
+        if self.accounts is not None:
+            self.accounts.accrue(target_player)
+        percentage = self.rng.uniform(*self.scenario.steal_fraction)
+        # Round the amount before moving it so both balances change by exactly the same sum
+        amount_stolen = round(self.ledger.balance(target_player) * percentage, 2)
+        self.ledger.transfer(target_player, player, amount_stolen, "steal")
+        return amount_stolen, percentage
+
     def steal(self, player, players):
         """
         Allows the player to attempt to steal a percentage of another player's savings.
@@ -206,11 +256,15 @@ class CriminalActivity:
         Args:
             player (Player): The Player instance attempting the steal.
             players (list): The list of all players in the game.
+
+        Returns:
+            dict: The "target" ID and the "amount" stolen (0 if the attempt failed), or False if the
+            player cancelled.
         """
         while True:
             try:
                 target_id = Security.get_validated_int("Enter the player ID you want to steal from (0 to cancel): ", 
-                                                       range(1, (len(players) + 1)))
+                                                       range(0, (len(players) + 1)))
                 if target_id == 0:
                     clear_terminal()
                     return False
@@ -219,23 +273,16 @@ class CriminalActivity:
                     continue
                 target_player = PlayerManagement.get_player_by_id(self, target_id, players)
                 if target_player:
-                    success_rate = random.random()
-                    if success_rate > 0.5:  # 50% chance of success
-                        percentage = random.uniform(0.0, 1.0)  # Steal between 0% and 100%
-                        player.bank = BankManagement.deformat_currency(player.bank)  # Ensure bank balance is a float
-                        target_player.bank = BankManagement.deformat_currency(target_player.bank)
-                        amount_stolen = target_player.bank * percentage
-                        target_player.bank -= amount_stolen
-                        player.bank += amount_stolen
-                        target_player.bank = round(target_player.bank, 2)
-                        player.bank = round(player.bank, 2)
+                    outcome = self.attempt_steal(player, target_player)
+                    if outcome:
+                        amount_stolen, percentage = outcome
                         log(f"Steal successful! {player.name} stole {BankManagement.format_currency(amount_stolen)},"
                             f"roughly ({(percentage*100):.2f})% from {target_player.name}.")
                         log(f"\t\t{target_player.name}'s new bank balance is {BankManagement.format_currency(target_player.bank)}.")
                         log(f"\t\t{player.name}'s new bank balance is {BankManagement.format_currency(player.bank)}.")
                     else:
                         log(f"Steal attempt failed! {player.name} couldn't steal from {target_player.name}.")
-                    return True
+                    return {"target": target_player.id, "amount": outcome[0] if outcome else 0.0}
                 else:
                     log("Invalid player ID. Please try again.")
             except ValueError:
@@ -245,12 +292,56 @@ class Exploration:
     """
     Manages exploration activities including searching for treasure, lottery tickets, and stocks.
     """
-    
+
+    def __init__(self, scenario=DEFAULT_SCENARIO, rng=random, ledger=None):
+        self.scenario = scenario
+        self.rng = rng
+        self.ledger = Ledger() if ledger is None else ledger
+
+    def roll_treasure(self):
+        """
+        Rolls the value of a treasure.
+
+        Returns:
+            float: The value of a found treasure.
+        """
+        return self.rng.uniform(*self.scenario.treasure_range)
+
+    def roll_lottery(self):
+        """
+        Rolls the outcome of a lottery ticket.
+
+        Returns:
+            tuple: Whether the ticket won, and the reward (the negative ticket cost on a loss).
+        """
+        if self.rng.random() < self.scenario.lottery_win_chance:
+            return True, self.rng.choice(self.scenario.lottery_rewards)
+        return False, -self.scenario.lottery_ticket_cost
+
+    def roll_stocks(self):
+        """
+        Rolls the return of a stock investment.
+
+        Returns:
+            float: The return of a stock investment.
+        """
+        return self.rng.uniform(*self.scenario.stock_range)
+
+    def collect_reward(self, player, reward):
+        """
+        Adds a search reward to the player's bank balance.
+
+        Args:
+            player (Player): The player who performed the search.
+            reward (float): The reward to add (may be negative).
+        """
+        self.ledger.pay(player, BankManagement.deformat_currency(reward), "search")
+
     def search(self, player):
         """
         Allows the player to choose an item to search for and potentially gain a reward.
 
-        This method presents the player with a menu of search options: treasure, lottery ticket, and stocks.
+        This method presents the player with a menu of the registered search options: treasure, lottery ticket, stocks and any from plugins.
         Based on the player's choice, the player can earn a random amount of money, which is added to their bank balance.
         The player can also choose to go back to the player turn menu.
 
@@ -258,80 +349,59 @@ class Exploration:
             player (Player): The player who is performing the search.
 
         Returns:
-            bool: True if the player completed a search action, False if they chose to go back to the player turn menu.
+            dict: The "kind" of search and the "amount" it paid, or False if the player chose to go back to the
+            player turn menu.
         """
 
-        options = {
-            "1": "treasure",
-            "2": "lottery ticket",
-            "3": "stocks",
-            "0": "back"
-        }
-        
+        searches = SEARCHES.menu()
+        numbers = [str(number) for number in range(1, len(searches) + 1)]
+
         while True:
             new_line()
             log("Search options:")
-            for key, value in options.items():
-                log(f"  {key}. {value.title()}")
+            for number, entry in zip(numbers, searches):
+                log(f"  {number}. {entry.label}")
+            log("  0. Back")
 
             choice = Security.get_validated_choice(
-                "Choose what to search for (0 to go back): ", [
-                    "0", "cancel",
-                    "1", "t", "treasure", "chest",
-                    "2", "lottery ticket", 'l', 'lottery', 'ticket',
-                    "3", "stocks", 's', 'stock'
-                ]
+                "Choose what to search for (0 to go back): ", ["0", "cancel", *numbers, *SEARCHES.choices()]
             )
-            
+
             if choice in ["0", "cancel"]:
                 clear_terminal()
                 return False
-            
-            search_item = options.get(choice)
 
-            lottery_ticket_rewards = [0.5, 0, 1, 5, 10, 20, 25, 50, 100, 1_000, 
-                                      5_000, 10_000, 15_000, 20_000, 25_000,
-                                      50_000, 100_000, 250_000, 500_000, 
-                                      1_000_000, 0.25, 0.10, 2, 15]
+            entry = SEARCHES.resolve(searches[int(choice) - 1].name if choice in numbers else choice)
 
-            if search_item:
-                reward = 0
-                
-                if search_item in ["treasure", 't', '1','chest']:
-                    reward = random.uniform(-1_000, 10_000)
-                    log(f"{player.name} found a treasure worth {BankManagement.format_currency(reward)}!")
-
-                elif search_item in ["lottery ticket", 'l', '2', 'lottery', 'ticket']:
-                    success_rate = random.random()
-                    if success_rate > 0.9: # 10% of winning
-                        reward = random.choice(lottery_ticket_rewards)
-                        log(f"{player.name} bought a lottery ticket and won {BankManagement.format_currency(reward)}!")
-                    else:
-                        reward = -5
-                        log(f"{player.name} bought a lottery ticket and didn't win anything."
-                            f"Lottery ticket cost {BankManagement.format_currency(reward)}")
-
-                elif search_item in ["stocks", 's', '3', 'stock']:
-                    reward = random.uniform(-1_500_000, 1_500_000)
-                    log(f"{player.name} invested in stocks and now has {BankManagement.format_currency(reward)}!")
-
-                reward = BankManagement.deformat_currency(reward)
-                player.bank = BankManagement.deformat_currency(player.bank)  # Ensure bank balance is a float
-                player.bank += reward
-                player.bank = round(player.bank, 2)
+            if entry is not None:
+                won, reward = entry.roll(self)
+                entry.report(player, won, reward)
+                self.collect_reward(player, reward)
                 new_line()
                 log(f"{player.name}'s new bank balance is {BankManagement.format_currency(player.bank)}.")
-                return True
-            
+                return {"kind": entry.name, "amount": reward}
+
             else:
                 log("Invalid choice. Please choose a valid option.")
 
 class Market:
     """
     Manages the shop inventory and pricing.
+
+    By default every game rolls its own prices and stock is unlimited. Given a
+    SharedMarket, the shop sells that market's items at its prices instead, and each
+    purchase takes a unit out of its shared stock.
     """
-    def __init__(self):
-        self.items = self.setup_items()
+    def __init__(self, scenario=DEFAULT_SCENARIO, rng=random, ledger=None, shared=None):
+        self.scenario = scenario
+        self.rng = rng
+        self.ledger = Ledger() if ledger is None else ledger
+        self.shared = shared
+        if shared is None:
+            self.items = self.setup_items()
+        else:
+            self.items = shared.items
+            self.shard = shared.connect()
 
     def setup_items(self):
         """
@@ -341,12 +411,9 @@ class Market:
             list: A list of Item instance.
         """
         return [
-            Item("House", BankManagement.format_currency(self.random_prices(100_000, 1_000_000)), 
-                 "A safe deposit to store a lot of 'your' money."),
-            Item("Safe Deposit Ticket", BankManagement.format_currency(self.random_prices(1_000, 5_000)), 
-                 "A one-time-use ticket for a safe deposit."),
-            Item("Bank Note", BankManagement.format_currency(self.random_prices(10, 100)), 
-                 "A bank note worth a specific amount of money.")     
+            Item(shop_item.name, BankManagement.format_currency(self.random_prices(shop_item.low, shop_item.high)),
+                 shop_item.description)
+            for shop_item in self.scenario.shop_items
         ]
 
     def random_prices(self, num_1, num_2):
@@ -360,7 +427,7 @@ class Market:
         Returns:
             float: The generated random price.
         """
-        return round(random.uniform(num_1, num_2), 2)
+        return round(self.rng.uniform(num_1, num_2), 2)
 
     def display_items(self):
         """
@@ -371,110 +438,214 @@ class Market:
         for idx, item in enumerate(self.items, start=1):
             log(f"{idx}. {item.name} - {BankManagement.format_currency(item.price)} - {item.despriction}")
 
+    def buy(self, player, item_index):
+        """
+        Buys a shop item for the player without logging anything.
+
+        Args:
+            player (Player): The Player instance making the purchase.
+            item_index (int): The index of the item in the shop.
+
+        Returns:
+            Item: The item bought, or None if the player could not afford it or it is sold out.
+        """
+        selected_item = self.items[item_index]
+        price = float(BankManagement.deformat_currency(selected_item.price))
+
+        if self.ledger.balance(player) >= price:
+            # Only this game moves the player's money, so once a unit is taken the payment cannot fail
+            if self.shared is not None and not self.shared.take(item_index, self.shard):
+                return None
+            self.ledger.pay(player, -price, "purchase")
+            # The shop keeps its own item; the player gets a copy so neither can change the other
+            bought_item = replace(selected_item, price=price)
+            player.inventory.append(bought_item)
+            return bought_item
+
+        return None
+
+    def in_stock(self, item_index):
+        """
+        Checks whether an item can still be bought.
+
+        Args:
+            item_index (int): The index of the item in the shop.
+
+        Returns:
+            bool: False only if the item is sold out in a shared market.
+        """
+        return self.shared is None or self.shared.remaining(item_index) > 0
+
     def purchase_item(self, player):
         """
         Handles the purchasing of an item from the shop by the player.
         
         Args:
             player (Player): The Player instance making the purchase.
+
+        Returns:
+            dict: The "item" chosen and whether it was "bought" (plus whether it is still "in_stock"
+            in a shared market), or False if the player cancelled.
         """
         self.display_items()
         log(f"This is how much you have in your current bank account : {BankManagement.format_currency(player.bank)}")
-        valid_choices = [str(i) for i in range (1, len(self.items) + 1)] + ["0", "cancel"] + ["h", "house", "1"]
-        valid_choices = valid_choices + ["s", "safe", "2", 'ticket', 'Safe Deposit Ticket', "deposit", "sdt"]
-        valid_choices = valid_choices + ["b", "bank", "3", 'note', 'bank note', "bn"]
+        numbers = [str(i) for i in range(1, len(self.items) + 1)]
+        valid_choices = numbers + ["0", "cancel"] + ITEMS.choices(item.name for item in self.items)
         choice = Security.get_validated_choice("Enter the item number you want to buy (0 to cancel): ", 
                                                valid_choices)
         
         if choice in ["0", "cancel"]:
             clear_terminal()
             return False
-        
-        elif choice in ["h", "house", "1"]:
-            choice = 1
 
-        elif choice in ["s", "safe", "2", 'ticket', 'Safe Deposit Ticket', "deposit", "sdt"]:
-            choice = 2
-
-        elif choice in ["b", "bank", "3", 'note', 'bank note', "bn"]:
-            choice = 3
+        elif choice not in numbers:
+            name = ITEMS.aliases[choice]
+            choice = next(number for number, item in enumerate(self.items, start=1) if item.name == name)
 
         item_index = int(choice) - 1
-        selected_item = self.items[item_index]
-        selected_item.price = float(BankManagement.deformat_currency(selected_item.price))
+        selected_item = self.buy(player, item_index)
 
-        if player.bank >= selected_item.price:
-            player.bank -= selected_item.price
-            player.inventory.append(selected_item)
+        if selected_item:
             new_line()
             log(f"{player.name} bought {selected_item.name} for {BankManagement.format_currency(selected_item.price)}.")
             log(f"New bank balance: {BankManagement.format_currency(player.bank)}")
+        elif not self.in_stock(item_index):
+            log(f"{self.items[item_index].name} is sold out.")
         else:
-            selected_item.price = (BankManagement.format_currency(selected_item.price))
-            log(f"{player.name} does not have enough money to buy {selected_item.name}.")
+            log(f"{player.name} does not have enough money to buy {self.items[item_index].name}.")
 
         new_window()
         clear_terminal()
-        return True
+        outcome = {"item": self.items[item_index].name, "bought": selected_item is not None}
+        if self.shared is not None:
+            outcome["in_stock"] = self.in_stock(item_index)
+        return outcome
 
 class ItemsUsage:
 
     @staticmethod
-    def safe_deposit(player):
+    def deposit_all(player, capacity=math.inf, ledger=None):
         """
-        Put all available cash in the bank into the safe.
+        Moves all available cash in the bank into the safe without logging anything.
 
         Args:
             player (Player): The player who is depositing the cash into the safe.
+            capacity (float): The most the safe can hold; cash that does not fit stays in the bank.
+            ledger (Ledger, optional): The ledger recording the deposit.
+
+        Returns:
+            bool: True if the cash was deposited, False if the bank balance is not a valid number.
         """
         if isinstance(player.bank, float):
-            player.safe += player.bank
-            player.bank = 0
+            ledger = Ledger() if ledger is None else ledger
+            amount = min(ledger.balance(player), max(0.0, capacity - ledger.balance(player, "safe")))
+            ledger.transfer(player, player, amount, "deposit", "bank", "safe")
+            return True
+        return False
+
+    @staticmethod
+    def redeem_bank_note(player, bank_note, ledger=None):
+        """
+        Adds the value of a bank note to the player's bank balance without logging anything.
+
+        Args:
+            player (Player): The player using the bank note.
+            bank_note (Item): The bank note item being used.
+            ledger (Ledger, optional): The ledger recording the payment.
+
+        Returns:
+            float: The amount added to the bank balance.
+        """
+        amount = BankManagement.deformat_currency(bank_note.price)
+        (Ledger() if ledger is None else ledger).pay(player, amount, "bank note")
+        return amount
+
+    @staticmethod
+    def apply_item(player, item_index, capacity=math.inf, ledger=None):
+        """
+        Uses an item from the player's inventory without logging anything.
+
+        Args:
+            player (Player): The player using the item.
+            item_index (int): The index of the item to use in the player's inventory.
+            capacity (float): The most the player's safe can hold.
+            ledger (Ledger, optional): The ledger recording any change of balance.
+
+        Returns:
+            Item: The item that was used up, or None if nothing was used.
+        """
+        if item_index < 0 or item_index >= len(player.inventory):
+            return None
+
+        selected_item = player.inventory[item_index]
+        entry = ITEMS.get(selected_item.name)
+        if entry is None or not hasattr(entry, "use"):
+            return None
+        entry.use(player, selected_item, capacity, ledger)
+        del player.inventory[item_index]
+        return selected_item
+
+    @staticmethod
+    def safe_deposit(player, capacity=math.inf, ledger=None):
+        """
+        Put all available cash in the bank into the safe.
+
+        Args:
+            player (Player): The player who is depositing the cash into the safe.
+            capacity (float): The most the safe can hold.
+            ledger (Ledger, optional): The ledger recording the deposit.
+        """
+        if ItemsUsage.deposit_all(player, capacity, ledger):
             # log(f"{player.inventory[Item]}")
             log(f"All available cash in bank has been deposited into the safe for {player.name}.")
         else:
             log("Bank balance must be a valid number.")
 
     @staticmethod
-    def use_bank_note(player, bank_note):
+    def use_bank_note(player, bank_note, ledger=None):
         """
         Use a bank note item.
 
         Args:
             player (Player): The player using the bank note.
             bank_note (Item): The bank note item being used.
+            ledger (Ledger, optional): The ledger recording the payment.
         """
-        amount = BankManagement.deformat_currency(bank_note.price)
-        player.bank += amount
+        amount = ItemsUsage.redeem_bank_note(player, bank_note, ledger)
         log(f"You used a bank note worth {BankManagement.format_currency(amount)}."
             f"Your bank balance has been increased by {BankManagement.format_currency(amount)}.")
 
     @staticmethod
-    def choose_item(player, item_index):
+    def choose_item(player, item_index, capacity=math.inf, ledger=None):
         """
         Use an item from the player's inventory.
 
         Args:
             player (Player): The player using the item.
             item_index (int): The index of the item to use in the player's inventory.
+            capacity (float): The most the player's safe can hold.
+            ledger (Ledger, optional): The ledger recording any change of balance.
         """
         if item_index < 0 or item_index >= len(player.inventory):
             log("Invalid item index.")
             return
         
         selected_item = player.inventory[item_index]
-        if selected_item.name == "Safe Deposit Ticket":
-            ItemsUsage.safe_deposit(player)
-            player.inventory.remove(selected_item)
-        elif selected_item.name == "Bank Note":
-            ItemsUsage.use_bank_note(player, selected_item)
-            player.inventory.remove(selected_item)
-        else:
+        entry = ITEMS.get(selected_item.name)
+        if entry is None or not hasattr(entry, "use"):
             log("This item cannot be used.")
+            return
+        entry.report(player, selected_item, entry.use(player, selected_item, capacity, ledger))
+        player.inventory.remove(selected_item)
 
-    def use_item(player):
+    def use_item(player, capacity=math.inf, ledger=None):
         """
         Allows the player to use an item from their inventory.
+
+        Args:
+            player (Player): The player using an item.
+            capacity (float): The most the player's safe can hold.
+            ledger (Ledger, optional): The ledger recording any change of balance.
         """
         if player.inventory:
             log("Inventory:")
@@ -486,11 +657,51 @@ class ItemsUsage:
                 clear_terminal()
                 return
             item_index = int(choice) - 1
-            ItemsUsage.choose_item(player, item_index)
+            ItemsUsage.choose_item(player, item_index, capacity, ledger)
         else:
             log("You have no items in your inventory.")
 
 
+def report_treasure(player, won, reward):
+    log(f"{player.name} found a treasure worth {BankManagement.format_currency(reward)}!")
+
+def report_lottery(player, won, reward):
+    if won:
+        log(f"{player.name} bought a lottery ticket and won {BankManagement.format_currency(reward)}!")
+    else:
+        log(f"{player.name} bought a lottery ticket and didn't win anything."
+            f"Lottery ticket cost {BankManagement.format_currency(reward)}")
+
+def report_stocks(player, won, reward):
+    log(f"{player.name} invested in stocks and now has {BankManagement.format_currency(reward)}!")
+
+def report_deposit(player, item, deposited):
+    if deposited:
+        log(f"All available cash in bank has been deposited into the safe for {player.name}.")
+    else:
+        log("Bank balance must be a valid number.")
+
+def report_bank_note(player, item, amount):
+    log(f"You used a bank note worth {BankManagement.format_currency(amount)}."
+        f"Your bank balance has been increased by {BankManagement.format_currency(amount)}.")
+
+# A search's `roll(exploration)` returns whether it paid out and the reward, which `report` logs
+SEARCHES.register("treasure", ("t", "chest"), label="Treasure",
+                  roll=lambda exploration: (True, exploration.roll_treasure()), report=report_treasure)
+SEARCHES.register("lottery ticket", ("l", "lottery", "ticket"), label="Lottery Ticket",
+                  roll=Exploration.roll_lottery, report=report_lottery)
+SEARCHES.register("stocks", ("s", "stock"), label="Stocks",
+                  roll=lambda exploration: (True, exploration.roll_stocks()), report=report_stocks)
+
+# An item's `use(player, item, capacity, ledger)` applies it without logging; `report` logs what it returned
+ITEMS.register("House", ("h", "house"))
+ITEMS.register("Safe Deposit Ticket", ("s", "safe", "ticket", "deposit", "sdt"),
+               use=lambda player, item, capacity, ledger: ItemsUsage.deposit_all(player, capacity, ledger),
+               report=report_deposit)
+ITEMS.register("Bank Note", ("b", "bank", "note", "bank note", "bn"),
+               use=lambda player, item, capacity, ledger: ItemsUsage.redeem_bank_note(player, item, ledger),
+               report=report_bank_note)
+
 class QuitGame:
     @staticmethod
     def quit_game():
@@ -503,13 +714,27 @@ class GameLogic:
     """
     Contains the game logic related to jobs, stealing money, and treasures.
     """
-    def __init__(self):
-        self.market = Market()
+    def __init__(self, scenario=None, rng=random, market=None, keep_log=True):
+        """
+        Initializes the game systems for a single game.
+
+        Args:
+            scenario (Scenario, optional): The game parameters. Defaults to DEFAULT_SCENARIO.
+            rng (random.Random, optional): The random number generator every system draws from.
+            market (SharedMarket, optional): A shop shared with other games. Defaults to a shop of its own.
+            keep_log (bool): Whether the ledger keeps every committed transfer; see Ledger.
+        """
+        self.scenario = DEFAULT_SCENARIO if scenario is None else scenario
+        self.rng = rng
+        self.ledger = Ledger(keep_log)
+        self.accounts = AccountBook(self.scenario, self.ledger)
+        self.jobs = self.scenario.roll_jobs(rng)
+        self.market = Market(self.scenario, rng, self.ledger, market)
         self.bank_manager = BankManagement()
-        self.employment = Employment()
+        self.employment = Employment(self.ledger)
         self.player_manger = PlayerManagement()
-        self.crime = CriminalActivity()
-        self.exploration = Exploration()
+        self.crime = CriminalActivity(self.scenario, rng, self.accounts, self.ledger)
+        self.exploration = Exploration(self.scenario, rng, self.ledger)
         self.quit_game = QuitGame()
         self.item_usage = ItemsUsage
 
@@ -526,7 +751,10 @@ class GameLogic:
         return self.bank_manager.check_bank_modifications(self, players)
 
     def get_job(self):
-        return self.employment.get_job()
+        if not self.jobs:
+            # Every job has been handed out, so start again with freshly rolled incomes
+            self.jobs = self.scenario.roll_jobs(self.rng)
+        return self.employment.get_job(self.jobs, self.rng)
 
     def work(self, player):
         return self.employment.work(player)
@@ -550,10 +778,10 @@ class GameLogic:
         return self.exploration.search(player)
     
     def use_item(self, player):
-        return self.item_usage.use_item(player)
+        return self.item_usage.use_item(player, self.accounts.safe_capacity(player), self.ledger)
     
     def visit_market(self, player):
-        self.market.purchase_item(player)
+        return self.market.purchase_item(player)
 
     def quit_game(self):
         return self.quit_game()
\ No newline at end of file
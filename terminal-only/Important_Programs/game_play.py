@@ -1,9 +1,66 @@
 from .Input_Handling import Security
 from .ulits import log, clear_terminal, new_line
 from .game_logic import PlayerManagement
+from .registry import ACTIONS
+
+# Returned by an action's `play` handler to end the player's turn
+END_TURN = object()
 
 def new_window():
-    return Security.sanitize_input(input("Press the [Enter Key] to continue..."))
+    return Security.read_line("Press the [Enter Key] to continue...")
+
+def play_description(game, player):
+    game.gamelogic.view_other_player_players(game.players)
+
+def play_work(game, player):
+    new_line()
+    amount = game.gamelogic.work(player)
+    game.action_event(player, "work", amount=amount)
+    new_window()
+    clear_terminal()
+
+def play_steal(game, player):
+    outcome = game.gamelogic.steal(player, game.players)
+    if outcome:
+        game.action_event(player, "steal", **outcome)
+    new_window()
+    clear_terminal()
+
+def play_search(game, player):
+    new_line()
+    outcome = game.gamelogic.search(player)
+    if outcome:
+        game.action_event(player, "search", **outcome)
+    new_window()
+    clear_terminal()
+
+def play_use_item(game, player):
+    game.gamelogic.use_item(player)
+
+def play_market(game, player):
+    outcome = game.gamelogic.visit_market(player)
+    if outcome:
+        game.action_event(player, "buy", **outcome)
+
+def play_advice(game, player):
+    if game.advisor is None:
+        from .advisor import Advisor
+        game.advisor = Advisor(game.gamelogic.scenario, game.round_limit)
+    game.show_advice(player)
+
+def play_end(game, player):
+    new_line()
+    log(f"Player #{player.id} turn has voted to end their turn.")
+    new_window()
+    clear_terminal()
+    return END_TURN
+
+def play_clear(game, player):
+    clear_terminal()
+
+def play_quit(game, player):
+    log(f"{player.name} has been forcefully terminated this program early.")
+    game.gamelogic.quit_game()
 
 class GamePlay:
     """
@@ -15,20 +72,67 @@ class GamePlay:
     """
 
     TEN_MILLION_BANK_BALANCE = 10_000_000.00
+    TURN_LIMIT = 5
+    # Kept up to date by ACTIONS as actions are registered
+    ACTION_COSTS = ACTIONS.costs
   
-    def __init__(self, players, round_limit, gamelogic):
+    def __init__(self, players, round_limit, gamelogic, score_store=None, on_event=None, advisor=None):
         """
         Initializes the GamePlay class with a list of Player instances and a round limit.
         
         Args:
             players (list): A list of Player instances.
             round_limit (int): The maximum number of rounds in the game.
+            score_store (HighScoreStore, optional): Where finished games are recorded.
+            on_event (callable, optional): Called with (event type, payload) as the game progresses,
+                e.g. a Broadcaster.
+            advisor (Advisor, optional): Shows a hint at the start of every turn. Without one,
+                the advisor is only set up when a player asks for a hint.
         """
         self.players = players
         self.round_limit = round_limit
         self.gamelogic = gamelogic
+        self.score_store = score_store
+        self.on_event = on_event
+        self.advisor = advisor
         self.player_management = PlayerManagement()
 
+    def emit(self, event_type, **payload):
+        """
+        Reports a game event to the `on_event` callback, if there is one.
+
+        Args:
+            event_type (str): One of "turn_start", "action", "round_complete" or "game_over".
+            **payload: The JSON-serialisable details of the event.
+        """
+        if self.on_event is not None:
+            self.on_event(event_type, payload)
+
+    def action_event(self, player, action, **outcome):
+        """
+        Reports the outcome of an action taken in the terminal, with the same fields as HeadlessGame.
+
+        Args:
+            player (Player): The player who acted.
+            action (str): The action taken.
+            **outcome: What came of it, e.g. the "target" and "amount" of a steal.
+        """
+        self.emit("action", player=player.id, action=action, **outcome,
+                  bank=self.gamelogic.deformat_currency(player.bank))
+
+    def show_advice(self, player):
+        """
+        Logs the advisor's hint for a player's turn.
+
+        Args:
+            player (Player): The Player instance whose turn it is.
+        """
+        from .advisor import format_advice
+        rounds = self.round_limit - self.rounds
+        new_line()
+        for line in format_advice(self.advisor.advise(player, self.players, rounds), rounds):
+            log(line)
+
     def format_player_banks(self):
         """
         Formats the bank balances of all players.
@@ -48,7 +152,9 @@ class GamePlay:
                 # self.player_management.current_player_index_id(current_player=player, players= self.players)
                 self.player_turn(player)
             self.rounds += 1
+            self.gamelogic.accounts.advance(self.rounds)
             log(f"Round {self.rounds} completed.")
+            self.emit("round_complete", round=self.rounds)
             if self.rounds == self.round_limit:
                 self.check_game_end()
             else:
@@ -56,26 +162,16 @@ class GamePlay:
 
     def print_player_options(self, player):
         """
-        Prints the options available to a player during their turn using a dictionary.
+        Prints the options available to a player during their turn from the action registry.
         
         Args:
             player (Player): The Player instance whose turn it is.
         """
-        options = {
-            0: "Player Description",
-            1: "Work",
-            2: "Steal",
-            3: "Search",
-            4: "Use Item",
-            5: "Visit Shop",
-            6: "End Turn"
-        }
-
         new_line()
         log(f"It's Player #{player.id}'s turn.")
         log("Options:")
-        for key, value in options.items():
-            log(f"  {key}. {value}")
+        for number, entry in enumerate(ACTIONS.menu()):
+            log(f"  {number}. {entry.label}")
     
     def player_turn(self, player):
         """
@@ -87,11 +183,15 @@ class GamePlay:
         self.player_management.set_current_player(player)
         PlayerManagement.set_current_player(self, player)
         log(f"It's {player.name}'s turn.")
+        self.gamelogic.accounts.accrue(player)
+        self.emit("turn_start", player=player.id, round=self.rounds + 1)
+        if self.advisor is not None:
+            self.show_advice(player)
         turn = 0
         
         while True:
             
-            if turn >= 5:
+            if turn >= self.TURN_LIMIT:
                 log(f"Player #{player.id} turn has ended.")
                 new_window()
                 clear_terminal()
@@ -100,74 +200,33 @@ class GamePlay:
 
             self.print_player_options(player)
 
+            menu = ACTIONS.menu()
+            numbers = [str(number) for number in range(len(menu))]
             player_actions = Security.get_validated_choice(
-                f"Choose your action, Player #{player.id}: ",
-                ["0", "description", "player description", "d", 
-                 "1", "work", "w", 
-                 "2", "steal", 
-                 "3", "search",
-                 "4", "use_item", "u", "i", "item",
-                 "5", "market", "m",
-                 "6", "end turn", "end", "e",
-                 "quit", "cls", "exit", 'q']
+                f"Choose your action, Player #{player.id}: ", numbers + ACTIONS.choices()
             ).lower()
+            entry = ACTIONS.resolve(menu[int(player_actions)].name if player_actions in numbers else player_actions)
 
-            if player_actions in ["0", "despriction", "player despriction", "d"]:
-                # self.player_management.set_current_player(player)
-                # PlayerManagement.set_current_player(self, player)
-                self.gamelogic.view_other_player_players(self.players)
-
-            elif player_actions in ["1", "work", "w"]:
-                new_line()
-                self.gamelogic.work(player)
-                turn += 4
-                new_window()
-                clear_terminal()
-
-            elif player_actions in ["2", "steal"]:
-                self.gamelogic.steal(player, self.players)
-                turn += 1
-                new_window()
-                clear_terminal()
-
-            elif player_actions in ["3", "search"]:
-                new_line()
-                self.gamelogic.search(player)
-                turn += 6
-                new_window()
-                clear_terminal()
-
-            elif player_actions in ["4", "use_item", "item", "u", "i"]:
-                self.gamelogic.use_item(player)
+            if entry is None or not hasattr(entry, "play"):
+                log(f"Invalid action. Choose between 0 and {len(menu) - 1}.")
+                continue
 
-            elif player_actions in ["5", "market", "m"]:
-                self.gamelogic.visit_market(player)
-
-            elif player_actions in ["6", "end turn", "end", "e"]:
-                new_line()
-                log(f"Player #{player.id} turn has voted to end their turn.")
-                new_window()
-                clear_terminal()
+            if entry.play(self, player) is END_TURN:
                 break
-
-            elif player_actions == "cls":
-                clear_terminal()
-
-            elif player_actions in ["quit", 'q', "exit"]:
-                log(f"{player.name} has been forcefully terminated this program early.")
-                self.gamelogic.quit_game()
-
-            else:
-                log("Invalid action. Choose between 0 and 5.")
+            turn += entry.cost
     
     def check_game_end(self):
         """
         Checks if the game has reached the end of the rounds and determines the winner.
         """
         if self.rounds == self.round_limit:
+            self.gamelogic.accounts.accrue_all(self.players)
             self.rank_players()
-            self.check_achievements()
+            achievements = self.check_achievements()
             self.announce_winner()
+            self.emit_game_over()
+            if self.score_store is not None:
+                self.score_store.record_game(self.players, self.round_limit, achievements)
     
     def rank_players(self):
         """
@@ -178,10 +237,25 @@ class GamePlay:
     def check_achievements(self):
         """
         Checks if any player has reached the target bank balance and logs this achievement.
+
+        Returns:
+            list: (player name, achievement) pairs for every achievement unlocked.
+        """
+        achievements = self.unlocked_achievements()
+        for name, _ in achievements:
+            player = next(player for player in self.players if player.name == name)
+            log(f"Achievement unlocked! {player.name} has reached a bank balance of {self.gamelogic.format_currency(player.bank)}.")
+        return achievements
+
+    def unlocked_achievements(self):
+        """
+        Finds every achievement unlocked by the players without logging anything.
+
+        Returns:
+            list: (player name, achievement) pairs.
         """
-        for player in self.players:
-            if self.gamelogic.deformat_currency(player.bank) >= self.TEN_MILLION_BANK_BALANCE:
-                log(f"Achievement unlocked! {player.name} has reached a bank balance of {self.gamelogic.format_currency(player.bank)}.")
+        return [(player.name, "Ten Million Bank Balance") for player in self.players
+                if self.gamelogic.deformat_currency(player.bank) >= self.TEN_MILLION_BANK_BALANCE]
 
     def announce_winner(self):
         """
@@ -195,3 +269,24 @@ class GamePlay:
             log(f"\t{rank}. {player.name} - Bank Balance: {self.gamelogic.format_currency(player.bank)}")
         new_line()
         log(f"The winner is {self.players[0].name} with a bank balance of {self.gamelogic.format_currency(self.players[0].bank)}!")
+
+    def emit_game_over(self):
+        """
+        Reports the final rankings.
+        """
+        self.emit("game_over", round_limit=self.round_limit, rankings=[
+            {"rank": rank, "player": player.id, "name": player.name,
+             "bank": self.gamelogic.deformat_currency(player.bank)}
+            for rank, player in enumerate(self.players, start=1)])
+
+# An action's `play(game, player)` handler runs it in the terminal
+ACTIONS.register("description", ("d", "player description"), label="Player Description", play=play_description)
+ACTIONS.register("work", ("w",), cost=4, label="Work", play=play_work)
+ACTIONS.register("steal", cost=1, label="Steal", play=play_steal)
+ACTIONS.register("search", cost=6, label="Search", play=play_search)
+ACTIONS.register("use", ("use_item", "item", "u", "i"), label="Use Item", play=play_use_item)
+ACTIONS.register("buy", ("market", "m"), label="Visit Shop", play=play_market)
+ACTIONS.register("end", ("end turn", "e"), label="End Turn", play=play_end)
+ACTIONS.register("advice", ("a", "hint", "advisor"), label="Strategy Advisor", play=play_advice)
+ACTIONS.register("cls", play=play_clear)
+ACTIONS.register("quit", ("q", "exit"), play=play_quit)
@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+import time
+from .game_logic import BankManagement
+
+class HighScoreStore:
+    """
+    Persists finished games, final rankings, achievements and lifetime player stats in SQLite.
+
+    Games are buffered in memory and written in a single transaction once `batch_size`
+    games have been recorded (or when `flush` is called), so batch simulators do not pay
+    an fsync for every row.
+
+    Career stats are keyed by player name, the only thing that identifies a player from
+    one game to the next, so players who share a name also share their career stats.
+
+    A store may be shared between threads: every method holds `lock`, so games recorded
+    by one thread are never flushed twice or dropped by another.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+        batch_size (int): The number of games buffered before they are written.
+        lock (threading.RLock): Serialises access to the buffer and the connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            played_at REAL NOT NULL,
+            round_limit INTEGER NOT NULL,
+            player_count INTEGER NOT NULL,
+            winner_name TEXT NOT NULL,
+            winning_bank REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS rankings (
+            game_id INTEGER NOT NULL REFERENCES games(id),
+            rank INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            job_title TEXT NOT NULL,
+            final_bank REAL NOT NULL,
+            safe REAL NOT NULL,
+            PRIMARY KEY (game_id, rank)
+        );
+        CREATE TABLE IF NOT EXISTS achievements (
+            game_id INTEGER NOT NULL REFERENCES games(id),
+            name TEXT NOT NULL,
+            achievement TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS player_stats (
+            name TEXT PRIMARY KEY,
+            games_played INTEGER NOT NULL,
+            wins INTEGER NOT NULL,
+            total_bank REAL NOT NULL,
+            best_bank REAL NOT NULL,
+            achievements INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS rankings_by_bank ON rankings (final_bank DESC);
+        CREATE INDEX IF NOT EXISTS rankings_by_job ON rankings (job_title, final_bank DESC);
+        CREATE INDEX IF NOT EXISTS achievements_by_name ON achievements (name);
+    """
+
+    def __init__(self, path="money_game_scores.db", batch_size=1):
+        """
+        Opens (or creates) the score database in WAL mode.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            batch_size (int): The number of games to buffer before writing them in one transaction.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record_game(self, players, round_limit, achievements=()):
+        """
+        Buffers a finished game for writing.
+
+        Args:
+            players (list): The Player instances, already sorted into their final ranking.
+            round_limit (int): The number of rounds the game was played for.
+            achievements (iterable): (player name, achievement) pairs unlocked during the game.
+        """
+        standings = [
+            (player.name, player.job_title,
+             BankManagement.deformat_currency(player.bank),
+             BankManagement.deformat_currency(player.safe))
+            for player in players
+        ]
+        with self.lock:
+            self.pending.append((time.time(), round_limit, standings, tuple(achievements)))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """
+        Writes every buffered game in a single transaction.
+        """
+        with self.lock:
+            if self.pending:
+                self._write(self.pending)
+                self.pending.clear()
+
+    def _write(self, pending):
+        games, rankings, unlocked, stats = [], [], [], {}
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            next_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()[0] + 1
+            for game_id, (played_at, round_limit, standings, achievements) in enumerate(pending, start=next_id):
+                winner_name, _, winning_bank, _ = standings[0]
+                games.append((game_id, played_at, round_limit, len(standings), winner_name, winning_bank))
+                for rank, (name, job_title, bank, safe) in enumerate(standings, start=1):
+                    rankings.append((game_id, rank, name, job_title, bank, safe))
+                    played, wins, total, best, earned = stats.get(name, (0, 0, 0.0, bank, 0))
+                    stats[name] = (played + 1, wins + (rank == 1), total + bank, max(best, bank), earned)
+                for name, achievement in achievements:
+                    unlocked.append((game_id, name, achievement))
+                    played, wins, total, best, earned = stats[name]
+                    stats[name] = (played, wins, total, best, earned + 1)
+
+            cursor.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?)", games)
+            cursor.executemany("INSERT INTO rankings VALUES (?, ?, ?, ?, ?, ?)", rankings)
+            cursor.executemany("INSERT INTO achievements VALUES (?, ?, ?)", unlocked)
+            cursor.executemany(
+                """
+                INSERT INTO player_stats VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    games_played = games_played + excluded.games_played,
+                    wins = wins + excluded.wins,
+                    total_bank = total_bank + excluded.total_bank,
+                    best_bank = MAX(best_bank, excluded.best_bank),
+                    achievements = achievements + excluded.achievements
+                """,
+                [(name, *values) for name, values in stats.items()])
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def top_players(self, limit=10):
+        """
+        Returns the best final bank balances of all time.
+
+        Args:
+            limit (int): The number of entries to return.
+
+        Returns:
+            list: (name, job title, final bank, game id) tuples, best first.
+        """
+        with self.lock:
+            self.flush()
+            return self.connection.execute(
+                "SELECT name, job_title, final_bank, game_id FROM rankings ORDER BY final_bank DESC LIMIT ?",
+                (limit,)).fetchall()
+
+    def top_by_job(self, job_title, limit=10):
+        """
+        Returns the best final bank balances of all time for a single job title.
+
+        Args:
+            job_title (str): The job title to filter on.
+            limit (int): The number of entries to return.
+
+        Returns:
+            list: (name, final bank, game id) tuples, best first.
+        """
+        with self.lock:
+            self.flush()
+            return self.connection.execute(
+                "SELECT name, final_bank, game_id FROM rankings WHERE job_title = ? ORDER BY final_bank DESC LIMIT ?",
+                (job_title, limit)).fetchall()
+
+    def career_stats(self, name):
+        """
+        Returns the lifetime stats of a player.
+
+        Args:
+            name (str): The player's name.
+
+        Returns:
+            dict: The player's lifetime stats, or None if they have never finished a game.
+        """
+        with self.lock:
+            self.flush()
+            row = self.connection.execute(
+                "SELECT games_played, wins, total_bank, best_bank, achievements FROM player_stats WHERE name = ?",
+                (name,)).fetchone()
+        if row is None:
+            return None
+        games_played, wins, total_bank, best_bank, achievements = row
+        return {
+            "Games Played": games_played,
+            "Wins": wins,
+            "Average Bank": total_bank / games_played,
+            "Best Bank": best_bank,
+            "Achievements": achievements
+        }
+
+    def close(self):
+        """
+        Writes any buffered games and closes the database, even if writing them fails.
+        """
+        with self.lock:
+            try:
+                self.flush()
+            finally:
+                self.connection.close()
@@ -0,0 +1,322 @@
+import itertools
+import json
+import random
+import re
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from .scenario import DEFAULT_SCENARIO
+from .simulation import HeadlessGame
+from .state_sync import StateTracker
+
+def encode(data):
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+class GameSession:
+    """
+    A game hosted by the API, with its own lock, cached state and observers.
+
+    Attributes:
+        game_id (int): The ID of the game.
+        game (HeadlessGame): The game being played.
+        version (int): Incremented after every applied action; cached responses only last until it changes.
+        on_finish (callable): Called with the session once the game has finished, or None.
+    """
+
+    DELTA_BACKLOG = 1024
+
+    def __init__(self, game_id, game, on_finish=None):
+        self.game_id = game_id
+        self.game = game
+        self.on_finish = on_finish
+        self.lock = threading.Lock()
+        self.version = 0
+        # Viewers (player IDs, or None for spectators) mapped to their state at `cache_version`
+        self.cache = {}
+        self.cache_version = 0
+        self.player_ids = {player.id for player in game.players}
+        self.tracker = StateTracker(game.players, game.gamelogic.market, game.gamelogic.ledger)
+        self.pending = {}
+        self.observer_ids = itertools.count(1)
+
+    def apply(self, player_id, action):
+        """
+        Applies an action for a player whose turn it is.
+
+        Args:
+            player_id (int): The ID of the player acting.
+            action (list): The action, e.g. ["steal", 2].
+
+        Returns:
+            dict: The outcome of the action.
+
+        Raises:
+            PermissionError: If it is not the player's turn.
+            ValueError: If the action is not legal.
+        """
+        with self.lock:
+            current = self.game.current_player
+            if current is None:
+                raise PermissionError("The game has already finished.")
+            if current.id != player_id:
+                raise PermissionError(f"It is Player #{current.id}'s turn.")
+            outcome = self.game.apply(tuple(action))
+            self.version += 1
+            self.cache.clear()
+            self.tracker.record(outcome)
+            for observer_id, delta in self.tracker.flush().items():
+                self.pending[observer_id].append(delta)
+            finished = self.game.finished
+        if finished and self.on_finish is not None:
+            self.on_finish(self)
+        return outcome
+
+    def state(self, player_id=None):
+        """
+        Returns the serialised state of the game, as seen by a player or a spectator.
+
+        Args:
+            player_id (int, optional): The player viewing; they see their own full profile.
+
+        Returns:
+            bytes: The JSON-encoded state, cached per viewer until the next action.
+
+        Raises:
+            LookupError: If there is no such player in the game.
+        """
+        if player_id is not None and player_id not in self.player_ids:
+            raise LookupError(f"There is no player {player_id!r} in game {self.game_id}.")
+        with self.lock:
+            if self.cache_version != self.version:
+                self.cache.clear()
+                self.cache_version = self.version
+            state = self.cache.get(player_id)
+            if state is None:
+                game = self.game
+                current = game.current_player
+                state = self.cache[player_id] = encode({
+                    "game": self.game_id,
+                    "round": game.rounds + (0 if game.finished else 1),
+                    "round_limit": game.round_limit,
+                    "finished": game.finished,
+                    "current_player": current.id if current else None,
+                    "turn_used": game.turn_used,
+                    "players": [player.profile("leaked" if player.id == player_id else "normal")
+                                for player in game.players],
+                    "shop": [{"name": item.name, "price": item.price} for item in game.gamelogic.market.items]
+                })
+            return state
+
+    def add_observer(self, visibility, player_id=None):
+        """
+        Registers an observer that polls for state deltas.
+
+        Returns:
+            tuple: The observer ID and the serialised snapshot to start from.
+        """
+        with self.lock:
+            observer_id = next(self.observer_ids)
+            self.tracker.add_observer(observer_id, visibility, player_id)
+            self.pending[observer_id] = deque(maxlen=self.DELTA_BACKLOG)
+            return observer_id, self.tracker.snapshot(observer_id)
+
+    def take_deltas(self, observer_id):
+        """
+        Takes every delta queued for an observer.
+
+        Returns:
+            bytes: A JSON array of the deltas, oldest first.
+        """
+        with self.lock:
+            if observer_id not in self.pending:
+                raise LookupError(f"There is no observer {observer_id!r}.")
+            deltas = self.pending[observer_id]
+            body = b"[" + b",".join(deltas) + b"]"
+            deltas.clear()
+            return body
+
+class GameServer(ThreadingHTTPServer):
+    """
+    Serves games over HTTP/JSON.
+
+    Endpoints:
+        POST /games                                  {"players": 4, "rounds": 5, "seed": 1}
+        GET  /games/<id>[?player=<id>]
+        POST /games/<id>/actions                     {"player": 1, "action": ["steal", 2]}
+        POST /batch                                  {"actions": [{"game": 1, "player": 1, "action": ["work"]}]}
+        POST /games/<id>/observers                   {"visibility": "normal", "player": 1}
+        GET  /games/<id>/observers/<observer>/deltas
+
+    Attributes:
+        scenario (Scenario): The scenario new games are created with.
+        market (SharedMarket): The shop every game buys from, or None for a shop per game.
+        watcher (ScenarioWatcher): Reloads the scenario new games are created with, or None.
+        sessions (dict): Game IDs mapped to GameSession instances.
+        finished (deque): The IDs of finished games still kept, oldest first.
+        finished_kept (int): The most finished games kept for their final state; older ones are dropped.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, scenario=DEFAULT_SCENARIO, market=None, watcher=None, finished_kept=256):
+        super().__init__(address, GameRequestHandler)
+        self.scenario = scenario
+        self.market = market
+        self.watcher = watcher
+        self.sessions = {}
+        self.finished = deque()
+        self.finished_kept = finished_kept
+        self.game_ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def create_game(self, player_count=4, round_limit=None, seed=None):
+        """
+        Starts a new game.
+
+        With a watcher, the game is created with the latest scenario snapshot and keeps
+        it to the end, while every round it completes lets a newer one go live. Nothing
+        replays a server game's ledger, so it drops transfers once they are committed.
+
+        Returns:
+            GameSession: The new session.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        if self.watcher is None:
+            game = HeadlessGame(seed, player_count, round_limit, self.scenario, market=self.market,
+                                keep_log=False)
+        else:
+            game = HeadlessGame(seed, player_count, round_limit, self.watcher.swap(),
+                                on_event=self.watcher.round_boundary, market=self.market, keep_log=False)
+        with self.lock:
+            game_id = next(self.game_ids)
+            session = self.sessions[game_id] = GameSession(game_id, game, self.retire)
+        return session
+
+    def retire(self, session):
+        """
+        Keeps a finished game for its final state, dropping the oldest finished games beyond `finished_kept`.
+
+        Args:
+            session (GameSession): The session whose game has just finished.
+        """
+        with self.lock:
+            self.finished.append(session.game_id)
+            while len(self.finished) > self.finished_kept:
+                self.sessions.pop(self.finished.popleft(), None)
+
+    def session(self, game_id):
+        """
+        Looks up a game.
+
+        Raises:
+            LookupError: If there is no such game.
+        """
+        try:
+            return self.sessions[int(game_id)]
+        except (KeyError, ValueError):
+            raise LookupError(f"There is no game {game_id!r}.") from None
+
+class GameRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests for a GameServer over keep-alive HTTP/1.1 connections.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ("POST", re.compile(r"^/games$"), "create_game"),
+        ("GET", re.compile(r"^/games/(\d+)$"), "get_game"),
+        ("POST", re.compile(r"^/games/(\d+)/actions$"), "post_action"),
+        ("POST", re.compile(r"^/batch$"), "post_batch"),
+        ("POST", re.compile(r"^/games/(\d+)/observers$"), "post_observer"),
+        ("GET", re.compile(r"^/games/(\d+)/observers/(\d+)/deltas$"), "get_deltas"),
+    ]
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method):
+        url = urlsplit(self.path)
+        for route_method, pattern, handler in self.ROUTES:
+            match = pattern.match(url.path)
+            if match and route_method == method:
+                break
+        else:
+            return self.send_json(404, encode({"error": "Not found."}))
+
+        try:
+            body = self.read_json() if method == "POST" else None
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, data = getattr(self, handler)(body, query, *match.groups())
+        except (ValueError, TypeError, KeyError, AttributeError) as error:
+            status, data = 400, encode({"error": str(error)})
+        except LookupError as error:
+            status, data = 404, encode({"error": str(error)})
+        except PermissionError as error:
+            status, data = 409, encode({"error": str(error)})
+        self.send_json(status, data)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def send_json(self, status, data):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def create_game(self, body, query):
+        session = self.server.create_game(int(body.get("players", 4)), body.get("rounds"), body.get("seed"))
+        return 201, encode({"game": session.game_id, "players": [player.id for player in session.game.players]})
+
+    def get_game(self, body, query, game_id):
+        player_id = int(query["player"]) if "player" in query else None
+        return 200, self.server.session(game_id).state(player_id)
+
+    def post_action(self, body, query, game_id):
+        outcome = self.server.session(game_id).apply(int(body["player"]), body["action"])
+        return 200, encode(outcome)
+
+    def post_batch(self, body, query):
+        results = []
+        for entry in body["actions"]:
+            try:
+                outcome = self.server.session(entry["game"]).apply(int(entry["player"]), entry["action"])
+                results.append({"ok": True, "outcome": outcome})
+            except (LookupError, PermissionError, ValueError, TypeError, AttributeError) as error:
+                results.append({"ok": False, "error": str(error)})
+        return 200, encode({"results": results})
+
+    def post_observer(self, body, query, game_id):
+        player_id = body.get("player")
+        observer_id, snapshot = self.server.session(game_id).add_observer(
+            body.get("visibility", "normal"), None if player_id is None else int(player_id))
+        return 201, b'{"observer":' + str(observer_id).encode("ascii") + b',"snapshot":' + snapshot + b"}"
+
+    def get_deltas(self, body, query, game_id, observer_id):
+        return 200, self.server.session(game_id).take_deltas(int(observer_id))
+
+def serve(host="127.0.0.1", port=8080, scenario=DEFAULT_SCENARIO, market=None, watcher=None):
+    """
+    Runs the API server until interrupted.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        scenario (Scenario): The scenario new games are created with.
+        market (SharedMarket, optional): A shop shared by every game.
+        watcher (ScenarioWatcher, optional): Reloads the scenario new games are created with.
+    """
+    with GameServer((host, port), scenario, market, watcher) as server:
+        server.serve_forever()
@@ -1,143 +1,145 @@
 import random
 
-def income(random_number_1, random_number_2):
-    dollars = random.randint(random_number_1, random_number_2)
-    cents = random.randint(0, 100)
+def income(random_number_1, random_number_2, rng=random):
+    dollars = rng.randint(random_number_1, random_number_2)
+    cents = rng.randint(0, 100)
     return float(f"{dollars}.{cents}")
     
 # lowest - 5
 # highest - 100
-jobs = {
-    "boss": income(16, 73),
-    "witch": income(7, 33),
-    "actor": income(15, 50),
-    "golfer": income(42, 69),
-    "police": income(23, 41),
-    "wizard": income(17, 77),
-    "lawyer": income(60, 79),
-    "doctor": income(10, 100),
-    "cashier": income(5, 15),
-    "janitor": income(10, 15),
-    "manager": income(13, 50),
-    "associate": income(1, 100),
-    "baby maker": income(1, 10),
-    "pet groomer": income(0, 20),
-    "bridge maker": income(45, 65),
-    "fire fighter": income(32, 41),
+job_ranges = {
+    "boss": (16, 73),
+    "witch": (7, 33),
+    "actor": (15, 50),
+    "golfer": (42, 69),
+    "police": (23, 41),
+    "wizard": (17, 77),
+    "lawyer": (60, 79),
+    "doctor": (10, 100),
+    "cashier": (5, 15),
+    "janitor": (10, 15),
+    "manager": (13, 50),
+    "associate": (1, 100),
+    "baby maker": (1, 10),
+    "pet groomer": (0, 20),
+    "bridge maker": (45, 65),
+    "fire fighter": (32, 41),
 
-    "accountant": income(5, 100),
-    "architect": income(5, 100),
-    "artist": income(5, 100),
-    "astronomer": income(5, 100),
-    "author": income(5, 100),
-    "baker": income(5, 100),
-    "banker": income(5, 100),
-    "barista": income(5, 100),
-    "biologist": income(5, 100),
-    "carpenter": income(5, 100),
-    "chef": income(5, 100),
-    "chemist": income(5, 100),
-    "civil engineer": income(5, 100),
-    "coach": income(5, 100),
-    "computer programmer": income(5, 100),
-    "construction worker": income(5, 100),
-    "consultant": income(5, 100),
-    "data analyst": income(5, 100),
-    "dentist": income(5, 100),
-    "designer": income(5, 100),
-    "economist": income(5, 100),
-    "editor": income(5, 100),
-    "electrician": income(5, 100),
-    "engineer": income(5, 100),
-    "farmer": income(5, 100),
-    "graphic designer": income(5, 100),
-    "hairstylist": income(5, 100),
-    "human resources manager": income(5, 100),
-    "insurance agent": income(5, 100),
-    "interior designer": income(5, 100),
-    "IT specialist": income(5, 100),
-    "journalist": income(5, 100),
-    "librarian": income(5, 100),
-    "machinist": income(5, 100),
-    "marketing manager": income(5, 100),
-    "mechanic": income(5, 100),
-    "musician": income(5, 100),
-    "nurse": income(5, 100),
-    "pharmacist": income(5, 100),
-    "photographer": income(5, 100),
-    "physical therapist": income(5, 100),
-    "pilot": income(5, 100),
-    "plumber": income(5, 100),
-    "politician": income(5, 100),
-    "professor": income(5, 100),
-    "project manager": income(5, 100),
-    "psychologist": income(5, 100),
-    "real estate agent": income(5, 100),
-    "researcher": income(5, 100),
-    "retail manager": income(5, 100),
-    "scientist": income(5, 100),
-    "secretary": income(5, 100),
-    "social worker": income(5, 100),
-    "software developer": income(5, 100),
-    "statistician": income(5, 100),
-    "surgeon": income(5, 100),
-    "teacher": income(5, 100),
-    "technician": income(5, 100),
-    "translator": income(5, 100),
-    "truck driver": income(5, 100),
-    "veterinarian": income(5, 100),
-    "videographer": income(5, 100),
-    "waiter/waitress": income(5, 100),
-    "web developer": income(5, 100),
-    "writer": income(5, 100),
+    "accountant": (5, 100),
+    "architect": (5, 100),
+    "artist": (5, 100),
+    "astronomer": (5, 100),
+    "author": (5, 100),
+    "baker": (5, 100),
+    "banker": (5, 100),
+    "barista": (5, 100),
+    "biologist": (5, 100),
+    "carpenter": (5, 100),
+    "chef": (5, 100),
+    "chemist": (5, 100),
+    "civil engineer": (5, 100),
+    "coach": (5, 100),
+    "computer programmer": (5, 100),
+    "construction worker": (5, 100),
+    "consultant": (5, 100),
+    "data analyst": (5, 100),
+    "dentist": (5, 100),
+    "designer": (5, 100),
+    "economist": (5, 100),
+    "editor": (5, 100),
+    "electrician": (5, 100),
+    "engineer": (5, 100),
+    "farmer": (5, 100),
+    "graphic designer": (5, 100),
+    "hairstylist": (5, 100),
+    "human resources manager": (5, 100),
+    "insurance agent": (5, 100),
+    "interior designer": (5, 100),
+    "IT specialist": (5, 100),
+    "journalist": (5, 100),
+    "librarian": (5, 100),
+    "machinist": (5, 100),
+    "marketing manager": (5, 100),
+    "mechanic": (5, 100),
+    "musician": (5, 100),
+    "nurse": (5, 100),
+    "pharmacist": (5, 100),
+    "photographer": (5, 100),
+    "physical therapist": (5, 100),
+    "pilot": (5, 100),
+    "plumber": (5, 100),
+    "politician": (5, 100),
+    "professor": (5, 100),
+    "project manager": (5, 100),
+    "psychologist": (5, 100),
+    "real estate agent": (5, 100),
+    "researcher": (5, 100),
+    "retail manager": (5, 100),
+    "scientist": (5, 100),
+    "secretary": (5, 100),
+    "social worker": (5, 100),
+    "software developer": (5, 100),
+    "statistician": (5, 100),
+    "surgeon": (5, 100),
+    "teacher": (5, 100),
+    "technician": (5, 100),
+    "translator": (5, 100),
+    "truck driver": (5, 100),
+    "veterinarian": (5, 100),
+    "videographer": (5, 100),
+    "waiter/waitress": (5, 100),
+    "web developer": (5, 100),
+    "writer": (5, 100),
 
-    "pirate": income(5, 100),
-    "knight": income(5, 100),
-    "dragon slayer": income(5, 100),
-    "space explorer": income(5, 100),
-    "alien ambassador": income(5, 100),
-    "time traveler": income(5, 100),
-    "superhero": income(5, 100),
-    "mad scientist": income(5, 100),
-    "vampire hunter": income(5, 100),
-    "ghostbuster": income(5, 100),
-    "ninja": income(5, 100),
-    "samurai": income(5, 100),
-    "werewolf tamer": income(5, 100),
-    "robot mechanic": income(5, 100),
-    "cyber detective": income(5, 100),
-    "dream weaver": income(5, 100),
-    "mermaid trainer": income(5, 100),
-    "sorcerer": income(5, 100),
-    "necromancer": income(5, 100),
-    "crypt keeper": income(5, 100),
-    "alchemist": income(5, 100),
-    "oracle": income(5, 100),
-    "monster hunter": income(5, 100),
-    "galactic trader": income(5, 100),
-    "spellcaster": income(5, 100),
-    "jedi": income(5, 100),
-    "sith lord": income(5, 100),
-    "bounty hunter": income(5, 100),
-    "steampunk engineer": income(5, 100),
-    "cyborg technician": income(5, 100),
-    "dungeon master": income(5, 100),
-    "shadow assassin": income(5, 100),
-    "dragon rider": income(5, 100),
-    "elemental mage": income(5, 100),
-    "battle strategist": income(5, 100),
-    "cosmic navigator": income(5, 100),
-    "rune scholar": income(5, 100),
-    "dimension jumper": income(5, 100),
-    "SCP" : income(5, 100),
-    "SCP Agent" : income(5, 100),
-    "secret agent": income(5, 100),
-    "squad leader": income(5, 100),
-    "bank robber": income(5, 100),
+    "pirate": (5, 100),
+    "knight": (5, 100),
+    "dragon slayer": (5, 100),
+    "space explorer": (5, 100),
+    "alien ambassador": (5, 100),
+    "time traveler": (5, 100),
+    "superhero": (5, 100),
+    "mad scientist": (5, 100),
+    "vampire hunter": (5, 100),
+    "ghostbuster": (5, 100),
+    "ninja": (5, 100),
+    "samurai": (5, 100),
+    "werewolf tamer": (5, 100),
+    "robot mechanic": (5, 100),
+    "cyber detective": (5, 100),
+    "dream weaver": (5, 100),
+    "mermaid trainer": (5, 100),
+    "sorcerer": (5, 100),
+    "necromancer": (5, 100),
+    "crypt keeper": (5, 100),
+    "alchemist": (5, 100),
+    "oracle": (5, 100),
+    "monster hunter": (5, 100),
+    "galactic trader": (5, 100),
+    "spellcaster": (5, 100),
+    "jedi": (5, 100),
+    "sith lord": (5, 100),
+    "bounty hunter": (5, 100),
+    "steampunk engineer": (5, 100),
+    "cyborg technician": (5, 100),
+    "dungeon master": (5, 100),
+    "shadow assassin": (5, 100),
+    "dragon rider": (5, 100),
+    "elemental mage": (5, 100),
+    "battle strategist": (5, 100),
+    "cosmic navigator": (5, 100),
+    "rune scholar": (5, 100),
+    "dimension jumper": (5, 100),
+    "SCP" : (5, 100),
+    "SCP Agent" : (5, 100),
+    "secret agent": (5, 100),
+    "squad leader": (5, 100),
+    "bank robber": (5, 100),
 
-    "Winter leader" : income(5, 15),
-    "Trombone Player" : income(5, 50),
-    "Trumpet Player" : income(15, 60),
-    "flute Player" : income(0, 1),
-    "drummer" : income (80, 100)
-}
\ No newline at end of file
+    "Winter leader" : (5, 15),
+    "Trombone Player" : (5, 50),
+    "Trumpet Player" : (15, 60),
+    "flute Player" : (0, 1),
+    "drummer" : (80, 100)
+}
+
+jobs = {title: income(*bounds) for title, bounds in job_ranges.items()}
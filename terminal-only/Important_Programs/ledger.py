@@ -0,0 +1,258 @@
+from array import array
+from contextlib import contextmanager
+
+WORLD = "world"
+
+def _amount(value):
+    # Balances may still be in BankManagement.format_currency's "$1_000.00" form
+    if isinstance(value, str):
+        return float(value.replace("$", "").replace("_", ""))
+    return float(value)
+
+class Ledger:
+    """
+    A double-entry record of every change to players' bank and safe balances.
+
+    Every change is a transfer between two accounts: a player's "bank" or "safe", or
+    the "world" account that wages, rewards, purchases and interest are paid from and
+    into, so all balances always sum to zero. Transfers are appended to parallel
+    arrays rather than stored as objects, and each account's running balance is
+    cached so reading it is O(1). The cached balance is written through to the
+    player's attribute, so the rest of the game keeps reading `player.bank` and
+    `player.safe` as before.
+
+    Amounts and balances are kept to whole cents, like the rest of the game, so rolling
+    back to a savepoint by reversing entries restores every balance exactly without
+    copying any player. The ledger only covers money; inventories are not rolled back.
+
+    Without `keep_log`, e.g. for bulk headless runs, committed entries are folded into
+    the opening balances and dropped from the log whenever no transaction is open, so
+    the log only ever holds what could still be rolled back. Balances, savepoints,
+    rollbacks and audits work the same; only `entries` no longer sees dropped entries.
+
+    Attributes:
+        committed (int): The number of entries that can no longer be rolled back.
+        keep_log (bool): Whether committed entries are kept for `entries` and replays.
+        dropped (int): The number of committed entries dropped from the front of the log.
+        listener (callable): Called with every player whose balance changes, e.g. a StateTracker
+            following interest that is accrued outside any action; None for no listener.
+    """
+
+    def __init__(self, keep_log=True):
+        self.keys = [WORLD]
+        self.index = {WORLD: 0}
+        self.owners = [None]
+        self.balances = [0.0]
+        self.openings = [0.0]
+        self.kind_names = []
+        self.kind_codes = {}
+        self.sources = array("l")
+        self.destinations = array("l")
+        self.amounts = array("d")
+        self.kinds = array("H")
+        self.committed = 0
+        self.keep_log = keep_log
+        self.dropped = 0
+        self.depth = 0
+        self.listener = None
+
+    def __len__(self):
+        return self.dropped + len(self.amounts)
+
+    def account(self, player, field="bank"):
+        """
+        Returns the index of a player's account, opening it on first use.
+
+        An opened account starts with the player's current balance, taken from the
+        world account. Openings are kept outside the log, so rolling back never closes
+        an account.
+
+        Args:
+            player (Player): The account's owner.
+            field (str): "bank" or "safe".
+
+        Returns:
+            int: The account's index.
+        """
+        key = (player.id, field)
+        index = self.index.get(key)
+        if index is None:
+            index = self.index[key] = len(self.keys)
+            self.keys.append(key)
+            self.owners.append((player, field))
+            opening = _amount(getattr(player, field))
+            self.balances.append(opening)
+            self.openings.append(opening)
+            self.balances[0] -= opening
+            self.openings[0] -= opening
+        return index
+
+    def balance(self, player, field="bank"):
+        """
+        Returns a player's cached balance.
+
+        Args:
+            player (Player): The account's owner.
+            field (str): "bank" or "safe".
+
+        Returns:
+            float: The balance.
+        """
+        return self.balances[self.account(player, field)]
+
+    def post(self, source, destination, amount, kind):
+        """
+        Appends a transfer between two account indexes and updates their cached balances.
+
+        Args:
+            source (int): The index of the account the money leaves.
+            destination (int): The index of the account the money enters.
+            amount (float): The amount moved, rounded to cents; negative amounts move money the other way.
+            kind (str): What the transfer was for, e.g. "work".
+        """
+        amount = round(amount, 2)
+        code = self.kind_codes.get(kind)
+        if code is None:
+            code = self.kind_codes[kind] = len(self.kind_names)
+            self.kind_names.append(kind)
+        self.sources.append(source)
+        self.destinations.append(destination)
+        self.amounts.append(amount)
+        self.kinds.append(code)
+        self._move(source, destination, amount)
+
+    def _move(self, source, destination, amount):
+        for index, change in ((source, -amount), (destination, amount)):
+            self.balances[index] = balance = round(self.balances[index] + change, 2)
+            owner = self.owners[index]
+            if owner is not None:
+                setattr(owner[0], owner[1], balance)
+                if self.listener is not None:
+                    self.listener(owner[0])
+
+    def pay(self, player, amount, kind, field="bank"):
+        """
+        Moves money from the world into a player's account, or out of it if the amount is negative.
+
+        Args:
+            player (Player): The account's owner.
+            amount (float): The amount paid.
+            kind (str): What the payment was for.
+            field (str): "bank" or "safe".
+        """
+        self.post(0, self.account(player, field), amount, kind)
+
+    def transfer(self, source, destination, amount, kind, source_field="bank", destination_field="bank"):
+        """
+        Moves money between two players' accounts, or between one player's bank and safe.
+
+        Args:
+            source (Player): The player the money leaves.
+            destination (Player): The player the money enters.
+            amount (float): The amount moved.
+            kind (str): What the transfer was for.
+            source_field (str): The source account, "bank" or "safe".
+            destination_field (str): The destination account, "bank" or "safe".
+        """
+        self.post(self.account(source, source_field), self.account(destination, destination_field), amount, kind)
+
+    def savepoint(self):
+        """
+        Marks the current end of the log.
+
+        Returns:
+            int: The savepoint, to pass to `rollback`.
+        """
+        return len(self)
+
+    def rollback(self, savepoint):
+        """
+        Undoes every entry after a savepoint by moving its amount back.
+
+        Args:
+            savepoint (int): A value returned by `savepoint`.
+
+        Raises:
+            ValueError: If the savepoint is before the last commit.
+        """
+        if savepoint < self.committed:
+            raise ValueError("Cannot roll back past the last commit.")
+        start = savepoint - self.dropped
+        for entry in range(len(self.amounts) - 1, start - 1, -1):
+            self._move(self.destinations[entry], self.sources[entry], self.amounts[entry])
+        for log in (self.sources, self.destinations, self.amounts, self.kinds):
+            del log[start:]
+
+    def commit(self):
+        """
+        Commits every entry since the last commit as one batch.
+
+        Without `keep_log`, every committed entry is then dropped from the log, unless a
+        transaction is still open.
+
+        Returns:
+            int: The number of entries committed.
+        """
+        batch = len(self) - self.committed
+        self.committed = len(self)
+        if not self.keep_log and not self.depth:
+            self._drop(len(self.amounts))
+        return batch
+
+    def _drop(self, count):
+        # Fold the first `count` entries into the opening balances, so audits still balance without them
+        for source, destination, amount in zip(self.sources[:count], self.destinations[:count], self.amounts[:count]):
+            for index, change in ((source, -amount), (destination, amount)):
+                self.openings[index] = round(self.openings[index] + change, 2)
+        for log in (self.sources, self.destinations, self.amounts, self.kinds):
+            del log[:count]
+        self.dropped += count
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups transfers so they are committed together, or rolled back together if an exception escapes.
+        """
+        savepoint = self.savepoint()
+        self.depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.depth -= 1
+            self.rollback(savepoint)
+            raise
+        self.depth -= 1
+        self.commit()
+
+    def entries(self, start=0, stop=None):
+        """
+        Iterates over logged transfers, e.g. for audits or replays.
+
+        Entries dropped from the log (see `keep_log`) are skipped.
+
+        Args:
+            start (int): The first entry.
+            stop (int, optional): The entry to stop before. Defaults to the end of the log.
+
+        Yields:
+            tuple: (kind, source key, destination key, amount); player accounts are keyed
+            (player ID, field) and the world account is "world".
+        """
+        stop = len(self) if stop is None else stop
+        for entry in range(max(start, self.dropped) - self.dropped, stop - self.dropped):
+            yield (self.kind_names[self.kinds[entry]], self.keys[self.sources[entry]],
+                   self.keys[self.destinations[entry]], self.amounts[entry])
+
+    def audit(self):
+        """
+        Replays the whole log and checks it against the cached balances.
+
+        Returns:
+            list: The keys of accounts whose cached balance does not match the replay.
+        """
+        replayed = list(self.openings)
+        for source, destination, amount in zip(self.sources, self.destinations, self.amounts):
+            for index, change in ((source, -amount), (destination, amount)):
+                replayed[index] = round(replayed[index] + change, 2)
+        return [self.keys[index] for index, (cached, expected) in enumerate(zip(self.balances, replayed))
+                if abs(cached - expected) > 1e-6]
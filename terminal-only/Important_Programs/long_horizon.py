@@ -0,0 +1,106 @@
+import math
+from .simulation import HeadlessGame
+
+# Strategies whose every action is known in advance, so their turns can be settled in closed form
+IDLE_STRATEGIES = ("worker",)
+
+class LongHorizonGame(HeadlessGame):
+    """
+    Plays endurance games of any length, fast-forwarding players who only work.
+
+    Players on an idle strategy never take a turn. They earn `job_income` for every
+    work a turn fits (two per round with the default costs), and their banks are
+    settled lazily in closed form by `update_balances`: before a strategy that compares
+    banks and when the game ends, or on their own when another player steals from them. Each round therefore costs
+    as much as its active players' turns, however many idle players there are.
+
+    Idle players emit no turn or action events, and their banks lag behind between
+    settlements. Bank interest on their pay is settled in closed form too.
+
+    Attributes:
+        idle (dict): Idle player IDs mapped to their Player instances.
+        seats (dict): Player IDs mapped to their position in the full turn order.
+        settled (dict): Idle player IDs mapped to the number of rounds already credited to them.
+        works_per_round (int): How many times an idle player works in a round.
+    """
+
+    def __init__(self, seed, player_count=4, round_limit=None, scenario=None, strategies=("random",),
+                 on_event=None, keep_log=True):
+        super().__init__(seed, player_count, round_limit, scenario, strategies, on_event, keep_log=keep_log)
+        self.seats = {player.id: seat for seat, player in enumerate(self.turn_order)}
+        self.idle = {player.id: player for player in self.turn_order if self.strategies[player.id] in IDLE_STRATEGIES}
+        self.turn_order = [player for player in self.turn_order if player.id not in self.idle]
+        self.settled = dict.fromkeys(self.idle, 0)
+        self.works_per_round = math.ceil(self.TURN_LIMIT / self.ACTION_COSTS["work"])
+
+    @property
+    def current_player(self):
+        return None if self.finished or not self.turn_order else self.turn_order[self.current_index]
+
+    def rounds_played(self, player):
+        """
+        Counts the rounds in which a player's turn has come around so far.
+
+        Args:
+            player (Player): The player to count for.
+
+        Returns:
+            int: The number of rounds the player has had a turn in.
+        """
+        if self.finished:
+            return self.rounds
+        current = self.turn_order[self.current_index]
+        return self.rounds + (1 if self.seats[player.id] < self.seats[current.id] else 0)
+
+    def settle(self, player):
+        """
+        Credits an idle player with the work from every round they have not been paid for yet.
+
+        Args:
+            player (Player): The idle player to settle.
+        """
+        accounts = self.gamelogic.accounts
+        accounts.accrue(player)
+        owed = self.rounds_played(player) - self.settled[player.id]
+        if owed <= 0:
+            return
+        # The pay from each owed round has earned bank interest for every round completed since
+        fewest_rounds = self.rounds - (self.settled[player.id] + owed - 1)
+        pay = accounts.compound_series(self.works_per_round * player.job_income, accounts.bank_rate(player),
+                                       fewest_rounds, owed)
+        self.gamelogic.ledger.pay(player, pay, "work")
+        self.action_counts[player.id]["work"] += owed * self.works_per_round
+        self.settled[player.id] += owed
+
+    def update_balances(self):
+        """
+        Settles every idle player, then brings everyone's interest up to date.
+        """
+        for player in self.idle.values():
+            self.settle(player)
+        super().update_balances()
+
+    def apply(self, action):
+        if not self.turn_order and not self.finished:
+            raise ValueError("Only idle players are left; use start_game to fast-forward the game.")
+        return super().apply(action)
+
+    def resolve_action(self, player, action):
+        if (isinstance(action, (tuple, list)) and len(action) == 2 and action[0] == "steal"
+                and isinstance(action[1], int) and action[1] in self.idle):
+            self.settle(self.idle[action[1]])
+        return super().resolve_action(player, action)
+
+    def start_game(self):
+        """
+        Plays the game to the end, only simulating the turns of active players.
+
+        Returns:
+            GameResult: The outcome of the game.
+        """
+        if not self.turn_order:
+            self.rounds = self.round_limit
+            self.gamelogic.accounts.advance(self.rounds)
+            self.finished = True
+            self.check_game_end()
+        return super().start_game()
@@ -0,0 +1,241 @@
+import gc
+import sys
+import tracemalloc
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from . import ledger
+from .ulits import log
+
+# Objects that are shared by every game or are code rather than state, and are never counted
+SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+def deep_size(roots, seen):
+    """
+    Measures the memory held by some objects and everything they reach that has not been seen yet.
+
+    Args:
+        roots (iterable): The objects to start from.
+        seen (set): IDs of objects already counted elsewhere; updated with every object counted.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = 0
+    pending = list(roots)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SKIPPED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+class MemoryReport:
+    """
+    Accounts for the memory a game retains at every round boundary and flags steady growth.
+
+    At each boundary, garbage is collected and the live game state is walked, category by
+    category, in the order of CATEGORIES: Item instances, inventories (the lists only),
+    players (everything else they hold), journals (the ledger and interest account book),
+    market state, and logs (whatever the game's event callback keeps, e.g. the dashboard's
+    event log). Anything reached through an earlier category is not counted again, and the
+    scenario and random number generator are shared, so they are left out. tracemalloc
+    supplies the total traced memory, which also covers whatever outlives a game, and
+    the allocation sites that grew since the previous boundary.
+
+    A category that grew at each of the last `window` boundaries by at least `threshold`
+    bytes in all is reported as a suspected leak. A ledger that keeps its log grows with
+    every transfer by design, so Journals are only compared between games, from each
+    game's last boundary: what matters is whether they start over with the next game.
+    For the same reason, the traced memory is checked per round without whatever the
+    ledger allocated. The traced total, less the report's own samples, is also kept at the end of
+    every game after the first, so a restart loop that never returns to its baseline is flagged the
+    same way.
+
+    Attributes:
+        samples (deque): (label, {category: bytes}) pairs, one per round boundary.
+        game_totals (deque): The traced total at the end of each game after the first, without the
+            report's own memory.
+        game_journals (deque): The Journals at the last round boundary of each game.
+        growth (list): The allocation sites that grew most at the last boundary, as
+            tracemalloc StatisticDiff instances.
+    """
+
+    CATEGORIES = ("Items", "Inventories", "Players", "Journals", "Market", "Logs")
+    # Categories that grow within a game by design, so they are only compared between games
+    PER_GAME = ("Journals",)
+
+    def __init__(self, window=3, threshold=1024, top=5, history=1000):
+        """
+        Sets up a report and starts tracemalloc if it is not already tracing.
+
+        Args:
+            window (int): The boundaries in a row a category must grow at to be flagged.
+            threshold (int): The least growth in bytes over the window to flag.
+            top (int): The most allocation sites listed for a suspected leak.
+            history (int): The most round boundaries and games kept, so a report left running
+                for hours does not grow without bound itself.
+        """
+        self.window = window
+        self.threshold = threshold
+        self.top = top
+        self.samples = deque(maxlen=history)
+        self.game_totals = deque(maxlen=history)
+        self.game_journals = deque(maxlen=history)
+        self.growth = []
+        self.games = 0
+        self.game = None
+        self.forward = None
+        self.snapshot = None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def watch(self, game):
+        """
+        Measures a game at every round boundary, keeping its existing event callback.
+
+        Args:
+            game (GamePlay): The game, e.g. a GamePlay or HeadlessGame.
+        """
+        self.game = game
+        self.forward = game.on_event
+        game.on_event = self.record_event
+
+    def record_event(self, event_type, payload):
+        if self.forward is not None:
+            self.forward(event_type, payload)
+        if event_type == "round_complete":
+            self.measure(f"Game {self.games + 1}, round {payload['round']}")
+        elif event_type == "game_over":
+            self.games += 1
+            # The first game also pays for one-off allocations, e.g. caches filled on first use
+            if self.games > 1:
+                self.game_totals.append(sum(stat.size for stat in self.traced_snapshot().statistics("filename")))
+            if self.samples:
+                self.game_journals.append(self.samples[-1][1]["Journals"])
+
+    def measure(self, label):
+        """
+        Measures every category of the watched game.
+
+        Args:
+            label (str): The name of the boundary in the report.
+
+        Returns:
+            dict: Category names mapped to bytes, plus "Traced" for the total traced memory and
+            "Traced less Journals" for what was traced outside the ledger.
+        """
+        gc.collect()
+        game = self.game
+        logic = game.gamelogic
+        players = list(game.players)
+        inventories = [player.inventory for player in players]
+        seen = {id(logic.scenario), id(logic.market.rng), id(game)}
+        sizes = {
+            "Items": deep_size([item for inventory in inventories for item in inventory] + list(logic.market.items),
+                               seen),
+            "Inventories": deep_size(inventories, seen),
+            "Players": deep_size(players, seen),
+            "Journals": deep_size([logic.ledger, logic.accounts], seen),
+            "Market": deep_size([logic.market], seen),
+            "Logs": deep_size([] if self.forward is None else [self.forward], seen),
+            "Traced": tracemalloc.get_traced_memory()[0]
+        }
+        snapshot = self.traced_snapshot()
+        # What the ledger allocates grows with every transfer by design, so the per-round check leaves it out
+        sizes["Traced less Journals"] = sum(
+            stat.size for stat in snapshot.filter_traces([tracemalloc.Filter(False, ledger.__file__)])
+            .statistics("filename"))
+        if self.snapshot is not None:
+            self.growth = [stat for stat in snapshot.compare_to(self.snapshot, "lineno") if stat.size_diff > 0]
+        self.snapshot = snapshot
+        self.samples.append((label, sizes))
+        return sizes
+
+    def traced_snapshot(self):
+        """
+        Takes a tracemalloc snapshot without the report's own samples and snapshots.
+
+        Returns:
+            tracemalloc.Snapshot: The filtered snapshot.
+        """
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__),
+                                                          tracemalloc.Filter(False, tracemalloc.__file__)])
+
+    def growing(self, values):
+        """
+        Checks whether a series grew at each of its last `window` steps by at least `threshold` in all.
+
+        Args:
+            values (iterable): The series, oldest first.
+
+        Returns:
+            int: The growth over the window, or 0 if it did not grow steadily.
+        """
+        recent = list(values)[-self.window - 1:]
+        if len(recent) <= self.window:
+            return 0
+        if all(later > earlier for earlier, later in zip(recent, recent[1:])) and \
+                recent[-1] - recent[0] >= self.threshold:
+            return recent[-1] - recent[0]
+        return 0
+
+    def suspected_leaks(self):
+        """
+        Lists what grew steadily over the last few round boundaries or games.
+
+        Returns:
+            list: (what, bytes grown) pairs.
+        """
+        leaks = []
+        for category in self.CATEGORIES:
+            if category not in self.PER_GAME:
+                growth = self.growing(sizes[category] for _, sizes in self.samples)
+                if growth:
+                    leaks.append((category, growth))
+        growth = self.growing(sizes["Traced less Journals"] for _, sizes in self.samples)
+        if growth:
+            leaks.append(("Traced less Journals", growth))
+        for what, series in (("Journals between games", self.game_journals),
+                             ("Traced between games", self.game_totals)):
+            growth = self.growing(series)
+            if growth:
+                leaks.append((what, growth))
+        return leaks
+
+    def lines(self, last=None):
+        """
+        Lays out the report.
+
+        Args:
+            last (int, optional): Only show this many of the latest round boundaries.
+
+        Returns:
+            list: The report's lines.
+        """
+        columns = (*self.CATEGORIES, "Traced")
+        lines = ["Retained memory in KiB:", f"{'Boundary':<24}" + "".join(f"{name:>12}" for name in columns)]
+        for label, sizes in list(self.samples)[-last if last else 0:]:
+            lines.append(f"{label:<24}" + "".join(f"{sizes[name] / 1024:>12.1f}" for name in columns))
+        leaks = self.suspected_leaks()
+        for what, growth in leaks:
+            steps = "games" if what.endswith("between games") else "round boundaries"
+            lines.append(f"Suspected leak: {what} grew at each of the last {self.window} {steps} "
+                         f"(+{growth / 1024:.1f} KiB).")
+        if leaks and self.growth:
+            lines.append("Allocation sites that grew most since the previous round:")
+            for stat in self.growth[:self.top]:
+                frame = stat.traceback[0]
+                lines.append(f"  {frame.filename}:{frame.lineno}: +{stat.size_diff / 1024:.1f} KiB")
+        return lines
+
+    def log_report(self, last=None):
+        """
+        Logs the report.
+
+        Args:
+            last (int, optional): Only show this many of the latest round boundaries.
+        """
+        for line in self.lines(last):
+            log(line)
@@ -23,6 +23,52 @@ class Player:
     inventory : list['Item'] = field(default_factory=list)
     # safe : float
 
+    PROFILE_FIELDS = {
+        "ID": "id",
+        "Name": "name",
+        "Age": "age",
+        "Job Title": "job_title",
+        "Job Income": "job_income",
+        "Bank": "bank",
+        "Inventory": "inventory",
+        "Safe": "safe"
+    }
+
+    # The profile fields each visibility level may see; everything else is "Redacted".
+    VISIBILITY = {
+        "redacted": ("ID",),
+        "normal": ("ID", "Name", "Age", "Job Title"),
+        "bank": ("ID", "Name", "Age", "Job Title", "Job Income", "Bank"),
+        "leaked": tuple(PROFILE_FIELDS)
+    }
+
+    def profile_value(self, key):
+        """
+        Returns the value of a single profile field.
+
+        Args:
+            key (str): The profile field, e.g. "Bank".
+
+        Returns:
+            The field's value, with inventory items as dictionaries.
+        """
+        if key == "Inventory":
+            return [item.__dict__ for item in self.inventory]
+        return getattr(self, self.PROFILE_FIELDS[key])
+
+    def profile(self, visibility):
+        """
+        Returns the player's profile as seen at a visibility level.
+
+        Args:
+            visibility (str): One of "redacted", "normal", "bank" or "leaked".
+
+        Returns:
+            dict: A dictionary with the profile information.
+        """
+        visible = self.VISIBILITY[visibility]
+        return {key: self.profile_value(key) if key in visible else "Redacted" for key in self.PROFILE_FIELDS}
+
     def redacted_profile(self):
         """
         Returns a redacted version of the player's profile.
@@ -30,16 +76,7 @@ class Player:
         Returns:
             dict: A dictionary with the redacted profile information.
         """
-        return {
-                "ID": self.id,
-                "Name": "Redacted",
-                "Age": "Redacted",
-                "Job Title": "Redacted",
-                "Job Income": "Redacted",
-                "Bank": "Redacted",
-                "Inventory": "Redacted",
-                "Safe": "Redacted"
-            }
+        return self.profile("redacted")
     
     def normal_profile(self):
         """
@@ -48,16 +85,7 @@ class Player:
         Returns:
             dict: A dictionary with the redacted profile information.
         """
-        return {
-                "ID": self.id,
-                "Name": self.name,
-                "Age": self.age,
-                "Job Title": self.job_title,
-                "Job Income": "Redacted",
-                "Bank": "Redacted",
-                "Inventory": "Redacted",
-                "Safe": "Redacted"
-            }
+        return self.profile("normal")
     
     def bank_detailed__profile(self):
         """
@@ -67,16 +95,7 @@ class Player:
             dict: A dictionary with the player profile information. 
             Id, Name, Age, Job_Title
         """
-        return {
-                "ID": self.id,
-                "Name": self.name,
-                "Age": self.age,
-                "Job Title": self.job_title,
-                "Job Income": self.job_income,
-                "Bank": self.bank,
-                "Inventory": "Redacted",
-                "Safe": "Redacted"
-            }
+        return self.profile("bank")
     
     def leaked_profile(self):
         """
@@ -86,13 +105,4 @@ class Player:
             dict: A dictionary with the player profile information. 
             Id, Name, Age, Job_Title
         """
-        return {
-                "ID": self.id,
-                "Name": self.name,
-                "Age": self.age,
-                "Job Title": self.job_title,
-                "Job Income": self.job_income,
-                "Bank": self.bank,
-                "Inventory": [item.__dict__ for item in self.inventory],
-                "Safe": self.safe
-            }
\ No newline at end of file
+        return self.profile("leaked")
\ No newline at end of file
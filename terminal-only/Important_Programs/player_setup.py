@@ -4,15 +4,18 @@ from .ulits import log, clear_terminal, new_line
 from .names import names
 from .game_logic import BankManagement
 
-def full_name():
+def full_name(rng=random):
     """
     Generates a full name by combining a first name and last name from the names list.
     
+    Args:
+        rng (random.Random, optional): The random number generator to pick names with.
+
     Returns:
         str: A full name in the format "First Last".
     """
-    first_name = random.choice(names).title()
-    last_name = random.choice(names).title()
+    first_name = rng.choice(names).title()
+    last_name = rng.choice(names).title()
     return f"{first_name}, {last_name}"
 
 class Startup:
@@ -67,12 +70,12 @@ class Startup:
             bool: True if all players are ready, False otherwise.
         """
         while True:
-            ready = input("Are you ready to start the game? (yes/no): ").lower()
+            ready = self.security.read_line("Are you ready to start the game? (yes/no): ", sanitize=False).lower()
             if (ready in ["yes", "y", "1"]):
                 clear_terminal()
                 return True
             elif (ready == "no") or (ready == "n") or (ready == "0"):
-                str(input("Press the [Enter key] when you are ready to start the game..."))
+                self.security.read_line("Press the [Enter key] when you are ready to start the game...", sanitize=False)
                 clear_terminal()
                 return True
             else:
@@ -86,14 +89,16 @@ class Startup:
         Returns:
             int: The chosen round limit.
         """
+        round_choices = self.gamelogic.scenario.round_choices
+        choices = "/".join(str(choice) for choice in round_choices)
         while True:
             try:
-                round_limit = int(input("How many rounds do you want to play? (5/10/15): "))
+                round_limit = int(self.security.read_line(f"How many rounds do you want to play? ({choices}): ", sanitize=False))
                 clear_terminal()
-                if round_limit in [5, 10, 15]:
+                if round_limit in round_choices:
                     return round_limit
                 else:
-                    log("Invalid round limit. Please choose 5, 10, or 15.")
+                    log(f"Invalid round limit. Please choose {', '.join(str(choice) for choice in round_choices)}.")
             except ValueError:
                 log("Error. Invalid input. Please input an integer.")
     
@@ -115,7 +120,7 @@ class Startup:
             log(f"   Inventory: {player.inventory}")
             log(f"   Safe: {BankManagement.format_currency(player.safe)}")
             new_line()
-            ready_to_start = input(f"{player.id}. Do you want to change your name? (yes/no): ").lower()
+            ready_to_start = self.security.read_line(f"{player.id}. Do you want to change your name? (yes/no): ", sanitize=False).lower()
             if (ready_to_start == "yes") or (ready_to_start == "y") or (ready_to_start == "1"):
                 self.enter_custom_names(player)
             else:
@@ -129,7 +134,7 @@ class Startup:
             players (list): A list of Player instances.
         """
         log("\nEnter your custom name player -> (first name, last name):")
-        custom_name = self.security.sanitize_input(input(f"Enter your custom name, Player #{player.id}: "))
+        custom_name = self.security.read_line(f"Enter your custom name, Player #{player.id}: ")
         if custom_name:
             player.name = custom_name
             clear_terminal()
@@ -141,22 +146,23 @@ class Startup:
         log("Let's try this again.")
         self.start_setup()
 
-    def adding_players_info(self, number_of_users):
+    def adding_players_info(self, number_of_users, rng=random):
         """
         Creates a list of Player instances with random information.
         
         Args:
             number_of_users (int): The number of players.
+            rng (random.Random, optional): The random number generator to draw player details from.
         
         Returns:
             list: A list of Player instances.
         """
         players = []
         for id in range(1, number_of_users + 1):  # Assign unique IDs starting from 1
-            name = full_name()
-            age = random.randint(18, 65)
+            name = full_name(rng)
+            age = rng.randint(18, 65)
             job_title, job_income = self.gamelogic.get_job()
-            bank = 40000.0
+            bank = self.gamelogic.scenario.starting_bank
             inventory = []
             safe = 0
             players.append(Player(id, name, age, job_title, job_income, bank, safe, inventory))
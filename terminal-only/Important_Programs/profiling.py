@@ -0,0 +1,196 @@
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from .ulits import log
+
+# The game logic classes samples are grouped by in the hotspot table
+SUBSYSTEMS = ("BankManagement", "Employment", "CriminalActivity", "Exploration", "Market", "ItemsUsage")
+
+def frame_name(code):
+    """
+    Names a code object the way collapsed stacks show it, e.g. "game_logic.Market.buy".
+
+    Args:
+        code (CodeType): The code object of a frame.
+
+    Returns:
+        str: The module file's name without ".py", then the function's qualified name.
+    """
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}.{code.co_qualname}"
+
+def subsystem_of(stack):
+    """
+    Finds the subsystem a sampled stack was spending its time in.
+
+    Args:
+        stack (tuple): Frame names, outermost first.
+
+    Returns:
+        str: The innermost SUBSYSTEMS class on the stack, or "Other".
+    """
+    for name in reversed(stack):
+        owner = name.split(".")[1] if name.count(".") > 1 else None
+        if owner in SUBSYSTEMS:
+            return owner
+    return "Other"
+
+class SamplingProfiler:
+    """
+    Samples the main thread's stack at a fixed interval of CPU time.
+
+    Where the platform has interval timers, SIGPROF interrupts the program every
+    `interval` seconds of CPU time and the signal handler records the stack it
+    interrupted, so time spent waiting for input is not sampled and nothing runs
+    between samples. Elsewhere a background thread samples the main thread's stack
+    every `interval` seconds of wall time instead.
+
+    Attributes:
+        interval (float): The seconds between samples.
+        stacks (Counter): Stacks (tuples of frame names, outermost first) mapped to their samples.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self.names = {}
+        self.thread = None
+        self.previous = None
+        self.running = False
+
+    def record(self, frame):
+        """
+        Adds one sample of a stack.
+
+        Args:
+            frame (FrameType): The innermost frame of the stack.
+        """
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            name = self.names.get(code)
+            if name is None:
+                name = self.names[code] = frame_name(code)
+            names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        self.stacks[tuple(names)] += 1
+
+    def sample(self, signum, frame):
+        self.record(frame)
+
+    def poll(self, thread_id):
+        while self.running:
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                self.record(frame)
+            time.sleep(self.interval)
+
+    def start(self):
+        """
+        Starts sampling the calling thread, which must be the main thread.
+        """
+        self.running = True
+        if hasattr(signal, "setitimer"):
+            self.previous = signal.signal(signal.SIGPROF, self.sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self.thread = threading.Thread(target=self.poll, args=(threading.get_ident(),), daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """
+        Stops sampling.
+        """
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        else:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self.previous)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def write_collapsed(self, path):
+        """
+        Writes the samples as collapsed stacks, one "frame;frame;frame count" line per stack,
+        which flamegraph.pl, speedscope and inferno read directly.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{';'.join(stack)} {count}\n")
+
+    def hotspots(self, top=5):
+        """
+        Groups the samples by subsystem and finds the functions each one spends its time in.
+
+        A sample belongs to the innermost subsystem class on its stack, and counts
+        toward the function it was interrupted in (its self time).
+
+        Args:
+            top (int): The most functions listed per subsystem.
+
+        Returns:
+            list: (subsystem, samples, [(function, samples)]) triples, busiest subsystem first.
+        """
+        groups = defaultdict(Counter)
+        for stack, count in self.stacks.items():
+            groups[subsystem_of(stack)][stack[-1] if stack else "?"] += count
+        table = [(subsystem, sum(functions.values()), functions.most_common(top))
+                 for subsystem, functions in groups.items()]
+        return sorted(table, key=lambda row: row[1], reverse=True)
+
+    def hotspot_lines(self, top=5):
+        """
+        Lays out the hotspot table.
+
+        Args:
+            top (int): The most functions listed per subsystem.
+
+        Returns:
+            list: The table's lines.
+        """
+        total = sum(self.stacks.values()) or 1
+        lines = [f"{'Subsystem / function':<60} {'Samples':>8} {'Share':>7}"]
+        for subsystem, samples, functions in self.hotspots(top):
+            lines.append(f"{subsystem:<60} {samples:>8} {samples / total:>7.1%}")
+            for function, count in functions:
+                lines.append(f"  {function:<58} {count:>8} {count / total:>7.1%}")
+        return lines
+
+@contextmanager
+def profile_run(path, interval=0.001, top=5):
+    """
+    Profiles a block of code, then writes its collapsed stacks and logs its hotspot table.
+
+    Args:
+        path (str): The file to write the collapsed stacks to.
+        interval (float): The seconds between samples.
+        top (int): The most functions listed per subsystem.
+
+    Yields:
+        SamplingProfiler: The running profiler.
+    """
+    profiler = SamplingProfiler(interval)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.write_collapsed(path)
+        log(f"Wrote {sum(profiler.stacks.values())} samples to {path}.")
+        for line in profiler.hotspot_lines(top):
+            log(line)
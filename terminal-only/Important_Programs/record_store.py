@@ -0,0 +1,268 @@
+import json
+import os
+import struct
+from .registry import ACTIONS
+from .scenario import DEFAULT_SCENARIO
+
+MAGIC = b"MGREC001"
+# The magic, then the length of the JSON header that follows it
+PREAMBLE = struct.Struct("<8sI")
+# Records start at a multiple of this, so they can be memory-mapped straight from the file
+ALIGNMENT = 64
+MISSING = 0xFFFF
+# The header fields two record files must share for their records to mean the same thing
+LAYOUT = ("max_players", "actions", "jobs", "strategies")
+
+def record_format(max_players, action_count):
+    """
+    Builds the struct format of one record.
+
+    A record is the seed, round limit and player count of a game, followed by one slot
+    per seat (player ID order) holding that player's final bank, safe, job index, rank,
+    strategy index and a count per action. Unused seats are zero-filled. Everything is
+    little-endian with no padding.
+
+    Args:
+        max_players (int): The number of seats in every record.
+        action_count (int): The number of actions counted per player.
+
+    Returns:
+        str: The struct format.
+    """
+    return "<qIH" + ("ddHHB" + "I" * action_count) * max_players
+
+def record_dtype(header):
+    """
+    Builds the NumPy dtype of a record, laid out exactly like `record_format`.
+
+    Args:
+        header (dict): A record file's header.
+
+    Returns:
+        numpy.dtype: The structured dtype.
+    """
+    import numpy
+    player = [("bank", "<f8"), ("safe", "<f8"), ("job", "<u2"), ("rank", "<u2"), ("strategy", "u1"),
+              ("actions", "<u4", (len(header["actions"]),))]
+    return numpy.dtype([("seed", "<i8"), ("round_limit", "<u4"), ("player_count", "<u2"),
+                        ("players", player, (header["max_players"],))])
+
+def read_header(file):
+    """
+    Reads a record file's header and leaves the file positioned at the first record.
+
+    Args:
+        file (BinaryIO): The record file.
+
+    Returns:
+        dict: The header; "offset" holds the position of the first record.
+
+    Raises:
+        ValueError: If the file is not a record file.
+    """
+    preamble = file.read(PREAMBLE.size)
+    if len(preamble) < PREAMBLE.size or PREAMBLE.unpack(preamble)[0] != MAGIC:
+        raise ValueError("Not a Money-Game record file.")
+    header = json.loads(file.read(PREAMBLE.unpack(preamble)[1]))
+    file.seek(header["offset"])
+    return header
+
+def check_whole_records(path, size, header, record):
+    """
+    Checks that a record file holds whole records only, e.g. before appending to it or copying it.
+
+    Args:
+        path (str): The record file, for the message.
+        size (int): The size of the file in bytes.
+        header (dict): The file's header.
+        record (struct.Struct): The layout of one record.
+
+    Raises:
+        ValueError: If the file ends part-way through a record, e.g. after a crash mid-write.
+    """
+    if (size - header["offset"]) % record.size:
+        raise ValueError(f"{path} ends with a partial record.")
+
+class RecordWriter:
+    """
+    Appends finished games to a file of fixed-width binary records.
+
+    The file starts with a JSON header naming the jobs, strategies and actions the
+    records index into, padded so the records that follow are aligned. Every record
+    has the same size, so the file can be sliced by game number or memory-mapped as a
+    NumPy array (see `memmap_records`) without reading it all.
+
+    Attributes:
+        path (str): The path of the record file.
+        header (dict): The file's header.
+        record (struct.Struct): The layout of one record.
+    """
+
+    def __init__(self, path, max_players, scenario=DEFAULT_SCENARIO, strategies=()):
+        """
+        Opens a record file for appending, creating it with a header if it does not exist.
+
+        Args:
+            path (str): The path of the record file.
+            max_players (int): The number of seats in every record.
+            scenario (Scenario): The scenario whose job titles are indexed.
+            strategies (iterable): The strategy names to index; any other strategy is recorded as 255.
+
+        Raises:
+            ValueError: If an existing file has a different layout or ends with a partial record.
+        """
+        self.path = path
+        actions = [name for name, entry in ACTIONS.entries.items() if hasattr(entry, "resolve")]
+        header = {"max_players": max_players, "actions": actions, "jobs": [title.title() for title, _, _ in scenario.jobs],
+                  "strategies": list(dict.fromkeys(strategies))}
+        self.record = struct.Struct(record_format(max_players, len(actions)))
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as file:
+                existing = read_header(file)
+                size = os.fstat(file.fileno()).st_size
+            if any(existing[key] != header[key] for key in LAYOUT):
+                raise ValueError(f"{path} holds records with a different layout.")
+            # Records appended after a partial one would be read shifted
+            check_whole_records(path, size, existing, self.record)
+            self.header = existing
+            self.file = open(path, "ab")
+        else:
+            self.header = header
+            self.file = open(path, "wb")
+            self.write_header()
+        self.jobs = {title: index for index, title in enumerate(self.header["jobs"])}
+        self.strategies = {name: index for index, name in enumerate(self.header["strategies"])}
+        self.actions = self.header["actions"]
+        self.empty_seat = (0.0, 0.0, MISSING, 0, 0) + (0,) * len(self.actions)
+
+    def write_header(self):
+        # Leave room for the offset itself, which is part of the header
+        body = json.dumps(self.header).encode("utf-8")
+        offset = -(-(PREAMBLE.size + len(body) + 32) // ALIGNMENT) * ALIGNMENT
+        self.header["offset"] = offset
+        body = json.dumps(self.header).encode("utf-8")
+        self.file.write(PREAMBLE.pack(MAGIC, len(body)) + body)
+        self.file.write(b"\n" * (offset - PREAMBLE.size - len(body)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def pack(self, result):
+        """
+        Packs a finished game into one record.
+
+        Args:
+            result (GameResult): The finished game.
+
+        Returns:
+            bytes: The record.
+
+        Raises:
+            ValueError: If the game has more players than the file has seats.
+        """
+        max_players = self.header["max_players"]
+        if len(result.standings) > max_players:
+            raise ValueError(f"A game of {len(result.standings)} players does not fit in {max_players} seats.")
+        seats = [self.empty_seat] * max_players
+        for standing in result.standings:
+            seats[standing.id - 1] = (standing.bank, standing.safe, self.jobs.get(standing.job_title, MISSING),
+                                      standing.rank, self.strategies.get(standing.strategy, 255),
+                                      *(standing.actions.get(action, 0) for action in self.actions))
+        return self.record.pack(result.seed, result.round_limit, len(result.standings),
+                                *(value for seat in seats for value in seat))
+
+    def write(self, result):
+        """
+        Appends a finished game.
+
+        Args:
+            result (GameResult): The finished game.
+        """
+        self.file.write(self.pack(result))
+
+    def append_file(self, path):
+        """
+        Appends every record of another record file with the same layout, e.g. one written by a worker.
+
+        Args:
+            path (str): The record file to copy records from.
+
+        Raises:
+            ValueError: If the other file has a different layout or ends with a partial record.
+        """
+        with open(path, "rb") as file:
+            header = read_header(file)
+            if any(header[key] != self.header[key] for key in LAYOUT):
+                raise ValueError(f"{path} holds records with a different layout.")
+            check_whole_records(path, os.fstat(file.fileno()).st_size, header, self.record)
+            while True:
+                block = file.read(1 << 20)
+                if not block:
+                    break
+                self.file.write(block)
+
+    def close(self):
+        self.file.close()
+
+def read_records(path):
+    """
+    Reads a record file one game at a time, without NumPy.
+
+    Args:
+        path (str): The record file.
+
+    Yields:
+        dict: "seed", "round_limit" and "players", a list of dictionaries with each seated
+        player's "id", "bank", "safe", "job", "rank", "strategy" and "actions" (names mapped to counts).
+    """
+    with open(path, "rb") as file:
+        header = read_header(file)
+        actions = header["actions"]
+        record = struct.Struct(record_format(header["max_players"], len(actions)))
+        seat_size = 5 + len(actions)
+        while True:
+            data = file.read(record.size)
+            if len(data) < record.size:
+                return
+            values = record.unpack(data)
+            seed, round_limit, player_count = values[:3]
+            players = []
+            for seat in range(player_count):
+                bank, safe, job, rank, strategy, *counts = values[3 + seat * seat_size:3 + (seat + 1) * seat_size]
+                players.append({
+                    "id": seat + 1, "bank": bank, "safe": safe,
+                    "job": header["jobs"][job] if job < len(header["jobs"]) else None,
+                    "rank": rank,
+                    "strategy": header["strategies"][strategy] if strategy < len(header["strategies"]) else None,
+                    "actions": dict(zip(actions, counts))
+                })
+            yield {"seed": seed, "round_limit": round_limit, "players": players}
+
+def memmap_records(path):
+    """
+    Maps a record file into memory as a read-only NumPy structured array.
+
+    Nothing is read until it is sliced, so files far larger than memory can be analysed,
+    e.g. `records["players"]["bank"][:, 0]` is every game's bank for the first seat.
+
+    Args:
+        path (str): The record file.
+
+    Returns:
+        tuple: The numpy.memmap of records and the file's header.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Memory-mapping record files needs NumPy; use read_records without it.") from None
+    with open(path, "rb") as file:
+        header = read_header(file)
+    dtype = record_dtype(header)
+    count = (os.path.getsize(path) - header["offset"]) // dtype.itemsize
+    return numpy.memmap(path, dtype, mode="r", offset=header["offset"], shape=(count,)), header
@@ -0,0 +1,186 @@
+from importlib.metadata import entry_points
+from .ulits import log
+
+class Entry:
+    """
+    An action, search or item behaviour held by a Registry.
+
+    Besides the attributes below, an entry holds the handlers its registry's callers
+    look up, e.g. an action's `play` (in the terminal) and `resolve` (headless).
+
+    Attributes:
+        name (str): The name the entry is registered under.
+        aliases (tuple): The other lower-case names it can be chosen by.
+        cost (int): How much of a turn it uses.
+        label (str): The entry's label in menus, or None to leave it out of them.
+        loader (callable): Loads the plugin that provides the entry, or None once it is loaded.
+    """
+
+    def __init__(self, name, loader=None):
+        self.name = name
+        self.aliases = ()
+        self.cost = 0
+        self.label = None if loader is None else name.title()
+        self.loader = loader
+
+class Registry:
+    """
+    Maps names and aliases to entries, so dispatching a choice is a dictionary lookup.
+
+    Built-in entries are registered when their modules are imported. Plugins are
+    installed packages that declare an entry point in the registry's group, named after
+    the entry and pointing to a function that registers it when called with the
+    registry. Entry points are only listed on the first lookup the built-in entries
+    cannot answer, and a plugin is only imported when one of its entries is first
+    used, so installed plugins cost nothing at startup. Until then a plugin's entry can
+    only be chosen by its name.
+
+    Attributes:
+        kind (str): What the registry holds, for messages, e.g. "action".
+        group (str): The entry point group plugins are found in, or None for no plugins.
+        entries (dict): Names mapped to entries, in registration order.
+        aliases (dict): Lower-case names and aliases mapped to entry names.
+        costs (dict): Entry names mapped to their costs.
+        discovered (bool): Whether plugins have been listed yet.
+    """
+
+    def __init__(self, kind, group=None):
+        self.kind = kind
+        self.group = group
+        self.entries = {}
+        self.aliases = {}
+        self.costs = {}
+        self.discovered = group is None
+
+    def register(self, name, aliases=(), **fields):
+        """
+        Registers an entry, or adds aliases and handlers to an entry registered before.
+
+        Args:
+            name (str): The entry's name.
+            aliases (iterable): Other names to choose it by.
+            **fields: The entry's cost, label and handlers.
+
+        Returns:
+            Entry: The registered entry.
+
+        Raises:
+            ValueError: If an alias already belongs to another entry.
+        """
+        aliases = [alias.lower() for alias in aliases]
+        for alias in (name.lower(), *aliases):
+            owner = self.aliases.get(alias, name)
+            if owner != name:
+                raise ValueError(f"The {self.kind} alias {alias!r} already belongs to {owner!r}.")
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = Entry(name)
+        for alias in (name.lower(), *aliases):
+            self.aliases[alias] = name
+        entry.aliases = tuple(dict.fromkeys((*entry.aliases, *aliases)))
+        for field, value in fields.items():
+            setattr(entry, field, value)
+        self.costs[name] = entry.cost
+        return entry
+
+    def discover(self):
+        """
+        Lists the installed plugins, without importing any of them.
+        """
+        self.discovered = True
+        for entry_point in entry_points(group=self.group):
+            if entry_point.name not in self.entries:
+                self.entries[entry_point.name] = Entry(entry_point.name, entry_point.load)
+                self.aliases.setdefault(entry_point.name.lower(), entry_point.name)
+
+    def load(self, entry):
+        """
+        Imports the plugin providing an entry and lets it register itself.
+
+        A plugin that fails to load is reported and dropped, so the game can go on without it.
+
+        Args:
+            entry (Entry): An entry whose plugin has not been loaded yet.
+
+        Returns:
+            Entry: The registered entry, or None if the plugin could not be loaded.
+        """
+        loader, entry.loader = entry.loader, None
+        try:
+            loader()(self)
+        except Exception as error:
+            log(f"Could not load the {self.kind} plugin {entry.name!r}: {error}")
+            del self.entries[entry.name]
+            self.aliases = {alias: name for alias, name in self.aliases.items() if name != entry.name}
+            self.costs.pop(entry.name, None)
+            return None
+        return self.entries.get(entry.name)
+
+    def get(self, name):
+        """
+        Looks up an entry by its exact name.
+
+        Args:
+            name (str): The entry's name.
+
+        Returns:
+            Entry: The entry, or None if there is none by that name.
+        """
+        entry = self.entries.get(name)
+        if entry is None and not self.discovered:
+            self.discover()
+            entry = self.entries.get(name)
+        if entry is not None and entry.loader is not None:
+            return self.load(entry)
+        return entry
+
+    def resolve(self, choice):
+        """
+        Looks up an entry by its name or any of its aliases, ignoring case.
+
+        Args:
+            choice (str): The name or alias.
+
+        Returns:
+            Entry: The entry, or None if nothing is registered under that name.
+        """
+        name = self.aliases.get(choice.lower())
+        if name is None and not self.discovered:
+            self.discover()
+            name = self.aliases.get(choice.lower())
+        return None if name is None else self.get(name)
+
+    def choices(self, names=None):
+        """
+        Lists every name and alias that can be chosen.
+
+        Args:
+            names (iterable, optional): Only list the aliases of these entries.
+
+        Returns:
+            list: The lower-case names and aliases.
+        """
+        if not self.discovered:
+            self.discover()
+        if names is None:
+            return list(self.aliases)
+        names = set(names)
+        return [alias for alias, name in self.aliases.items() if name in names]
+
+    def menu(self):
+        """
+        Lists the entries that appear in menus, in registration order.
+
+        Returns:
+            list: The entries with a label.
+        """
+        if not self.discovered:
+            self.discover()
+        return [entry for entry in self.entries.values() if entry.label is not None]
+
+# Turn actions, chosen from the turn menu or submitted to a HeadlessGame
+ACTIONS = Registry("action", "money_game.actions")
+# Things a player can search for
+SEARCHES = Registry("search", "money_game.searches")
+# Item behaviours, keyed by item name
+ITEMS = Registry("item", "money_game.items")
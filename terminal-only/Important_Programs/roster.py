@@ -0,0 +1,94 @@
+import gc
+import random
+from .player import Player
+from .names import names
+
+# Title-cased once, with duplicates dropped so every index in the name space is a distinct name
+NAME_PARTS = tuple(dict.fromkeys(name.title() for name in names))
+
+# `income` reads its cents roll as the digits after the decimal point, so 5 cents is $0.50 and 100 is $0.10
+CENT_FRACTIONS = tuple(float(f"0.{cents}") for cents in range(101))
+
+def unique_names(count, rng=random):
+    """
+    Draws distinct full names in the same "First, Last" format as `full_name`.
+
+    Names are drawn by sampling distinct indexes into the first x last combination
+    space, so no name is ever repeated. Once the space runs out, it is sampled again
+    with a numeric suffix ("First, Last 2", then " 3", ...) for the remaining players.
+
+    Args:
+        count (int): The number of names.
+        rng (random.Random, optional): The random number generator to draw with.
+
+    Returns:
+        list: The names, in random order.
+    """
+    parts = len(NAME_PARTS)
+    space = parts * parts
+    full_names = []
+    suffix = 1
+    while len(full_names) < count:
+        tag = "" if suffix == 1 else f" {suffix}"
+        full_names.extend(f"{NAME_PARTS[index // parts]}, {NAME_PARTS[index % parts]}{tag}"
+                          for index in rng.sample(range(space), min(count - len(full_names), space)))
+        suffix += 1
+    return full_names
+
+def draw_jobs(count, scenario, rng=random):
+    """
+    Hands out jobs the same way repeated `GameLogic.get_job` calls do, in batch.
+
+    Each pool of the scenario's jobs is handed out in a shuffled order, so no job
+    repeats until the whole pool has been given out, after which a new pool is
+    started. Incomes follow the same distribution as `income`, but are drawn only for
+    the jobs handed out, with the cents for every job drawn in a single call.
+
+    Args:
+        count (int): The number of jobs.
+        scenario (Scenario): The game parameters holding the jobs.
+        rng (random.Random, optional): The random number generator to draw with.
+
+    Returns:
+        list: (job title, job income) tuples.
+    """
+    pool = scenario.jobs
+    order = []
+    while len(order) < count:
+        order.extend(rng.sample(range(len(pool)), min(count - len(order), len(pool))))
+    draw = rng.random
+    return [(title.title(), round(low + int(draw() * (high - low + 1)) + fraction, 2))
+            for (title, low, high), fraction in zip(map(pool.__getitem__, order),
+                                                    rng.choices(CENT_FRACTIONS, k=count))]
+
+def generate_roster(count, scenario, rng=random, first_id=1):
+    """
+    Creates a large number of players in one pass.
+
+    This is the bulk counterpart of `Startup.adding_players_info`: names, ages and jobs
+    are each drawn for every player at once, and names are guaranteed to be unique.
+    A million players take a few seconds.
+
+    Args:
+        count (int): The number of players.
+        scenario (Scenario): The game parameters holding the jobs and starting bank.
+        rng (random.Random, optional): The random number generator to draw with.
+        first_id (int): The ID of the first player; the rest are numbered on from it.
+
+    Returns:
+        list: A list of Player instances.
+    """
+    # Millions of new objects would set off the cyclic garbage collector over and over, and none of them form cycles
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        full_names = unique_names(count, rng)
+        ages = rng.choices(range(18, 66), k=count)
+        jobs = draw_jobs(count, scenario, rng)
+        bank = scenario.starting_bank
+        return [Player(player_id, name, age, job_title, job_income, bank, 0, [])
+                for player_id, name, age, (job_title, job_income)
+                in zip(range(first_id, first_id + count), full_names, ages, jobs)]
+    finally:
+        if enabled:
+            gc.enable()
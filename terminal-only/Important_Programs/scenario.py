@@ -0,0 +1,238 @@
+import json
+import math
+import random
+import tomllib
+from dataclasses import dataclass, fields
+from .job_income import income, job_ranges
+
+@dataclass(frozen=True, slots=True)
+class ShopItem:
+    """
+    Describes an item stocked by the shop.
+
+    Attributes:
+        name (str): The name of the item.
+        low (float): The lowest price the item can be stocked at.
+        high (float): The highest price the item can be stocked at.
+        description (str): A brief description of the item.
+    """
+    name: str
+    low: float
+    high: float
+    description: str
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """
+    An immutable, validated set of game parameters.
+
+    Scenarios are built once by `compile_scenario` (or `load_scenario`) and handed to
+    `GameLogic`, so running the same scenario many times never reparses the file.
+
+    Attributes:
+        starting_bank (float): The bank balance every player starts with.
+        round_choices (tuple): The round limits players may choose from.
+        steal_success_chance (float): The chance that a steal attempt succeeds.
+        steal_fraction (tuple): The (low, high) fraction of the target's bank taken on success.
+        lottery_win_chance (float): The chance that a lottery ticket wins.
+        lottery_ticket_cost (float): The amount lost on a losing lottery ticket.
+        lottery_rewards (tuple): The rewards a winning lottery ticket picks from.
+        treasure_range (tuple): The (low, high) value of a found treasure.
+        stock_range (tuple): The (low, high) return of a stock investment.
+        shop_items (tuple): The ShopItem entries stocked by the market.
+        jobs (tuple): (job title, lowest income, highest income) entries.
+        bank_interest_rate (float): The interest paid on a positive bank balance per round.
+        safe_interest_rate (float): The interest paid on the safe per round.
+        house_yield_bonus (float): The extra safe interest per round for each House owned.
+        safe_capacity (float): The most a safe can hold, or 0 for no limit.
+        house_safe_capacity (float): The extra safe capacity for each House owned.
+    """
+    starting_bank: float = 40_000.0
+    round_choices: tuple = (5, 10, 15)
+    steal_success_chance: float = 0.5
+    steal_fraction: tuple = (0.0, 1.0)
+    lottery_win_chance: float = 0.1
+    lottery_ticket_cost: float = 5.0
+    lottery_rewards: tuple = (0.5, 0, 1, 5, 10, 20, 25, 50, 100, 1_000,
+                              5_000, 10_000, 15_000, 20_000, 25_000,
+                              50_000, 100_000, 250_000, 500_000,
+                              1_000_000, 0.25, 0.10, 2, 15)
+    treasure_range: tuple = (-1_000, 10_000)
+    stock_range: tuple = (-1_500_000, 1_500_000)
+    shop_items: tuple = (
+        ShopItem("House", 100_000, 1_000_000, "A safe deposit to store a lot of 'your' money."),
+        ShopItem("Safe Deposit Ticket", 1_000, 5_000, "A one-time-use ticket for a safe deposit."),
+        ShopItem("Bank Note", 10, 100, "A bank note worth a specific amount of money.")
+    )
+    jobs: tuple = tuple((title, low, high) for title, (low, high) in job_ranges.items())
+    bank_interest_rate: float = 0.0
+    safe_interest_rate: float = 0.0
+    house_yield_bonus: float = 0.0
+    safe_capacity: float = 0.0
+    house_safe_capacity: float = 0.0
+
+    def roll_jobs(self, rng=random):
+        """
+        Rolls an income for every job in the scenario.
+
+        Args:
+            rng (random.Random): The random number generator to roll with.
+
+        Returns:
+            dict: A dictionary of job titles to job incomes.
+        """
+        return {title: income(low, high, rng) for title, low, high in self.jobs}
+
+    def to_dict(self):
+        """
+        Returns the scenario in the same layout as a scenario file.
+
+        Returns:
+            dict: A JSON-serialisable dictionary of every parameter.
+        """
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data["round_choices"] = list(self.round_choices)
+        data["steal_fraction"] = list(self.steal_fraction)
+        data["lottery_rewards"] = list(self.lottery_rewards)
+        data["treasure_range"] = list(self.treasure_range)
+        data["stock_range"] = list(self.stock_range)
+        data["shop_items"] = {item.name: {"price": [item.low, item.high], "description": item.description}
+                              for item in self.shop_items}
+        data["jobs"] = {title: [low, high] for title, low, high in self.jobs}
+        return data
+
+    def with_changes(self, **changes):
+        """
+        Returns a new validated scenario with some parameters replaced.
+
+        Args:
+            **changes: Parameters in scenario file layout, e.g. steal_success_chance=0.4.
+
+        Returns:
+            Scenario: The new scenario.
+        """
+        return compile_scenario({**self.to_dict(), **changes})
+
+DEFAULT_SCENARIO = Scenario()
+
+def _is_number(value):
+    # NaN and infinities would compare as valid and then poison every balance they touch
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+def _number(data, key, low=None, high=None):
+    value = data[key]
+    if not _is_number(value):
+        raise ValueError(f"Scenario '{key}' must be a finite number, got {value!r}.")
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ValueError(f"Scenario '{key}' must be between {low} and {high}, got {value!r}.")
+    return float(value)
+
+def _bounds(value, key):
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(_is_number(bound) for bound in value)):
+        raise ValueError(f"Scenario '{key}' must be a [low, high] pair of finite numbers, got {value!r}.")
+    low, high = value
+    if low > high:
+        raise ValueError(f"Scenario '{key}' has a low bound above its high bound.")
+    return low, high
+
+def compile_scenario(data):
+    """
+    Validates scenario parameters and compiles them into an immutable Scenario.
+
+    Missing parameters keep their default values.
+
+    Args:
+        data (dict): Parameters in scenario file layout.
+
+    Returns:
+        Scenario: The compiled scenario.
+
+    Raises:
+        ValueError: If a parameter is unknown or invalid.
+    """
+    known = {field.name for field in fields(Scenario)}
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown scenario parameters: {', '.join(sorted(unknown))}.")
+
+    data = {**DEFAULT_SCENARIO.to_dict(), **data}
+
+    round_choices = data["round_choices"]
+    if (not round_choices or not isinstance(round_choices, (list, tuple))
+            or not all(isinstance(choice, int) and not isinstance(choice, bool) and choice > 0
+                       for choice in round_choices)):
+        raise ValueError("Scenario 'round_choices' must be a non-empty list of positive integers.")
+
+    steal_fraction = _bounds(data["steal_fraction"], "steal_fraction")
+    if steal_fraction[0] < 0 or steal_fraction[1] > 1:
+        raise ValueError("Scenario 'steal_fraction' must lie between 0 and 1.")
+
+    lottery_rewards = data["lottery_rewards"]
+    if not lottery_rewards or not isinstance(lottery_rewards, (list, tuple)):
+        raise ValueError("Scenario 'lottery_rewards' must be a non-empty list of numbers.")
+    for reward in lottery_rewards:
+        if not _is_number(reward):
+            raise ValueError(f"Scenario 'lottery_rewards' must only contain finite numbers, got {reward!r}.")
+
+    shop_items = []
+    if not isinstance(data["shop_items"], dict) or not data["shop_items"]:
+        raise ValueError("Scenario 'shop_items' must be a table of at least one item.")
+    for name, item in data["shop_items"].items():
+        if not isinstance(item, dict) or set(item) - {"price", "description"} or "price" not in item:
+            raise ValueError(f"Scenario shop item '{name}' must have a price and an optional description.")
+        low, high = _bounds(item["price"], f"shop_items.{name}.price")
+        if low < 0:
+            raise ValueError(f"Scenario shop item '{name}' cannot have a negative price.")
+        shop_items.append(ShopItem(name, low, high, str(item.get("description", ""))))
+
+    jobs = []
+    if not isinstance(data["jobs"], dict) or not data["jobs"]:
+        raise ValueError("Scenario 'jobs' must be a table of at least one job.")
+    for title, bounds in data["jobs"].items():
+        low, high = _bounds(bounds, f"jobs.{title}")
+        if not all(isinstance(bound, int) for bound in (low, high)) or low < 0:
+            raise ValueError(f"Scenario job '{title}' income bounds must be non-negative whole dollars.")
+        jobs.append((title, low, high))
+
+    return Scenario(
+        starting_bank=_number(data, "starting_bank", 0),
+        round_choices=tuple(round_choices),
+        steal_success_chance=_number(data, "steal_success_chance", 0, 1),
+        steal_fraction=steal_fraction,
+        lottery_win_chance=_number(data, "lottery_win_chance", 0, 1),
+        lottery_ticket_cost=_number(data, "lottery_ticket_cost", 0),
+        lottery_rewards=tuple(lottery_rewards),
+        treasure_range=_bounds(data["treasure_range"], "treasure_range"),
+        stock_range=_bounds(data["stock_range"], "stock_range"),
+        shop_items=tuple(shop_items),
+        jobs=tuple(jobs),
+        bank_interest_rate=_number(data, "bank_interest_rate", 0, 1),
+        safe_interest_rate=_number(data, "safe_interest_rate", 0, 1),
+        house_yield_bonus=_number(data, "house_yield_bonus", 0, 1),
+        safe_capacity=_number(data, "safe_capacity", 0),
+        house_safe_capacity=_number(data, "house_safe_capacity", 0)
+    )
+
+def load_scenario(path):
+    """
+    Loads and compiles a scenario file.
+
+    Args:
+        path (str): The path of a .toml or .json scenario file.
+
+    Returns:
+        Scenario: The compiled scenario.
+
+    Raises:
+        ValueError: If the file type is not supported or the scenario is invalid.
+    """
+    if str(path).endswith(".toml"):
+        with open(path, "rb") as file:
+            data = tomllib.load(file)
+    elif str(path).endswith(".json"):
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+    else:
+        raise ValueError("Scenario files must be .toml or .json.")
+    return compile_scenario(data)
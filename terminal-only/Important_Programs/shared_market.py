@@ -0,0 +1,116 @@
+import itertools
+import random
+import threading
+from .game_logic import BankManagement
+from .item import Item
+from .scenario import DEFAULT_SCENARIO
+
+class SharedMarket:
+    """
+    A shop whose prices and limited stock are shared by many concurrently running games.
+
+    Prices are rolled once, so every game connected to the market sees the same economy.
+    Each item type's stock is split across `shards` counters, each with its own lock,
+    and every connected game is given a home shard, round robin. A purchase takes one
+    unit from its home shard, and only tries the other shards (in turn) once that one is
+    empty, so games buying at the same time rarely wait on the same lock and never on a
+    global one. Taking a unit is a check and a decrement under one shard lock, so stock
+    can never be oversold.
+
+    Games may run in threads or in asyncio tasks: no lock is held across an await, so in
+    a single event loop every acquisition succeeds at once.
+
+    Attributes:
+        scenario (Scenario): The scenario whose shop items are stocked.
+        items (list): The Item instances for sale, shared by every connected game.
+        shards (int): The number of counters each item type's stock is split across.
+    """
+
+    def __init__(self, scenario=None, stock=100, shards=16, rng=None):
+        """
+        Stocks a shared shop.
+
+        Args:
+            scenario (Scenario, optional): The scenario whose shop items are stocked.
+            stock (int or dict): The units of every item type, or item names mapped to units.
+            shards (int): The number of counters each item type's stock is split across.
+            rng (random.Random, optional): Rolls the prices. Defaults to an unseeded generator.
+
+        Raises:
+            ValueError: If there are no shards or a stock level is negative.
+        """
+        if shards < 1:
+            raise ValueError("A shared market needs at least one shard.")
+        self.scenario = DEFAULT_SCENARIO if scenario is None else scenario
+        rng = random.Random() if rng is None else rng
+        self.items = [Item(shop_item.name, BankManagement.format_currency(round(rng.uniform(shop_item.low,
+                                                                                           shop_item.high), 2)),
+                           shop_item.description)
+                      for shop_item in self.scenario.shop_items]
+        self.shards = shards
+        self.counts = [[0] * shards for _ in self.items]
+        self.locks = [[threading.Lock() for _ in range(shards)] for _ in self.items]
+        self.next_shards = itertools.count()
+        for index, item in enumerate(self.items):
+            units = stock.get(item.name, 0) if isinstance(stock, dict) else stock
+            if units < 0:
+                raise ValueError(f"The stock of {item.name} cannot be negative.")
+            self.restock(index, units)
+
+    def connect(self):
+        """
+        Hands a new game its home shard.
+
+        Returns:
+            int: The shard the game's purchases try first.
+        """
+        return next(self.next_shards) % self.shards
+
+    def take(self, item_index, shard):
+        """
+        Takes one unit of an item out of stock.
+
+        Args:
+            item_index (int): The index of the item in the shop.
+            shard (int): The buyer's home shard, from `connect`.
+
+        Returns:
+            bool: Whether a unit was taken; False if the item is sold out.
+        """
+        counts = self.counts[item_index]
+        locks = self.locks[item_index]
+        for offset in range(self.shards):
+            index = (shard + offset) % self.shards
+            # An empty shard is skipped without locking it; one found empty here can only
+            # have been refilled by `restock`, which a purchase need not wait for
+            if not counts[index]:
+                continue
+            with locks[index]:
+                if counts[index]:
+                    counts[index] -= 1
+                    return True
+        return False
+
+    def restock(self, item_index, units, shard=None):
+        """
+        Adds units of an item to the stock.
+
+        Args:
+            item_index (int): The index of the item in the shop.
+            units (int): The units to add.
+            shard (int, optional): The shard to add them to. Defaults to spreading them evenly.
+        """
+        shards = range(self.shards) if shard is None else (shard,)
+        share, extra = divmod(units, len(shards))
+        for position, index in enumerate(shards):
+            with self.locks[item_index][index]:
+                self.counts[item_index][index] += share + (position < extra)
+
+    def remaining(self, item_index):
+        """
+        Counts the units of an item left in stock.
+
+        Returns:
+            int: The units left; only a snapshot while other games are buying.
+        """
+        return sum(self.counts[item_index])
@@ -0,0 +1,517 @@
+import itertools
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass
+from .game_logic import GameLogic, ItemsUsage, BankManagement, PlayerManagement
+from .game_play import GamePlay
+from .Input_Handling import Security
+from .player_setup import Startup
+from .roster import generate_roster
+from .registry import ACTIONS, SEARCHES
+from .record_store import RecordWriter
+
+# Bump whenever a change to the game rules or the headless engine can change results,
+# so cached simulation results are never reused across engine versions.
+ENGINE_VERSION = "3"
+
+SEARCH_KINDS = ("treasure", "lottery ticket", "stocks")
+
+def work_only(game, player):
+    """
+    Works every time.
+    """
+    return ("work",)
+
+def thief(game, player):
+    """
+    Steals from the richest other player.
+    """
+    targets = [other for other in game.players if other.id != player.id]
+    if not targets:
+        return ("work",)
+    target = max(targets, key=lambda other: BankManagement.deformat_currency(other.bank))
+    return ("steal", target.id)
+
+def treasure_hunter(game, player):
+    """
+    Searches for treasure every turn.
+    """
+    return ("search", "treasure")
+
+def gambler(game, player):
+    """
+    Buys a lottery ticket every turn.
+    """
+    return ("search", "lottery ticket")
+
+def investor(game, player):
+    """
+    Invests in stocks every turn.
+    """
+    return ("search", "stocks")
+
+def random_player(game, player):
+    """
+    Picks uniformly between working, stealing and each kind of search.
+    """
+    choice = game.rng.randrange(5)
+    if choice == 0:
+        return ("work",)
+    if choice == 1:
+        targets = [other.id for other in game.players if other.id != player.id]
+        return ("steal", game.rng.choice(targets)) if targets else ("work",)
+    return ("search", SEARCH_KINDS[choice - 2])
+
+# Strategies that compare other players' banks, so every balance is brought up to date before they choose
+BANK_READING_STRATEGIES = ("thief",)
+
+STRATEGIES = {
+    "worker": work_only,
+    "thief": thief,
+    "treasure": treasure_hunter,
+    "gambler": gambler,
+    "investor": investor,
+    "random": random_player
+}
+
+@dataclass(frozen=True)
+class PlayerResult:
+    """
+    The final state of one player in a finished headless game.
+    """
+    id: int
+    name: str
+    strategy: str
+    job_title: str
+    bank: float
+    safe: float
+    rank: int
+    actions: dict
+
+@dataclass(frozen=True)
+class GameResult:
+    """
+    The outcome of a finished headless game.
+
+    Attributes:
+        seed (int): The seed the game was played with.
+        round_limit (int): The number of rounds played.
+        standings (tuple): PlayerResult entries, winner first.
+    """
+    seed: int
+    round_limit: int
+    standings: tuple
+
+class HeadlessGame(GamePlay):
+    """
+    Plays a game without any terminal input or output.
+
+    Actions are tuples such as ("work",), ("steal", target_id), ("search", "stocks"),
+    ("buy", shop_index), ("use", inventory_index) and ("end",). They can either be
+    submitted one at a time with `apply` (for remote players) or chosen by strategies
+    with `start_game`. Turn costs and the turn limit are the same as in GamePlay.
+
+    Attributes:
+        seed (int): The seed of the game's random number generator.
+        rng (random.Random): The random number generator every draw in the game comes from.
+        strategies (dict): Player IDs mapped to strategy names.
+    """
+
+    FREE_ACTION_LIMIT = 20
+    # Games with at least this many players draw them with the bulk roster generator
+    BULK_ROSTER_SIZE = 1000
+
+    def __init__(self, seed, player_count=4, round_limit=None, scenario=None, strategies=("random",),
+                 on_event=None, market=None, keep_log=True):
+        """
+        Sets up a seeded game with randomly generated players.
+
+        Args:
+            seed (int): The seed of the game.
+            player_count (int): The number of players.
+            round_limit (int, optional): The number of rounds. Defaults to the scenario's first round choice.
+            scenario (Scenario, optional): The game parameters.
+            strategies (iterable): Strategy names from STRATEGIES, assigned to players in turn.
+            on_event (callable, optional): Called with (event type, payload) as the game progresses.
+            market (SharedMarket, optional): A shop shared with other games.
+            keep_log (bool): Whether the ledger keeps every transfer, or drops them once committed.
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        gamelogic = GameLogic(scenario, self.rng, market, keep_log)
+        if player_count >= self.BULK_ROSTER_SIZE:
+            players = generate_roster(player_count, gamelogic.scenario, self.rng)
+        else:
+            players = Startup(gamelogic, Security).adding_players_info(player_count, self.rng)
+        if round_limit is None:
+            round_limit = gamelogic.scenario.round_choices[0]
+        super().__init__(players, round_limit, gamelogic, on_event=on_event)
+        self.strategies = {player.id: name for player, name in zip(players, itertools.cycle(strategies))}
+        self.action_counts = {player.id: Counter() for player in players}
+        self.rounds = 0
+        self.turn_order = list(players)
+        self.current_index = 0
+        self.turn_used = 0
+        self.free_actions = 0
+        self.finished = False
+
+    @property
+    def current_player(self):
+        """
+        The player whose turn it is.
+
+        Returns:
+            Player: The player whose turn it is, or None once the game has finished.
+        """
+        return None if self.finished else self.turn_order[self.current_index]
+
+    def apply(self, action):
+        """
+        Applies an action for the current player and advances the turn.
+
+        Args:
+            action (tuple): The action to apply.
+
+        Returns:
+            dict: The outcome of the action.
+
+        Raises:
+            ValueError: If the game has finished or the action is not legal. The game state is left unchanged.
+        """
+        if self.finished:
+            raise ValueError("The game has already finished.")
+        player = self.turn_order[self.current_index]
+        starting = self.turn_used == 0 and self.free_actions == 0
+        accounts = self.gamelogic.accounts
+        touched = accounts.touched.get(player.id)
+        # Interest is accrued before the action resolves, and rolled back with it if the action is rejected
+        try:
+            with self.gamelogic.ledger.transaction():
+                if starting:
+                    accounts.accrue(player)
+                outcome = self.resolve_action(player, action)
+        except ValueError:
+            if touched is None:
+                accounts.touched.pop(player.id, None)
+            else:
+                accounts.touched[player.id] = touched
+            raise
+        if starting:
+            self.emit("turn_start", player=player.id, round=self.rounds + 1)
+        self.action_counts[player.id][action[0]] += 1
+        self.emit("action", **outcome)
+
+        cost = self.ACTION_COSTS.get(action[0], 0)
+        self.turn_used += cost
+        if cost == 0:
+            self.free_actions += 1
+        if action[0] == "end" or self.turn_used >= self.TURN_LIMIT or self.free_actions >= self.FREE_ACTION_LIMIT:
+            self.next_turn()
+        return outcome
+
+    def resolve_action(self, player, action):
+        """
+        Resolves a single action for a player, without any turn bookkeeping.
+
+        Args:
+            player (Player): The player acting.
+            action (tuple): The action to resolve.
+
+        Returns:
+            dict: The outcome of the action.
+
+        Raises:
+            ValueError: If the action is not legal.
+        """
+        if not isinstance(action, (tuple, list)) or not action or not isinstance(action[0], str):
+            raise ValueError(f"Invalid action {action!r}.")
+        name, *args = action
+        entry = ACTIONS.get(name)
+        if entry is None or not hasattr(entry, "resolve") or len(args) != entry.arity:
+            raise ValueError(f"Invalid action {action!r}.")
+        outcome = {"player": player.id, "action": name}
+        entry.resolve(self, player, args, outcome)
+        outcome["bank"] = player.bank
+        return outcome
+
+    def next_turn(self):
+        """
+        Ends the current player's turn, finishing the round or the game when everyone has played.
+        """
+        self.turn_used = 0
+        self.free_actions = 0
+        self.current_index += 1
+        if self.current_index == len(self.turn_order):
+            self.current_index = 0
+            self.rounds += 1
+            self.gamelogic.accounts.advance(self.rounds)
+            self.emit("round_complete", round=self.rounds)
+            if self.rounds >= self.round_limit:
+                self.finished = True
+                self.check_game_end()
+
+    def start_game(self):
+        """
+        Plays the game to the end, letting each player's strategy choose their actions.
+
+        Returns:
+            GameResult: The outcome of the game.
+        """
+        while not self.finished:
+            player = self.turn_order[self.current_index]
+            strategy = self.strategies[player.id]
+            if strategy in BANK_READING_STRATEGIES:
+                self.update_balances()
+            self.apply(STRATEGIES[strategy](self, player))
+        return self.result()
+
+    def update_balances(self):
+        """
+        Brings every player's lazily accrued interest up to date.
+        """
+        self.gamelogic.accounts.accrue_all(self.players)
+
+    def check_game_end(self):
+        """
+        Ranks the players once the final round has been played.
+        """
+        if self.rounds == self.round_limit:
+            self.update_balances()
+            self.rank_players()
+            self.emit_game_over()
+
+    def result(self):
+        """
+        Collects the final state of every player.
+
+        Returns:
+            GameResult: The outcome of the game, with players in their final ranking.
+        """
+        return GameResult(self.seed, self.round_limit, tuple(
+            PlayerResult(player.id, player.name, self.strategies[player.id], player.job_title,
+                         BankManagement.deformat_currency(player.bank),
+                         BankManagement.deformat_currency(player.safe),
+                         rank, dict(self.action_counts[player.id]))
+            for rank, player in enumerate(self.players, start=1)))
+
+class Aggregate:
+    """
+    Mergeable summary statistics over many finished games, broken down by strategy.
+
+    Only sums, counts and extremes are kept so aggregates computed on different
+    processes or machines can be merged exactly.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.winning_bank_sum = 0.0
+        self.wins = Counter()
+        self.entries = Counter()
+        self.bank_sum = Counter()
+        self.bank_square_sum = Counter()
+        self.bank_min = {}
+        self.bank_max = {}
+
+    def add(self, result):
+        """
+        Adds a finished game to the aggregate.
+
+        Args:
+            result (GameResult): The finished game.
+        """
+        self.games += 1
+        self.winning_bank_sum += result.standings[0].bank
+        self.wins[result.standings[0].strategy] += 1
+        for standing in result.standings:
+            strategy, bank = standing.strategy, standing.bank
+            self.entries[strategy] += 1
+            self.bank_sum[strategy] += bank
+            self.bank_square_sum[strategy] += bank * bank
+            self.bank_min[strategy] = min(self.bank_min.get(strategy, bank), bank)
+            self.bank_max[strategy] = max(self.bank_max.get(strategy, bank), bank)
+
+    def merge(self, other):
+        """
+        Merges another aggregate into this one.
+
+        Args:
+            other (Aggregate): The aggregate to merge in.
+
+        Returns:
+            Aggregate: This aggregate.
+        """
+        self.games += other.games
+        self.winning_bank_sum += other.winning_bank_sum
+        self.wins.update(other.wins)
+        self.entries.update(other.entries)
+        self.bank_sum.update(other.bank_sum)
+        self.bank_square_sum.update(other.bank_square_sum)
+        for strategy, bank in other.bank_min.items():
+            self.bank_min[strategy] = min(self.bank_min.get(strategy, bank), bank)
+        for strategy, bank in other.bank_max.items():
+            self.bank_max[strategy] = max(self.bank_max.get(strategy, bank), bank)
+        return self
+
+    def to_dict(self):
+        """
+        Serialises the aggregate.
+
+        Returns:
+            dict: The aggregate in a JSON-serialisable form.
+        """
+        return {
+            "games": self.games,
+            "winning_bank_sum": self.winning_bank_sum,
+            "wins": dict(self.wins),
+            "entries": dict(self.entries),
+            "bank_sum": dict(self.bank_sum),
+            "bank_square_sum": dict(self.bank_square_sum),
+            "bank_min": self.bank_min,
+            "bank_max": self.bank_max
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds an aggregate from `to_dict` output.
+
+        Args:
+            data (dict): The serialised aggregate.
+
+        Returns:
+            Aggregate: The rebuilt aggregate.
+        """
+        aggregate = cls()
+        aggregate.games = data["games"]
+        aggregate.winning_bank_sum = data["winning_bank_sum"]
+        aggregate.wins = Counter(data["wins"])
+        aggregate.entries = Counter(data["entries"])
+        aggregate.bank_sum = Counter(data["bank_sum"])
+        aggregate.bank_square_sum = Counter(data["bank_square_sum"])
+        aggregate.bank_min = dict(data["bank_min"])
+        aggregate.bank_max = dict(data["bank_max"])
+        return aggregate
+
+    def summary(self):
+        """
+        Computes the headline statistics of the aggregate.
+
+        Returns:
+            dict: Win rates and final bank statistics per strategy.
+        """
+        strategies = {}
+        for strategy, entries in sorted(self.entries.items()):
+            mean = self.bank_sum[strategy] / entries
+            variance = max(self.bank_square_sum[strategy] / entries - mean * mean, 0.0)
+            strategies[strategy] = {
+                "Win Rate": self.wins[strategy] / self.games,
+                "Mean Bank": mean,
+                "Std Bank": math.sqrt(variance),
+                "Min Bank": self.bank_min[strategy],
+                "Max Bank": self.bank_max[strategy]
+            }
+        return {
+            "Games": self.games,
+            "Mean Winning Bank": self.winning_bank_sum / self.games if self.games else 0.0,
+            "Strategies": strategies
+        }
+
+def run_batch(scenario, seed_start, seed_stop, player_count=4, round_limit=None, strategies=("random",),
+              game_class=HeadlessGame, record_path=None):
+    """
+    Plays one headless game per seed and aggregates the results.
+
+    Only the results are kept, so the games' ledgers drop every transfer once it is committed.
+
+    Args:
+        scenario (Scenario): The game parameters.
+        seed_start (int): The first seed (inclusive).
+        seed_stop (int): The last seed (exclusive).
+        player_count (int): The number of players per game.
+        round_limit (int, optional): The number of rounds per game.
+        strategies (iterable): Strategy names assigned to players in turn.
+        game_class (type): The HeadlessGame subclass that plays each game.
+        record_path (str, optional): A record file every finished game is appended to.
+
+    Returns:
+        Aggregate: The aggregated results.
+    """
+    aggregate = Aggregate()
+    writer = None if record_path is None else RecordWriter(record_path, player_count, scenario, strategies)
+    try:
+        for seed in range(seed_start, seed_stop):
+            result = game_class(seed, player_count, round_limit, scenario, strategies, keep_log=False).start_game()
+            aggregate.add(result)
+            if writer is not None:
+                writer.write(result)
+    finally:
+        if writer is not None:
+            writer.close()
+    return aggregate
+
+def split_seeds(seed_start, seed_stop, chunks):
+    """
+    Splits a seed range into at most `chunks` contiguous ranges of similar size.
+
+    Args:
+        seed_start (int): The first seed (inclusive).
+        seed_stop (int): The last seed (exclusive).
+        chunks (int): The number of ranges wanted.
+
+    Returns:
+        list: (start, stop) pairs.
+    """
+    total = seed_stop - seed_start
+    chunks = max(1, min(chunks, total))
+    bounds = [seed_start + total * index // chunks for index in range(chunks + 1)]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+def resolve_work(game, player, args, outcome):
+    outcome["amount"] = game.gamelogic.employment.earn(player)
+
+def resolve_steal(game, player, args, outcome):
+    target = PlayerManagement.get_player_by_id(game, args[0], game.players)
+    if target is None or target is player:
+        raise ValueError(f"Player #{player.id} cannot steal from {args[0]!r}.")
+    stolen = game.gamelogic.crime.attempt_steal(player, target)
+    outcome["target"] = target.id
+    outcome["amount"] = stolen[0] if stolen else 0.0
+
+def resolve_search(game, player, args, outcome):
+    search = SEARCHES.get(args[0]) if isinstance(args[0], str) else None
+    if search is None:
+        raise ValueError(f"Invalid search {args[0]!r}.")
+    exploration = game.gamelogic.exploration
+    _, reward = search.roll(exploration)
+    exploration.collect_reward(player, reward)
+    outcome["kind"] = args[0]
+    outcome["amount"] = reward
+
+def resolve_buy(game, player, args, outcome):
+    market = game.gamelogic.market
+    if not isinstance(args[0], int) or not 0 <= args[0] < len(market.items):
+        raise ValueError(f"Invalid shop item {args[0]!r}.")
+    item = market.buy(player, args[0])
+    outcome["item"] = market.items[args[0]].name
+    outcome["bought"] = item is not None
+    if market.shared is not None:
+        outcome["in_stock"] = market.in_stock(args[0])
+
+def resolve_use(game, player, args, outcome):
+    if not isinstance(args[0], int):
+        raise ValueError(f"Invalid inventory item {args[0]!r}.")
+    item = ItemsUsage.apply_item(player, args[0], game.gamelogic.accounts.safe_capacity(player), game.gamelogic.ledger)
+    outcome["item"] = item.name if item else None
+
+def resolve_end(game, player, args, outcome):
+    pass
+
+# An action's `resolve(game, player, args, outcome)` handler plays it headless, filling in the outcome,
+# and raises ValueError if its `arity` arguments are not legal
+ACTIONS.register("work", resolve=resolve_work, arity=0)
+ACTIONS.register("steal", resolve=resolve_steal, arity=1)
+ACTIONS.register("search", resolve=resolve_search, arity=1)
+ACTIONS.register("buy", resolve=resolve_buy, arity=1)
+ACTIONS.register("use", resolve=resolve_use, arity=1)
+ACTIONS.register("end", resolve=resolve_end, arity=0)
@@ -0,0 +1,271 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from .simulation import STRATEGIES, HeadlessGame
+
+class PlanningView:
+    """
+    What a bot sees while planning a simultaneous turn.
+
+    Each player gets their own random number generator, seeded from the game seed,
+    the round and the player ID, so plans are reproducible no matter which thread
+    finishes first.
+    """
+
+    def __init__(self, game, player):
+        self.players = game.players
+        self.rounds = game.rounds
+        self.rng = random.Random(f"{game.seed}:{game.rounds}:{player.id}")
+
+def strategy_submitter(strategy):
+    """
+    Builds a submitter that plans a whole turn with a strategy from STRATEGIES.
+
+    Args:
+        strategy (str): The strategy name.
+
+    Returns:
+        callable: A submitter taking (game, player) and returning a plan.
+    """
+    choose = STRATEGIES[strategy]
+
+    def submit(game, player):
+        view = PlanningView(game, player)
+        plan, used = [], 0
+        while used < game.TURN_LIMIT and len(plan) < game.FREE_ACTION_LIMIT:
+            action = choose(view, player)
+            plan.append(action)
+            used += game.ACTION_COSTS.get(action[0], 0)
+        return plan
+    return submit
+
+class PlanMailbox:
+    """
+    Collects plans submitted from outside the game (e.g. by remote clients).
+
+    `submitter_for` returns a submitter that blocks until its player's plan arrives,
+    so remote players plug into the same concurrent collection as bots.
+
+    Every plan is tagged with the round it is for (the number of the round being
+    played, starting at 1). A player may submit once per round, for the round being
+    collected or, if their client is quick, the next one. When a player's collection
+    for a round starts, anything left over from earlier rounds (plans that missed their
+    deadline) is dropped, so a late plan is never played in a later round.
+
+    Attributes:
+        round (int): The latest round whose collection has started.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.round = 0
+        # (player ID, round) mapped to the plan, or None once the plan has been taken
+        self.plans = {}
+        self.arrived = {}
+
+    def _event(self, key):
+        # Called with the lock held
+        return self.arrived.setdefault(key, threading.Event())
+
+    def submit(self, player_id, plan, round_number):
+        """
+        Stores a player's plan for a round.
+
+        Args:
+            player_id (int): The ID of the player submitting.
+            plan (list): The player's actions for the round.
+            round_number (int): The round the plan is for.
+
+        Raises:
+            ValueError: If the round is not being collected or next, or the player already submitted for it.
+        """
+        key = (player_id, round_number)
+        with self.lock:
+            if not max(self.round, 1) <= round_number <= self.round + 1:
+                raise ValueError(f"Plans are being collected for round {self.round}, not {round_number}.")
+            if key in self.plans:
+                raise ValueError(f"Player #{player_id} already submitted a plan for round {round_number}.")
+            self.plans[key] = list(plan)
+            self._event(key).set()
+
+    def start_round(self, player_id, round_number):
+        """
+        Starts collecting a player's plan for a round, dropping their leftovers from earlier rounds.
+
+        Args:
+            player_id (int): The ID of the player.
+            round_number (int): The round being collected.
+
+        Returns:
+            threading.Event: Set once the player's plan for the round arrives.
+        """
+        with self.lock:
+            self.round = max(self.round, round_number)
+            for table in (self.plans, self.arrived):
+                for key in [key for key in table if key[0] == player_id and key[1] < round_number]:
+                    del table[key]
+            return self._event((player_id, round_number))
+
+    def submitter_for(self, player_id, timeout):
+        """
+        Builds a submitter that waits for a player's plan.
+
+        Args:
+            player_id (int): The ID of the player.
+            timeout (float): How long to wait for the plan, in seconds.
+
+        Returns:
+            callable: A submitter taking (game, player) and returning a plan, or None on timeout.
+        """
+        def submit(game, player):
+            round_number = game.rounds + 1
+            if not self.start_round(player_id, round_number).wait(timeout):
+                return None
+            with self.lock:
+                plan = self.plans[(player_id, round_number)]
+                # Keep the key, so a second submission for the round is still turned away
+                self.plans[(player_id, round_number)] = None
+                return plan
+        return submit
+
+class SimultaneousGame(HeadlessGame):
+    """
+    Plays rounds in which every player submits their whole turn at the same time.
+
+    Plans are collected concurrently with a deadline; a player who misses it, fails,
+    or submits an invalid plan gets the default plan. Plans are then resolved in
+    a fixed order:
+
+    1. Every non-steal action, player by player in ascending ID, in plan order.
+    2. Every steal, ordered by target ID, then thief ID, then position in the plan.
+       Thieves hitting the same target each take their share of whatever the
+       earlier thieves left behind.
+
+    Attributes:
+        deadline (float): Seconds players have to submit their plans each round.
+        default_plan (tuple): The plan used for players without a valid plan.
+    """
+
+    def __init__(self, seed, player_count=4, round_limit=None, scenario=None, strategies=("random",),
+                 deadline=30.0, default_plan=(("work",), ("work",)), on_event=None, keep_log=True):
+        super().__init__(seed, player_count, round_limit, scenario, strategies, on_event, keep_log=keep_log)
+        self.deadline = deadline
+        self.default_plan = tuple(default_plan)
+        if not self.valid_plan(self.default_plan):
+            raise ValueError("The default plan does not fit in a turn.")
+
+    def valid_plan(self, plan):
+        """
+        Checks that a plan could have been played in a single sequential turn.
+
+        Args:
+            plan (list): The actions of the plan.
+
+        Returns:
+            bool: True if every action starts before the turn limit is reached.
+        """
+        if not isinstance(plan, (list, tuple)) or len(plan) > self.FREE_ACTION_LIMIT:
+            return False
+        used = 0
+        for action in plan:
+            if used >= self.TURN_LIMIT or not isinstance(action, (list, tuple)) or not action:
+                return False
+            used += self.ACTION_COSTS.get(action[0], 0)
+        return True
+
+    def collect_plans(self, submitters):
+        """
+        Asks every player for their plan concurrently and waits until the deadline.
+
+        Args:
+            submitters (dict): Player IDs mapped to callables taking (game, player) and returning a plan.
+
+        Returns:
+            dict: Player IDs mapped to the plans to resolve.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(self.turn_order))
+        futures = {player.id: executor.submit(submitters[player.id], self, player) for player in self.turn_order}
+        wait(futures.values(), timeout=self.deadline)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        plans = {}
+        for player_id, future in futures.items():
+            plan = None
+            if future.done() and not future.cancelled() and future.exception() is None:
+                plan = future.result()
+            plans[player_id] = [tuple(action) for action in plan] if self.valid_plan(plan) else list(self.default_plan)
+        return plans
+
+    def resolve_round(self, plans):
+        """
+        Applies every player's plan for the round in the deterministic order.
+
+        Illegal actions inside a plan are skipped.
+
+        Args:
+            plans (dict): Player IDs mapped to plans.
+
+        Returns:
+            list: The outcome of every action that was applied, in the order applied.
+        """
+        outcomes, steals = [], []
+        players = sorted(self.turn_order, key=lambda player: player.id)
+        for player in players:
+            for position, action in enumerate(plans[player.id]):
+                if action[0] == "steal":
+                    steals.append((action[1] if len(action) > 1 else None, player.id, position, player, action))
+                    continue
+                outcomes.extend(self._resolve(player, action))
+
+        steals.sort(key=lambda steal: (steal[0] if isinstance(steal[0], int) else float("inf"), steal[1], steal[2]))
+        for _, _, _, player, action in steals:
+            outcomes.extend(self._resolve(player, action))
+        return outcomes
+
+    def _resolve(self, player, action):
+        try:
+            outcome = self.resolve_action(player, action)
+        except (ValueError, TypeError, IndexError):
+            return []
+        self.action_counts[player.id][action[0]] += 1
+        self.emit("action", **outcome)
+        return [outcome]
+
+    def play_round(self, submitters):
+        """
+        Collects and resolves a single round.
+
+        Args:
+            submitters (dict): Player IDs mapped to plan submitters.
+
+        Returns:
+            list: The outcome of every action applied during the round.
+        """
+        for player in self.turn_order:
+            self.gamelogic.accounts.accrue(player)
+            self.emit("turn_start", player=player.id, round=self.rounds + 1)
+        outcomes = self.resolve_round(self.collect_plans(submitters))
+        self.rounds += 1
+        self.gamelogic.accounts.advance(self.rounds)
+        self.emit("round_complete", round=self.rounds)
+        if self.rounds >= self.round_limit:
+            self.finished = True
+            self.check_game_end()
+        return outcomes
+
+    def start_game(self, submitters=None):
+        """
+        Plays every round to the end.
+
+        Args:
+            submitters (dict, optional): Player IDs mapped to plan submitters. Defaults to
+                submitters built from each player's strategy.
+
+        Returns:
+            GameResult: The outcome of the game.
+        """
+        if submitters is None:
+            submitters = {player_id: strategy_submitter(name) for player_id, name in self.strategies.items()}
+        while not self.finished:
+            self.play_round(submitters)
+        return self.result()
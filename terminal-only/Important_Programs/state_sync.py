@@ -0,0 +1,182 @@
+import json
+from .game_logic import BankManagement
+from .player import Player
+
+class StateTracker:
+    """
+    Tracks which players and how much shared shop stock changed and builds per-observer deltas.
+
+    Whoever applies actions reports each outcome with `record` (or calls `touch`
+    directly). Given the game's ledger, the tracker also hears about every balance
+    change made outside an action, such as interest accrued at the end of the game.
+    `flush` then compares only the touched players against the last published state
+    and serialises one delta per visibility level, so the work done scales with what
+    changed rather than with the roster size. Shop prices never change, so only the
+    stock of a shared shop, which other games also buy from, is compared on every flush.
+
+    Observers see other players at their visibility level (the levels of
+    `Player.profile`) and always see their own player at the "leaked" level.
+
+    Attributes:
+        sequence (int): The number of deltas published so far; clients use it to order deltas.
+    """
+
+    def __init__(self, players, market, ledger=None):
+        """
+        Initializes the tracker with the current state as the published baseline.
+
+        Args:
+            players (list): The Player instances to track.
+            market (Market): The shop to track.
+            ledger (Ledger, optional): The game's ledger; the tracker becomes its listener so
+                that balances changed outside an action are published too.
+        """
+        self.players = {player.id: player for player in players}
+        self.market = market
+        self.observers = {}
+        self.dirty = set()
+        self.sequence = 0
+        self.published = {player.id: self._state(player) for player in players}
+        self.published_stock = self._stock_state()
+        if ledger is not None:
+            ledger.listener = self._changed
+
+    @staticmethod
+    def _state(player):
+        state = {}
+        for key in Player.PROFILE_FIELDS:
+            value = player.profile_value(key)
+            if key == "Inventory":
+                value = [dict(item) for item in value]
+            state[key] = BankManagement.deformat_currency(value) if key in ("Bank", "Safe") else value
+        return state
+
+    def _market_state(self):
+        return {item.name: BankManagement.deformat_currency(item.price) for item in self.market.items}
+
+    def _stock_state(self):
+        shared = self.market.shared
+        if shared is None:
+            return {}
+        return {item.name: shared.remaining(index) for index, item in enumerate(self.market.items)}
+
+    def _changed(self, player):
+        if player.id in self.players:
+            self.dirty.add(player.id)
+
+    def add_observer(self, observer_id, visibility="normal", player_id=None):
+        """
+        Registers an observer.
+
+        Args:
+            observer_id (hashable): The observer's ID.
+            visibility (str): The level other players are seen at.
+            player_id (int, optional): The observer's own player, seen at the "leaked" level.
+        """
+        if visibility not in Player.VISIBILITY:
+            raise ValueError(f"Unknown visibility level {visibility!r}.")
+        self.observers[observer_id] = (visibility, player_id)
+
+    def remove_observer(self, observer_id):
+        """
+        Stops producing deltas for an observer.
+        """
+        self.observers.pop(observer_id, None)
+
+    def touch(self, player_id):
+        """
+        Marks a player as possibly changed.
+        """
+        self.dirty.add(player_id)
+
+    def record(self, outcome):
+        """
+        Marks everything an action outcome may have changed.
+
+        Args:
+            outcome (dict): An outcome returned by HeadlessGame.resolve_action.
+        """
+        self.dirty.add(outcome["player"])
+        if "target" in outcome:
+            self.dirty.add(outcome["target"])
+
+    def snapshot(self, observer_id):
+        """
+        Builds the full state an observer is allowed to see, for the first sync.
+
+        Args:
+            observer_id (hashable): The observer's ID.
+
+        Returns:
+            bytes: The JSON-encoded state.
+        """
+        visibility, own_player = self.observers[observer_id]
+        state = {
+            "seq": self.sequence,
+            "players": {
+                player_id: {key: self.published[player_id][key]
+                            for key in Player.VISIBILITY["leaked" if player_id == own_player else visibility]}
+                for player_id in self.players
+            },
+            "market": self._market_state()
+        }
+        if self.published_stock:
+            state["stock"] = self.published_stock
+        return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+    def flush(self):
+        """
+        Publishes everything that changed since the last flush.
+
+        Returns:
+            dict: Observer IDs mapped to JSON-encoded deltas. Observers with nothing
+            new to see are left out, and observers sharing a visibility level share
+            the same bytes object unless their own player changed.
+        """
+        changes = {}
+        for player_id in self.dirty:
+            state = self._state(self.players[player_id])
+            previous = self.published[player_id]
+            changed = {key: value for key, value in state.items() if value != previous[key]}
+            if changed:
+                changes[player_id] = changed
+                self.published[player_id] = state
+        self.dirty.clear()
+
+        stock = {}
+        if self.published_stock:
+            state = self._stock_state()
+            stock = {name: count for name, count in state.items() if self.published_stock[name] != count}
+            self.published_stock = state
+
+        if not changes and not stock:
+            return {}
+        self.sequence += 1
+
+        def encode(players):
+            delta = {"seq": self.sequence}
+            if players:
+                delta["players"] = players
+            if stock:
+                delta["stock"] = stock
+            return json.dumps(delta, separators=(",", ":")).encode("utf-8")
+
+        by_level = {}
+        for visibility, visible in Player.VISIBILITY.items():
+            by_level[visibility] = {player_id: {key: value for key, value in changed.items() if key in visible}
+                                    for player_id, changed in changes.items()}
+            by_level[visibility] = {player_id: changed for player_id, changed in by_level[visibility].items() if changed}
+
+        shared = {}
+        deltas = {}
+        for observer_id, (visibility, own_player) in self.observers.items():
+            players = by_level[visibility]
+            if own_player in changes:
+                players = {**players, own_player: changes[own_player]}
+                if players or stock:
+                    deltas[observer_id] = encode(players)
+            elif players or stock:
+                if visibility not in shared:
+                    shared[visibility] = encode(players)
+                deltas[observer_id] = shared[visibility]
+        return deltas
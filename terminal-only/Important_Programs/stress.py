@@ -0,0 +1,213 @@
+import math
+import random
+from .game_logic import BankManagement
+from .simulation import SEARCH_KINDS, HeadlessGame
+
+class InvariantViolation(Exception):
+    """
+    Raised when an action leaves the game in a state the rules forbid.
+
+    Attributes:
+        seed (int): The seed of the game that broke.
+        player_count (int): The number of players in the game.
+        round_limit (int): The number of rounds in the game.
+        step (int): How many actions had been applied before the broken one.
+        action (tuple): The action that broke the invariant.
+    """
+
+    def __init__(self, message, seed, player_count, round_limit, step, action):
+        super().__init__(message, seed, player_count, round_limit, step, action)
+        self.message = message
+        self.seed = seed
+        self.player_count = player_count
+        self.round_limit = round_limit
+        self.step = step
+        self.action = action
+
+    def __str__(self):
+        return (f"{self.message} (seed={self.seed}, players={self.player_count}, rounds={self.round_limit}, "
+                f"step={self.step}, action={self.action!r})")
+
+def random_input(game, rng):
+    """
+    Picks a random action for the current player, legal or not.
+
+    Args:
+        game (HeadlessGame): The game being stressed.
+        rng (random.Random): The random number generator picking inputs.
+
+    Returns:
+        The action, which may be malformed on purpose.
+    """
+    player = game.current_player
+    roll = rng.randrange(16)
+    if roll < 3:
+        return ("work",)
+    if roll < 6:
+        return ("steal", rng.randint(1, len(game.players)))
+    if roll < 9:
+        return ("search", rng.choice(SEARCH_KINDS))
+    if roll < 11:
+        return ("buy", rng.randrange(len(game.gamelogic.market.items)))
+    if roll < 13:
+        return ("use", rng.randrange(max(len(player.inventory), 1)))
+    if roll == 13:
+        return ("end",)
+    return rng.choice([
+        ("steal", player.id), ("steal", 0), ("steal", "1"), ("search", "gold"), ("buy", -1),
+        ("buy", len(game.gamelogic.market.items)), ("use", -1), ("use", len(player.inventory)),
+        ("work", 1), ("fly",), (), None, "work"
+    ])
+
+def _snapshot(game):
+    # Raw attribute values are enough to notice any change, and much cheaper than parsing them
+    players = [(player.bank, player.safe, len(player.inventory)) for player in game.players]
+    shop = [item.price for item in game.gamelogic.market.items]
+    return players, shop, dict(game.gamelogic.accounts.touched), len(game.gamelogic.ledger)
+
+def _total_money(game):
+    return math.fsum(BankManagement.deformat_currency(player.bank) for player in game.players)
+
+def _bank_interest(game, start):
+    # Stressed games keep their ledger log, so every interest payment since `start` can be read back
+    paid = {}
+    for kind, source, destination, amount in game.gamelogic.ledger.entries(start):
+        if kind == "interest" and destination != "world" and destination[1] == "bank":
+            paid[destination[0]] = paid.get(destination[0], 0.0) + amount
+    return paid
+
+def check_action(game, action):
+    """
+    Applies an action and checks the invariants that must hold afterwards.
+
+    Args:
+        game (HeadlessGame): The game being stressed.
+        action: The action to apply.
+
+    Returns:
+        str: A description of the broken invariant, or None if every invariant held.
+    """
+    player = game.current_player
+    # Interest owed so far is left unpaid: a rejected action must roll back whatever interest it accrued
+    before = _snapshot(game)
+    before_shop = before[1]
+    bank_before = BankManagement.deformat_currency(player.bank)
+    inventory_before = len(player.inventory)
+    stealing = isinstance(action, tuple) and action[:1] == ("steal",)
+    total_before = _total_money(game) if stealing else 0.0
+
+    try:
+        outcome = game.apply(action)
+    except ValueError:
+        if _snapshot(game) != before:
+            return "a rejected action changed the game state"
+        return None
+    # Interest paid during the action, at the start of a turn, on a steal or at the end of the game
+    interest = _bank_interest(game, before[3])
+
+    shop = game.gamelogic.market.items
+    if [item.price for item in shop] != before_shop:
+        return "the shop prices changed"
+
+    name = outcome["action"]
+    bank_after = BankManagement.deformat_currency(player.bank)
+    if name == "steal":
+        drift = _total_money(game) - total_before - math.fsum(interest.values())
+        if abs(drift) > 1e-6:
+            return f"steal changed the total money by {drift!r}"
+    elif name == "buy" and outcome["bought"]:
+        if bank_after < 0:
+            return "a purchase left a negative bank balance"
+        if len(player.inventory) != inventory_before + 1:
+            return "a purchase did not add exactly one item"
+        if any(player.inventory[-1] is item for item in shop):
+            return "a bought item is shared with the shop stock"
+    elif name == "buy" and abs(bank_after - interest.get(player.id, 0.0) - bank_before) > 1e-6:
+        return "a failed purchase changed the bank balance"
+    elif name == "use" and outcome["item"] is not None and len(player.inventory) != inventory_before - 1:
+        return "using an item did not remove exactly one item"
+    elif name == "use" and outcome["item"] is None and len(player.inventory) != inventory_before:
+        return "an unusable item changed the inventory"
+    return None
+
+def stress_game(seed, player_count, round_limit=None, scenario=None):
+    """
+    Plays one game with random inputs, checking invariants after every action.
+
+    Args:
+        seed (int): The seed of the game and of its inputs.
+        player_count (int): The number of players.
+        round_limit (int, optional): The number of rounds; chosen by the game if None.
+        scenario (Scenario, optional): The game parameters.
+
+    Returns:
+        int: The number of actions applied.
+
+    Raises:
+        InvariantViolation: If an invariant breaks.
+    """
+    try:
+        game = HeadlessGame(seed, player_count, round_limit, scenario)
+    except Exception as error:
+        raise InvariantViolation(f"setup failed with {type(error).__name__}: {error}",
+                                 seed, player_count, round_limit, 0, None) from error
+    rng = random.Random(~seed)
+    step = 0
+    while not game.finished:
+        action = random_input(game, rng)
+        try:
+            problem = check_action(game, action)
+        except Exception as error:
+            problem = f"{type(error).__name__}: {error}"
+        if problem:
+            raise InvariantViolation(problem, seed, player_count, game.round_limit, step, action)
+        step += 1
+    return step
+
+def shrink(violation, scenario=None):
+    """
+    Looks for the smallest game that still breaks with the same seed.
+
+    Args:
+        violation (InvariantViolation): The original failure.
+        scenario (Scenario, optional): The game parameters.
+
+    Returns:
+        InvariantViolation: The failure with the fewest players, rounds and steps found.
+    """
+    best = violation
+    for player_count in range(1, violation.player_count + 1):
+        for round_limit in range(1, (violation.round_limit or 1) + 1):
+            if (player_count, round_limit) >= (best.player_count, best.round_limit or 1):
+                continue
+            try:
+                stress_game(violation.seed, player_count, round_limit, scenario)
+            except InvariantViolation as smaller:
+                if smaller.step <= best.step:
+                    best = smaller
+    return best
+
+def stress(seed_start, seed_stop, player_count=4, round_limit=None, scenario=None):
+    """
+    Stress-tests a range of seeds, stopping at the first broken invariant.
+
+    Args:
+        seed_start (int): The first seed to play (inclusive).
+        seed_stop (int): The last seed to play (exclusive).
+        player_count (int): The number of players per game.
+        round_limit (int, optional): The number of rounds per game.
+        scenario (Scenario, optional): The game parameters.
+
+    Returns:
+        int: The total number of actions checked.
+
+    Raises:
+        InvariantViolation: The lowest failing seed, shrunk to the smallest failing game.
+    """
+    actions = 0
+    for seed in range(seed_start, seed_stop):
+        try:
+            actions += stress_game(seed, player_count, round_limit, scenario)
+        except InvariantViolation as violation:
+            raise shrink(violation, scenario) from None
+    return actions
@@ -0,0 +1,175 @@
+import hashlib
+import itertools
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from .scenario import DEFAULT_SCENARIO
+from .simulation import ENGINE_VERSION, Aggregate, run_batch, split_seeds
+
+def grid_design(grid):
+    """
+    Builds every combination of the given parameter values.
+
+    Args:
+        grid (dict): Scenario parameter names mapped to lists of values.
+
+    Returns:
+        list: One dictionary of parameter changes per point.
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+def random_design(params, samples, seed=0):
+    """
+    Draws random points from the given parameter ranges.
+
+    Args:
+        params (dict): Scenario parameter names mapped to either a list of values to
+            choose from, or a {"low": ..., "high": ...} range to draw uniformly from.
+        samples (int): The number of points to draw.
+        seed (int): The seed of the design.
+
+    Returns:
+        list: One dictionary of parameter changes per point.
+    """
+    rng = random.Random(seed)
+    points = []
+    for _ in range(samples):
+        point = {}
+        for name, spec in params.items():
+            if isinstance(spec, dict):
+                point[name] = rng.uniform(spec["low"], spec["high"])
+            else:
+                point[name] = rng.choice(spec)
+        points.append(point)
+    return points
+
+class ResultCache:
+    """
+    Stores sweep aggregates on disk, addressed by a hash of everything that can change them.
+
+    Attributes:
+        directory (str): The directory the cached aggregates are stored in.
+    """
+
+    def __init__(self, directory=".sweep_cache"):
+        self.directory = directory
+
+    @staticmethod
+    def key(scenario, seed_start, seed_stop, player_count, round_limit, strategies):
+        """
+        Hashes the inputs of a simulation batch together with the engine version.
+
+        Args:
+            scenario (Scenario): The scenario simulated.
+            seed_start (int): The first seed (inclusive).
+            seed_stop (int): The last seed (exclusive).
+            player_count (int): The number of players per game.
+            round_limit (int): The number of rounds per game.
+            strategies (tuple): Strategy names assigned to players in turn.
+
+        Returns:
+            str: The hex digest addressing the batch's aggregate.
+        """
+        payload = json.dumps({
+            "engine": ENGINE_VERSION,
+            "scenario": scenario.to_dict(),
+            "seeds": [seed_start, seed_stop],
+            "players": player_count,
+            "rounds": round_limit,
+            "strategies": list(strategies)
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        """
+        Returns the file an aggregate is cached in, sharded by the first two hex digits of its key.
+        """
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """
+        Loads a cached aggregate.
+
+        Args:
+            key (str): The key returned by `key`.
+
+        Returns:
+            Aggregate: The cached aggregate, or None if it has not been computed yet.
+        """
+        try:
+            with open(self.path(key), encoding="utf-8") as file:
+                return Aggregate.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, aggregate):
+        """
+        Stores an aggregate, replacing the file atomically so readers never see a partial write.
+
+        Args:
+            key (str): The key returned by `key`.
+            aggregate (Aggregate): The aggregate to store.
+        """
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            json.dump(aggregate.to_dict(), file)
+        os.replace(temp_path, path)
+
+def _run_chunk(arguments):
+    return arguments[0], run_batch(*arguments[1:])
+
+def run_sweep(points, seed_start, seed_stop, player_count=4, round_limit=None, strategies=("random",),
+              base_scenario=DEFAULT_SCENARIO, workers=None, cache=None):
+    """
+    Simulates every point of a design, reusing cached aggregates for points that have not changed.
+
+    Each uncached point's seed range is split into chunks that run in parallel worker processes.
+
+    Args:
+        points (list): Dictionaries of scenario parameter changes, e.g. from `grid_design`.
+        seed_start (int): The first seed simulated for each point (inclusive).
+        seed_stop (int): The last seed simulated for each point (exclusive).
+        player_count (int): The number of players per game.
+        round_limit (int, optional): The number of rounds per game.
+        strategies (iterable): Strategy names assigned to players in turn.
+        base_scenario (Scenario): The scenario each point's changes are applied to.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+        cache (ResultCache, optional): Where aggregates are cached. Defaults to ResultCache().
+
+    Returns:
+        list: (parameter changes, Aggregate) pairs in the order of `points`.
+    """
+    cache = ResultCache() if cache is None else cache
+    workers = workers or os.cpu_count() or 1
+    strategies = tuple(strategies)
+
+    aggregates, keys, chunks = {}, [], []
+    for changes in points:
+        scenario = base_scenario.with_changes(**changes)
+        key = cache.key(scenario, seed_start, seed_stop, player_count, round_limit, strategies)
+        keys.append(key)
+        if key in aggregates:
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            aggregates[key] = cached
+            continue
+        aggregates[key] = Aggregate()
+        for start, stop in split_seeds(seed_start, seed_stop, workers):
+            chunks.append((key, scenario, start, stop, player_count, round_limit, strategies))
+
+    if chunks:
+        computed = set()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for key, aggregate in executor.map(_run_chunk, chunks):
+                aggregates[key].merge(aggregate)
+                computed.add(key)
+        for key in computed:
+            cache.put(key, aggregates[key])
+
+    return [(changes, aggregates[key]) for changes, key in zip(points, keys)]
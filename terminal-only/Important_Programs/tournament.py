@@ -0,0 +1,258 @@
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from .scenario import DEFAULT_SCENARIO
+from .simulation import HeadlessGame
+
+def expected_score(rating, opponent_rating):
+    """
+    Computes the Elo expected score of one player against another.
+
+    Args:
+        rating (float): The player's rating.
+        opponent_rating (float): The opponent's rating.
+
+    Returns:
+        float: The expected score, between 0 and 1.
+    """
+    return 1.0 / (1.0 + 10 ** ((opponent_rating - rating) / 400))
+
+def play_match(scenario, strategies, seeds, round_limit=None):
+    """
+    Plays one headless game per seed between a group of strategies and scores every pairing.
+
+    The seats are rotated from game to game, so no strategy keeps the first turn.
+    Within a game, a strategy scores 1 against every strategy it finishes above
+    (by `rank_players`), and 0.5 against any with the same bank.
+
+    Args:
+        scenario (Scenario): The game parameters.
+        strategies (tuple): The strategies in the match, one player each.
+        seeds (range): The seeds of the games to play.
+        round_limit (int, optional): The number of rounds per game.
+
+    Returns:
+        dict: (strategy, opponent) pairs mapped to the strategy's total score against the opponent.
+    """
+    scores = Counter()
+    for game_number, seed in enumerate(seeds):
+        shift = game_number % len(strategies)
+        seating = strategies[shift:] + strategies[:shift]
+        standings = HeadlessGame(seed, len(seating), round_limit, scenario, seating).start_game().standings
+        for index, standing in enumerate(standings):
+            for other in standings[index + 1:]:
+                if standing.bank == other.bank:
+                    scores[standing.strategy, other.strategy] += 0.5
+                    scores[other.strategy, standing.strategy] += 0.5
+                else:
+                    scores[standing.strategy, other.strategy] += 1
+    return scores
+
+def _play_match(arguments):
+    return play_match(*arguments)
+
+class Tournament:
+    """
+    Rates strategies against each other with a Swiss-system tournament.
+
+    Every round, strategies are sorted by rating and seated in groups of similarly
+    rated strategies, avoiding a repeat of the previous round's groups where possible;
+    a strategy left over when the groups are filled sits the round out. All matches of a
+    round are played concurrently, then every rating is updated at once from the
+    round's results, with the K-factor shrinking each round so the ratings settle.
+
+    The tournament plays until its game budget is spent, or until no rating moves by
+    more than `tolerance` in a round. Each round's games are shared out between its
+    matches in proportion to how uncertain their outcome is (E * (1 - E) for the
+    expected score E), so close matchups get most of the games and lopsided ones get few.
+
+    Attributes:
+        ratings (dict): Strategy names mapped to Elo ratings.
+        games (Counter): Strategy names mapped to the number of games they have played.
+        rounds (int): The number of rounds played.
+        games_played (int): The number of games played in total.
+        next_seed (int): The seed of the next game.
+        previous (set): The groups of the previous round, as frozensets.
+        history (list): The largest rating change of each round.
+    """
+
+    def __init__(self, strategies, table_size=2, budget=1000, games_per_round=None, seed=0, round_limit=None,
+                 scenario=None, k_factor=32.0, tolerance=0.5, initial_rating=1500.0):
+        """
+        Sets up a tournament between strategies.
+
+        Args:
+            strategies (iterable): Strategy names from STRATEGIES.
+            table_size (int): The number of strategies seated in each game.
+            budget (int): The most games the tournament plays.
+            games_per_round (int, optional): The games shared out each round. Defaults to 8 per match.
+            seed (int): The seed of the first game; games use consecutive seeds.
+            round_limit (int, optional): The number of rounds per game.
+            scenario (Scenario, optional): The game parameters.
+            k_factor (float): The K-factor of the first round.
+            tolerance (float): Stop once no rating changes by more than this in a round.
+            initial_rating (float): Every strategy's starting rating.
+
+        Raises:
+            ValueError: If fewer than two strategies are given or the table size is below two.
+        """
+        strategies = list(dict.fromkeys(strategies))
+        if len(strategies) < 2:
+            raise ValueError("A tournament needs at least two different strategies.")
+        if table_size < 2:
+            raise ValueError("A tournament needs at least two strategies per game.")
+        self.table_size = min(table_size, len(strategies))
+        self.budget = budget
+        self.games_per_round = games_per_round
+        self.round_limit = round_limit
+        self.scenario = DEFAULT_SCENARIO if scenario is None else scenario
+        self.k_factor = k_factor
+        self.tolerance = tolerance
+        self.ratings = dict.fromkeys(strategies, initial_rating)
+        self.games = Counter()
+        self.rounds = 0
+        self.games_played = 0
+        self.next_seed = seed
+        self.previous = set()
+        self.history = []
+
+    def pair_round(self):
+        """
+        Seats the strategies in groups of similar rating for the next round.
+
+        Returns:
+            list: Tuples of strategies, one per match.
+        """
+        unseated = sorted(self.ratings, key=lambda strategy: (-self.ratings[strategy], strategy))
+        groups = []
+        while len(unseated) >= 2:
+            group = unseated[:self.table_size]
+            if frozenset(group) in self.previous and len(unseated) > len(group):
+                group[-1] = unseated[len(group)]
+            for strategy in group:
+                unseated.remove(strategy)
+            groups.append(tuple(group))
+        return groups
+
+    def closeness(self, group):
+        """
+        Measures how uncertain a match's outcome is.
+
+        Args:
+            group (tuple): The strategies in the match.
+
+        Returns:
+            float: The mean of E * (1 - E) over every pairing, at most 0.25 for an even match.
+        """
+        pairs = [(a, b) for index, a in enumerate(group) for b in group[index + 1:]]
+        return sum(expected * (1 - expected) for expected in
+                   (expected_score(self.ratings[a], self.ratings[b]) for a, b in pairs)) / len(pairs)
+
+    def allocate(self, groups, games):
+        """
+        Shares a round's games out between its matches, favouring close matchups.
+
+        Every match gets at least one game, and the rest are handed out in proportion
+        to each match's closeness, largest remainders first. If there are fewer games
+        than matches, only the closest matches are played.
+
+        Args:
+            groups (list): The round's matches.
+            games (int): The games to share out.
+
+        Returns:
+            list: (group, number of games) pairs for the matches that are played.
+        """
+        groups = sorted(groups, key=self.closeness, reverse=True)[:games]
+        weights = [self.closeness(group) for group in groups]
+        spare = games - len(groups)
+        total = sum(weights) or 1.0
+        shares = [spare * weight / total for weight in weights]
+        counts = [1 + int(share) for share in shares]
+        leftover = games - sum(counts)
+        for index in sorted(range(len(groups)), key=lambda index: int(shares[index]) - shares[index])[:leftover]:
+            counts[index] += 1
+        return list(zip(groups, counts))
+
+    def update(self, results, k_factor):
+        """
+        Updates every rating at once from a round's results.
+
+        A strategy's rating moves by the K-factor times its mean score minus its expected
+        score, averaged over its opponents in the match.
+
+        Args:
+            results (list): (group, number of games, scores) triples, with scores from `play_match`.
+            k_factor (float): The round's K-factor.
+
+        Returns:
+            float: The largest rating change.
+        """
+        changes = Counter()
+        for group, count, scores in results:
+            for strategy in group:
+                opponents = [other for other in group if other != strategy]
+                surprise = sum(scores[strategy, other] / count
+                               - expected_score(self.ratings[strategy], self.ratings[other])
+                               for other in opponents)
+                changes[strategy] += k_factor * surprise / len(opponents)
+                self.games[strategy] += count
+        for strategy, change in changes.items():
+            self.ratings[strategy] += change
+        return max((abs(change) for change in changes.values()), default=0.0)
+
+    def play_round(self, executor=None):
+        """
+        Pairs, plays and rates one Swiss round.
+
+        Args:
+            executor (Executor, optional): Where the round's matches are played. Defaults to this process.
+
+        Returns:
+            float: The largest rating change in the round.
+        """
+        groups = self.pair_round()
+        games = min(self.games_per_round or 8 * len(groups), self.budget - self.games_played)
+        matches = []
+        for group, count in self.allocate(groups, games):
+            matches.append((group, count, (self.scenario, group, range(self.next_seed, self.next_seed + count),
+                                           self.round_limit)))
+            self.next_seed += count
+        arguments = [match[2] for match in matches]
+        outcomes = executor.map(_play_match, arguments) if executor is not None else map(_play_match, arguments)
+        results = [(group, count, scores) for (group, count, _), scores in zip(matches, outcomes)]
+
+        self.rounds += 1
+        self.games_played += games
+        self.previous = {frozenset(group) for group, _, _ in results}
+        change = self.update(results, self.k_factor / math.sqrt(self.rounds))
+        self.history.append(change)
+        return change
+
+    def run(self, workers=None):
+        """
+        Plays rounds until the budget is spent or the ratings have settled.
+
+        Args:
+            workers (int, optional): The number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            list: (strategy, rating, games played) triples, highest rated first.
+        """
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while self.games_played < self.budget:
+                if self.play_round(executor) <= self.tolerance:
+                    break
+        return self.standings()
+
+    def standings(self):
+        """
+        Lists the strategies by rating.
+
+        Returns:
+            list: (strategy, rating, games played) triples, highest rated first.
+        """
+        return [(strategy, self.ratings[strategy], self.games[strategy])
+                for strategy in sorted(self.ratings, key=lambda strategy: (-self.ratings[strategy], strategy))]
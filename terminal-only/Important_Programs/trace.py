@@ -0,0 +1,134 @@
+import gzip
+import json
+from collections import deque
+from itertools import zip_longest
+from .game_logic import BankManagement
+from .simulation import ENGINE_VERSION, HeadlessGame
+
+def open_trace(path, mode="r"):
+    """
+    Opens a trace file for text reading or writing, gzip-compressed if the path ends in .gz.
+
+    Args:
+        path (str): The path of the trace file.
+        mode (str): "r" to read or "w" to write.
+
+    Returns:
+        TextIO: The open file.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="\n")
+    return open(path, mode, encoding="utf-8", newline="\n", buffering=1 << 20)
+
+class TraceWriter:
+    """
+    Writes game events as a compact, line-per-event trace.
+
+    Every line is `<event type>\\t<player ID or ->\\t<JSON payload>`, with the payload's
+    keys sorted so equal events always produce equal lines. Each game starts with a
+    "game" line holding its seed, round limit and starting players. Lines starting with
+    "#" are comments and are ignored when traces are compared. An instance can be
+    passed to HeadlessGame as its `on_event` callback.
+
+    Attributes:
+        file (TextIO): The file the trace is written to.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.file.write(f"# money-game trace, engine {ENGINE_VERSION}\n")
+
+    def write(self, event_type, player_id, payload):
+        self.file.write(f"{event_type}\t{'-' if player_id is None else player_id}\t"
+                        f"{json.dumps(payload, separators=(',', ':'), sort_keys=True)}\n")
+
+    def start_game(self, game):
+        """
+        Writes the line that opens a game.
+
+        Args:
+            game (HeadlessGame): The game about to be played.
+        """
+        self.write("game", None, {
+            "seed": game.seed,
+            "round_limit": game.round_limit,
+            "players": [[player.id, player.job_title, player.job_income, BankManagement.deformat_currency(player.bank)]
+                        for player in game.players]
+        })
+
+    def __call__(self, event_type, payload):
+        payload = dict(payload)
+        self.write(event_type, payload.pop("player", None), payload)
+
+def record_traces(path, seed_start, seed_stop, player_count=4, round_limit=None, strategies=("random",),
+                  scenario=None):
+    """
+    Plays one headless game per seed and writes all of their events to a trace file.
+
+    Args:
+        path (str): The trace file to write; compressed if it ends in .gz.
+        seed_start (int): The first seed (inclusive).
+        seed_stop (int): The last seed (exclusive).
+        player_count (int): The number of players per game.
+        round_limit (int, optional): The number of rounds per game.
+        strategies (iterable): Strategy names assigned to players in turn.
+        scenario (Scenario, optional): The game parameters.
+
+    Returns:
+        int: The number of games recorded.
+    """
+    with open_trace(path, "w") as file:
+        writer = TraceWriter(file)
+        for seed in range(seed_start, seed_stop):
+            game = HeadlessGame(seed, player_count, round_limit, scenario, strategies, on_event=writer)
+            writer.start_game(game)
+            game.start_game()
+    return seed_stop - seed_start
+
+def _events(file):
+    for number, line in enumerate(file, start=1):
+        if not line.startswith("#"):
+            yield number, line.rstrip("\n")
+
+def diff_traces(path_a, path_b, context=5):
+    """
+    Finds the first event where two traces disagree.
+
+    Both traces are streamed side by side, so memory use depends only on `context`
+    and the number of players, never on the length of the traces.
+
+    Args:
+        path_a (str): The first trace, e.g. from the old engine.
+        path_b (str): The second trace, e.g. from the new engine.
+        context (int): How many events to show on each side of the divergence.
+
+    Returns:
+        dict: None if the traces match. Otherwise:
+            "line_a" / "line_b": the line numbers of the diverging events,
+            "a" / "b": the diverging events (None if that trace ended first),
+            "game": the "game" line of the game it happened in,
+            "before": the events shared by both traces just before the divergence,
+            "after_a" / "after_b": the events following the divergence in each trace,
+            "players": each player's last shared action event, giving their bank at that point.
+    """
+    with open_trace(path_a) as file_a, open_trace(path_b) as file_b:
+        events_a, events_b = _events(file_a), _events(file_b)
+        before = deque(maxlen=context)
+        game = None
+        players = {}
+        for (number_a, a), (number_b, b) in zip_longest(events_a, events_b, fillvalue=(None, None)):
+            if a != b:
+                return {
+                    "line_a": number_a, "line_b": number_b, "a": a, "b": b, "game": game,
+                    "before": list(before),
+                    "after_a": [line for _, line in zip(range(context), (line for _, line in events_a))],
+                    "after_b": [line for _, line in zip(range(context), (line for _, line in events_b))],
+                    "players": players
+                }
+            if a.startswith("action\t"):
+                players[a.split("\t", 2)[1]] = a
+            elif a.startswith("game\t"):
+                game = a
+                players = {}
+            before.append(a)
+    return None
@@ -1,4 +1,5 @@
 import os
+import sys
 
 def log(message):
     """
@@ -21,12 +22,16 @@ def clear_terminal():
     """
     Clears the terminal screen.
     """
+    # Nothing to clear when the output is piped or redirected
+    if not sys.stdout.isatty():
+        return
     # Clear command for Windows
     if os.name == 'nt':
         _ = os.system('cls')
-    # Clear command for Unix/Linux/MacOS
+    # Clear Unix/Linux/MacOS terminals with an ANSI escape instead of spawning `clear`
     else:
-        _ = os.system('clear')
+        sys.stdout.write("\033[H\033[2J")
+        sys.stdout.flush()
 
 def new_line():
     return print("\n")
\ No newline at end of file
@@ -1,16 +1,24 @@
+import argparse
 import sys
+from contextlib import nullcontext
+from Important_Programs.advisor import Advisor
+from Important_Programs.config_reload import ScenarioWatcher
 from Important_Programs.game_logic import GameLogic
 from Important_Programs.player_setup import Startup
 from Important_Programs.game_play import GamePlay
 from Important_Programs.Input_Handling import Security
+from Important_Programs.high_scores import HighScoreStore
+from Important_Programs.memory_report import MemoryReport
+from Important_Programs.profiling import profile_run
+from Important_Programs.scenario import load_scenario
 from Important_Programs.ulits import splash_screen
 
-def main():
+def main(score_store=None, scenario=None, advisor=None, memory_report=None):
     sys.path.append("Important_Programs")
     security = Security()
     
     # Initialize GameLogic without players initially
-    gamelogic = GameLogic()
+    gamelogic = GameLogic(scenario)
 
     startup = Startup(gamelogic, security)
     splash_screen()
@@ -21,17 +29,65 @@ def main():
     # Reinitialize GameLogic with players
     # gamelogic = GameLogic()
     
-    gameplay = GamePlay(players, round_limit, gamelogic)
+    gameplay = GamePlay(players, round_limit, gamelogic, score_store, advisor=advisor)
+    if memory_report is not None:
+        memory_report.watch(gameplay)
     gameplay.start_game()
     gameplay.format_player_banks()  # Format player banks after the game ends
 
-def restart_game():
-    while True:
-        main()
-        restart = Security.sanitize_input(input("Do you want to restart the game? (yes/no): ").lower())
-        if restart not in ['yes', 'y', '1']:
-            break
+def dashboard_main(score_store=None, scenario=None, player_count=2, round_limit=None, advisor=None,
+                   memory_report=None):
+    from Important_Programs.dashboard import run_dashboard
+
+    game = run_dashboard(player_count, round_limit, scenario, advisor=advisor, memory_report=memory_report)
+    if game.finished:
+        game.announce_winner()
+        if score_store is not None:
+            score_store.record_game(game.players, game.round_limit, game.unlocked_achievements())
+
+def restart_game(scenario=None, ui="terminal", player_count=2, round_limit=None, advise=False, report_memory=False,
+                 watcher=None):
+    # One advisor serves every game, so its memoised hints carry over between restarts
+    advisor = Advisor(scenario) if advise else None
+    # One report follows every game, so memory that survives a restart shows up
+    memory_report = MemoryReport() if report_memory else None
+    with HighScoreStore() as score_store:
+        while True:
+            # A reloaded scenario goes live between games; the advisor's hints only hold for the old one
+            if watcher is not None and watcher.swap() is not scenario:
+                scenario = watcher.current
+                advisor = Advisor(scenario) if advise else None
+            if ui == "curses":
+                dashboard_main(score_store, scenario, player_count, round_limit, advisor, memory_report)
+            else:
+                main(score_store, scenario, advisor, memory_report)
+            if memory_report is not None:
+                memory_report.log_report(last=memory_report.window + 1)
+            restart = Security.read_line("Do you want to restart the game? (yes/no): ").lower()
+            if restart not in ['yes', 'y', '1']:
+                break
 
 # In the main block:
 if __name__ == "__main__":
-    restart_game()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Play the Money-Game in the terminal.")
+    parser.add_argument("--scenario", help="A .toml or .json scenario file with the game parameters.")
+    parser.add_argument("--ui", choices=["terminal", "curses"], default="terminal",
+                        help="Play with line-by-line prompts or in the full-screen curses dashboard.")
+    parser.add_argument("--players", type=int, default=2, help="The number of players in the curses dashboard.")
+    parser.add_argument("--rounds", type=int, help="The number of rounds in the curses dashboard.")
+    parser.add_argument("--advisor", action="store_true",
+                        help="Show the strategy advisor's hint at the start of every turn.")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Run under a sampling profiler, write its collapsed stacks to FILE on exit "
+                             "and log the hotspots by subsystem.")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="Account for retained memory at every round boundary and flag steady growth.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Reload the scenario file whenever it changes; each new game starts with the latest version.")
+    args = parser.parse_args()
+    if args.watch and not args.scenario:
+        parser.error("--watch needs a --scenario file to watch.")
+    watcher = ScenarioWatcher(args.scenario) if args.watch else None
+    with profile_run(args.profile) if args.profile else nullcontext(), watcher or nullcontext():
+        restart_game(watcher.current if watcher else load_scenario(args.scenario) if args.scenario else None,
+                     args.ui, args.players, args.rounds, args.advisor, args.memory_report, watcher)
\ No newline at end of file
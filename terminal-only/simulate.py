@@ -0,0 +1,346 @@
+import argparse
+import json
+import os
+import shlex
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from Important_Programs.cluster import run_cluster, work
+from Important_Programs.config_reload import ScenarioWatcher
+from Important_Programs.distribution import STRATEGY_PLANS, analyse
+from Important_Programs.game_logic import BankManagement
+from Important_Programs.http_api import serve
+from Important_Programs.long_horizon import LongHorizonGame
+from Important_Programs.profiling import profile_run
+from Important_Programs.record_store import RecordWriter
+from Important_Programs.scenario import DEFAULT_SCENARIO, load_scenario
+from Important_Programs.shared_market import SharedMarket
+from Important_Programs.simulation import STRATEGIES, Aggregate, HeadlessGame, run_batch, split_seeds
+from Important_Programs.simultaneous import SimultaneousGame
+from Important_Programs.stress import InvariantViolation, stress
+from Important_Programs.trace import diff_traces, record_traces
+from Important_Programs.tournament import Tournament
+from Important_Programs.sweep import ResultCache, grid_design, random_design, run_sweep
+from Important_Programs.ulits import log
+
+def print_summary(aggregate):
+    """
+    Logs the summary of an aggregate.
+
+    Args:
+        aggregate (Aggregate): The aggregated results.
+    """
+    summary = aggregate.summary()
+    log(f"Games: {summary['Games']}")
+    log(f"Mean winning bank: {BankManagement.format_currency(summary['Mean Winning Bank'])}")
+    for strategy, stats in summary["Strategies"].items():
+        log(f"  {strategy}: win rate {stats['Win Rate']:.2%}, "
+            f"mean bank {BankManagement.format_currency(stats['Mean Bank'])} "
+            f"(std {BankManagement.format_currency(stats['Std Bank'])})")
+
+def run_command(args, scenario):
+    """
+    Simulates a batch of games in parallel and logs the summary.
+    """
+    aggregate = Aggregate()
+    game_class = SimultaneousGame if args.simultaneous else LongHorizonGame if args.long_horizon else HeadlessGame
+    if args.profile is not None:
+        # The profiler only samples this process, so every game is played here
+        with profile_run(args.profile):
+            aggregate.merge(run_batch(scenario, args.seed, args.seed + args.games, args.players, args.rounds,
+                                      args.strategies, game_class, args.records))
+    else:
+        chunks = split_seeds(args.seed, args.seed + args.games, args.workers)
+        # Each worker writes its own part in a fresh directory beside the output, so parts left by an
+        # interrupted run are never merged, and the parts are appended in seed order afterwards
+        part_dir = None if args.records is None else tempfile.mkdtemp(
+            prefix=f".{os.path.basename(args.records)}.", dir=os.path.dirname(os.path.abspath(args.records)))
+        parts = [None] * len(chunks) if part_dir is None else [os.path.join(part_dir, f"part{index}")
+                                                                for index in range(len(chunks))]
+        try:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                futures = [executor.submit(run_batch, scenario, start, stop, args.players, args.rounds,
+                                           args.strategies, game_class, part)
+                           for (start, stop), part in zip(chunks, parts)]
+                for future in futures:
+                    aggregate.merge(future.result())
+            if part_dir is not None:
+                with RecordWriter(args.records, args.players, scenario, args.strategies) as writer:
+                    for part in parts:
+                        writer.append_file(part)
+        finally:
+            if part_dir is not None:
+                shutil.rmtree(part_dir, ignore_errors=True)
+    if args.records is not None:
+        log(f"Appended {args.games} game records to {args.records}")
+    print_summary(aggregate)
+
+def coordinate_command(args, scenario):
+    """
+    Hands a batch of games out to workers over TCP and logs the merged summary.
+    """
+    game_class = "simultaneous" if args.simultaneous else "long_horizon" if args.long_horizon else "headless"
+    aggregate = run_cluster(args.seed, args.seed + args.games, args.players, args.rounds, args.strategies, scenario,
+                            game_class, args.host, args.port, args.local_workers, args.chunk_size,
+                            args.lease_timeout,
+                            on_listen=lambda address: log(f"Coordinating on {address[0]}:{address[1]}"))
+    print_summary(aggregate)
+
+def worker_command(args, scenario):
+    """
+    Plays games for a coordinator until it has none left.
+    """
+    played = work(args.host, args.port)
+    log(f"Played {played} chunks for {args.host}:{args.port}.")
+
+def sweep_command(args, scenario):
+    """
+    Runs a parameter sweep described by a JSON spec file and logs each point's summary.
+
+    The spec holds either {"grid": {parameter: [values]}} or
+    {"random": {"samples": N, "seed": S, "params": {parameter: [values] or {"low": L, "high": H}}}}.
+    """
+    with open(args.spec, encoding="utf-8") as file:
+        spec = json.load(file)
+    if "grid" in spec:
+        points = grid_design(spec["grid"])
+    else:
+        design = spec["random"]
+        points = random_design(design["params"], design["samples"], design.get("seed", 0))
+
+    results = run_sweep(points, args.seed, args.seed + args.games, args.players, args.rounds, args.strategies,
+                        scenario, args.workers, ResultCache(args.cache))
+    for changes, aggregate in results:
+        log(f"Point: {json.dumps(changes)}")
+        print_summary(aggregate)
+
+def stress_command(args, scenario):
+    """
+    Plays games with random legal and illegal inputs, checking invariants after every action.
+
+    Seeds are split into more chunks than workers so the run can stop soon after a
+    violation; the lowest failing seed is reported, shrunk to the smallest failing game.
+    """
+    started = time.perf_counter()
+    chunks = split_seeds(args.seed, args.seed + args.games, args.workers * 4)
+    actions = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(stress, start, stop, args.players, args.rounds, scenario)
+                   for start, stop in chunks]
+        for index, future in enumerate(futures):
+            try:
+                actions += future.result()
+            except InvariantViolation as violation:
+                for later in futures[index + 1:]:
+                    later.cancel()
+                log(f"Invariant violated: {violation}")
+                scenario_option = f" --scenario {shlex.quote(args.scenario)}" if args.scenario else ""
+                log(f"Reproduce with: simulate.py stress --seed {violation.seed} --games 1 "
+                    f"--players {violation.player_count} --rounds {violation.round_limit}{scenario_option}")
+                raise SystemExit(1)
+    elapsed = time.perf_counter() - started
+    log(f"{args.games} games and {actions} actions checked in {elapsed:.2f}s "
+        f"({args.games / elapsed:.0f} games/s). No invariant was violated.")
+
+def tournament_command(args, scenario):
+    """
+    Rates strategies against each other in a Swiss-system tournament and logs the standings.
+    """
+    tournament = Tournament(args.strategies, args.players, args.games, args.games_per_round, args.seed,
+                            args.rounds, scenario, args.k_factor, args.tolerance)
+    standings = tournament.run(args.workers)
+    log(f"{tournament.games_played} games in {tournament.rounds} rounds; "
+        f"last rating change {tournament.history[-1]:.2f}.")
+    for rank, (strategy, rating, games) in enumerate(standings, start=1):
+        log(f"  {rank}. {strategy}: {rating:.0f} ({games} games)")
+
+def exact_command(args, scenario):
+    """
+    Computes the exact final-bank distributions of fixed-plan players and logs their odds.
+    """
+    incomes = (args.incomes or [0.0]) * len(args.plans)
+    plans = [plan if plan in STRATEGY_PLANS else tuple(tuple(action.split(":")) for action in plan.split(","))
+             for plan in args.plans]
+    try:
+        results = analyse(plans, incomes[:len(plans)], args.rounds, scenario)
+    except ValueError as error:
+        log(f"Error: {error}")
+        raise SystemExit(1)
+    for plan, income, result in zip(args.plans, incomes, results):
+        percentiles = ", ".join(f"p{fraction * 100:.0f} {BankManagement.format_currency(value)}"
+                                for fraction, value in result["Percentiles"].items())
+        log(f"  {plan} (income {BankManagement.format_currency(income)}): "
+            f"win probability {result['Win Probability']:.2%}, "
+            f"mean bank {BankManagement.format_currency(result['Mean'])}")
+        log(f"    {percentiles}")
+
+def trace_command(args, scenario):
+    """
+    Records the events of a range of games to a trace file.
+    """
+    games = record_traces(args.output, args.seed, args.seed + args.games, args.players, args.rounds,
+                          args.strategies, scenario)
+    log(f"Recorded {games} games to {args.output}")
+
+def diff_command(args, scenario):
+    """
+    Compares two trace files and logs the first diverging event with the state around it.
+    """
+    divergence = diff_traces(args.trace_a, args.trace_b, args.context)
+    if divergence is None:
+        log("The traces are identical.")
+        return
+    log(f"The traces diverge at line {divergence['line_a']} of {args.trace_a} "
+        f"and line {divergence['line_b']} of {args.trace_b}.")
+    log(f"Game: {divergence['game']}")
+    log("Player state before the divergence:")
+    for line in divergence["players"].values():
+        log(f"    {line}")
+    log("Shared events before the divergence:")
+    for line in divergence["before"]:
+        log(f"    {line}")
+    log(f"  - {divergence['a']}")
+    for line in divergence["after_a"]:
+        log(f"  - {line}")
+    log(f"  + {divergence['b']}")
+    for line in divergence["after_b"]:
+        log(f"  + {line}")
+    raise SystemExit(1)
+
+def serve_command(args, scenario):
+    """
+    Serves games over the HTTP/JSON API until interrupted.
+    """
+    market = None if args.shared_stock is None else SharedMarket(scenario, args.shared_stock)
+    if not args.watch:
+        log(f"Serving games on http://{args.host}:{args.port}")
+        serve(args.host, args.port, scenario, market)
+        return
+    if not args.scenario:
+        log("Error: --watch needs a --scenario file to watch.")
+        raise SystemExit(1)
+    with ScenarioWatcher(args.scenario, args.watch_interval) as watcher:
+        log(f"Serving games on http://{args.host}:{args.port}, reloading {args.scenario} as it changes")
+        serve(args.host, args.port, scenario, market, watcher)
+
+def common_options(players=4, strategies=("random",)):
+    """
+    Builds the options shared by the simulation subcommands.
+
+    Each subcommand gets its own copy, because argparse shares a parent's actions
+    with every child, so changing one child's defaults would change them all.
+
+    Args:
+        players (int): The default number of players per game.
+        strategies (iterable): The default strategies.
+
+    Returns:
+        ArgumentParser: A parent parser holding the options.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--scenario", help="A .toml or .json scenario file with the game parameters.")
+    common.add_argument("--games", type=int, default=1000, help="The number of games to simulate.")
+    common.add_argument("--seed", type=int, default=0, help="The first seed; games use consecutive seeds.")
+    common.add_argument("--players", type=int, default=players, help="The number of players per game.")
+    common.add_argument("--rounds", type=int, help="The number of rounds per game.")
+    common.add_argument("--strategies", nargs="+", default=list(strategies), choices=sorted(STRATEGIES),
+                        help="Strategies assigned to players in turn.")
+    common.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="The number of worker processes.")
+    return common
+
+def build_parser():
+    common = common_options()
+
+    parser = argparse.ArgumentParser(description="Run headless Money-Game simulations.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", parents=[common], help="Simulate a batch of games.")
+    modes = run.add_mutually_exclusive_group()
+    modes.add_argument("--simultaneous", action="store_true",
+                       help="Collect every player's turn at once and resolve them together.")
+    modes.add_argument("--long-horizon", action="store_true",
+                       help="Fast-forward work-only players in closed form, for games with thousands of rounds.")
+    run.add_argument("--records", help="A record file to append every game's results to, as fixed-width records.")
+    run.add_argument("--profile", metavar="FILE",
+                     help="Play every game in this process under a sampling profiler, write its collapsed "
+                          "stacks to FILE and log the hotspots by subsystem.")
+    run.set_defaults(handler=run_command)
+
+    coordinate = commands.add_parser("coordinate", parents=[common],
+                                     help="Simulate a batch of games on workers connecting over TCP.")
+    coordinate_modes = coordinate.add_mutually_exclusive_group()
+    coordinate_modes.add_argument("--simultaneous", action="store_true",
+                                  help="Collect every player's turn at once and resolve them together.")
+    coordinate_modes.add_argument("--long-horizon", action="store_true",
+                                  help="Fast-forward work-only players in closed form.")
+    coordinate.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    coordinate.add_argument("--port", type=int, default=8765, help="The port to listen on.")
+    coordinate.add_argument("--chunk-size", type=int, default=200, help="The number of seeds in each lease.")
+    coordinate.add_argument("--lease-timeout", type=float, default=300.0,
+                            help="Seconds before an unreturned lease is handed to another worker.")
+    coordinate.add_argument("--local-workers", type=int, default=0,
+                            help="Worker processes to start on this machine as well.")
+    coordinate.set_defaults(handler=coordinate_command)
+
+    worker = commands.add_parser("worker", help="Play games for a coordinator.")
+    worker.add_argument("host", help="The coordinator's address.")
+    worker.add_argument("port", type=int, help="The coordinator's port.")
+    worker.set_defaults(handler=worker_command, scenario=None)
+
+    sweep = commands.add_parser("sweep", parents=[common], help="Simulate every point of a parameter sweep.")
+    sweep.add_argument("spec", help="A JSON file describing the sweep design.")
+    sweep.add_argument("--cache", default=".sweep_cache", help="The directory sweep results are cached in.")
+    sweep.set_defaults(handler=sweep_command)
+
+    stress_parser = commands.add_parser("stress", parents=[common],
+                                        help="Check game invariants against random legal and illegal inputs.")
+    stress_parser.set_defaults(handler=stress_command)
+
+    tournament = commands.add_parser("tournament", parents=[common_options(2, sorted(STRATEGIES))],
+                                     help="Rate strategies in a Swiss-system tournament; --games is the game budget "
+                                          "and --players the strategies seated per game.")
+    tournament.add_argument("--games-per-round", type=int, help="The games shared out between each round's matches.")
+    tournament.add_argument("--k-factor", type=float, default=32.0, help="The Elo K-factor of the first round.")
+    tournament.add_argument("--tolerance", type=float, default=0.5,
+                            help="Stop once no rating changes by more than this in a round.")
+    tournament.set_defaults(handler=tournament_command)
+
+    exact = commands.add_parser("exact", help="Compute exact final-bank distributions for players who play "
+                                              "the same turn every round.")
+    exact.add_argument("plans", nargs="+",
+                       help=f"One per player: {', '.join(STRATEGY_PLANS)} or a turn such as "
+                            f"work,work or search:treasure.")
+    exact.add_argument("--incomes", nargs="+", type=float,
+                       help="Each player's job income, repeated in turn. Defaults to 0.")
+    exact.add_argument("--rounds", type=int, help="The number of rounds.")
+    exact.add_argument("--scenario", help="A .toml or .json scenario file with the game parameters.")
+    exact.set_defaults(handler=exact_command)
+
+    trace = commands.add_parser("trace", parents=[common], help="Record the events of a range of games.")
+    trace.add_argument("output", help="The trace file to write; gzip-compressed if it ends in .gz.")
+    trace.set_defaults(handler=trace_command)
+
+    diff = commands.add_parser("diff", help="Find the first event where two traces disagree.")
+    diff.add_argument("trace_a", help="The first trace file.")
+    diff.add_argument("trace_b", help="The second trace file.")
+    diff.add_argument("--context", type=int, default=5, help="How many events to show around the divergence.")
+    diff.set_defaults(handler=diff_command, scenario=None)
+
+    server = commands.add_parser("serve", help="Serve games over a local HTTP/JSON API.")
+    server.add_argument("--scenario", help="A .toml or .json scenario file with the game parameters.")
+    server.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    server.add_argument("--port", type=int, default=8080, help="The port to listen on.")
+    server.add_argument("--shared-stock", type=int, metavar="UNITS",
+                        help="Share one shop between every game, stocked with UNITS of each item.")
+    server.add_argument("--watch", action="store_true",
+                        help="Reload the scenario file whenever it changes; new games start with the latest "
+                             "version and running games keep theirs. A shared shop keeps its starting items.")
+    server.add_argument("--watch-interval", type=float, default=1.0, metavar="SECONDS",
+                        help="How often to check the scenario file for changes.")
+    server.set_defaults(handler=serve_command)
+    return parser
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    args.handler(args, load_scenario(args.scenario) if args.scenario else DEFAULT_SCENARIO)
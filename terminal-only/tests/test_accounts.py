@@ -0,0 +1,58 @@
+import pytest
+from Important_Programs.accounts import AccountBook
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import HeadlessGame
+
+INTEREST = DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.05)
+
+def test_compounding_matches_round_by_round_interest():
+    balance = 1000.0
+    for _ in range(7):
+        balance *= 1.05
+    assert AccountBook.compound(1000.0, 0.05, 7) == pytest.approx(balance)
+    assert AccountBook.compound(-1000.0, 0.05, 7) == -1000.0
+
+def test_compound_series_matches_summing_each_payment():
+    payments = sum(AccountBook.compound(100.0, 0.05, rounds) for rounds in range(3, 3 + 6))
+    assert AccountBook.compound_series(100.0, 0.05, 3, 6) == pytest.approx(payments)
+    assert AccountBook.compound_series(100.0, 0.0, 3, 6) == 600.0
+
+def play_first_round(game):
+    while game.rounds == 0:
+        game.apply(("work",))
+    assert game.current_player.id == 1 and game.turn_used == 0
+
+def state(game):
+    ledger = game.gamelogic.ledger
+    return ([(player.bank, player.safe) for player in game.players], dict(game.gamelogic.accounts.touched),
+            len(ledger), game.turn_used)
+
+@pytest.mark.parametrize("action", [("fly",), ("steal", 1), ("steal", 9), ("buy", -1), ("use", "0"), ("work", 1)])
+def test_rejected_actions_leave_the_game_untouched(action):
+    game = HeadlessGame(2, 3, 3, INTEREST)
+    play_first_round(game)
+    before = state(game)
+    with pytest.raises(ValueError):
+        game.apply(action)
+    assert state(game) == before
+
+def test_interest_is_paid_once_per_round_after_a_rejected_action():
+    games = [HeadlessGame(2, 3, 3, INTEREST) for _ in range(2)]
+    for game in games:
+        play_first_round(game)
+    with pytest.raises(ValueError):
+        games[0].apply(("fly",))
+    for game in games:
+        game.apply(("work",))
+    assert state(games[0]) == state(games[1])
+
+def test_idle_balances_catch_up_in_one_step():
+    game = HeadlessGame(2, 3, 3, INTEREST)
+    accounts, ledger = game.gamelogic.accounts, game.gamelogic.ledger
+    player = game.players[2]
+    start = ledger.balance(player)
+    accounts.advance(4)
+    accounts.accrue(player)
+    assert ledger.balance(player) == pytest.approx(AccountBook.compound(start, 0.05, 4))
+    accounts.accrue(player)
+    assert ledger.balance(player) == pytest.approx(AccountBook.compound(start, 0.05, 4))
@@ -0,0 +1,56 @@
+from collections import Counter
+import pytest
+from Important_Programs.advisor import Advisor, bucket, describe_plan, format_advice, turn_plans
+from Important_Programs.game_play import GamePlay
+from Important_Programs.simulation import HeadlessGame
+
+def cost(plan):
+    return sum(GamePlay.ACTION_COSTS[action[0]] for action in plan)
+
+def test_turn_plans_are_distinct_and_fit_the_turn():
+    plans = turn_plans()
+    assert () in plans
+    assert len({frozenset(Counter(plan).items()) for plan in plans}) == len(plans)
+    for plan in plans:
+        # Every action but the last starts while the turn still has room
+        assert cost(plan[:-1]) < GamePlay.TURN_LIMIT
+
+def test_bucket_keeps_two_significant_figures():
+    assert bucket(123_456.0) == 120_000.0 and bucket(-0.0456) == -0.046
+
+def test_describe_plan():
+    assert describe_plan((("work",), ("work",))) == "2x Work"
+    assert describe_plan((("steal", 2), ("search", "stocks"))) == "Steal from #2, Search Stocks"
+    assert describe_plan(()) == "End Turn"
+
+def test_well_paid_players_are_told_to_work():
+    advisor = Advisor(round_limit=5)
+    plan, gain = advisor.best_expected(1_000_000.0, 0.0)
+    assert set(plan) == {("work",)} and gain == pytest.approx(len(plan) * 1_000_000.0)
+
+def test_hints_are_legal_turns_against_the_richest_rival():
+    game = HeadlessGame(6, 4, 5)
+    advisor = Advisor(game.gamelogic.scenario, game.round_limit)
+    player = game.current_player
+    for other, bank in zip(game.players, (1000.0, 5000.0, 2_000_000.0, 9000.0)):
+        game.gamelogic.ledger.pay(other, bank - game.gamelogic.ledger.balance(other), "setup")
+    advice = advisor.advise(player, game.players, 5)
+    assert advice["Rival"].id == 3
+    for name in ("Most Money", "Best Chance"):
+        plan = advice[name]["Plan"]
+        assert all(action[1] == 3 for action in plan if action[0] == "steal")
+        assert 0.0 <= advice[name]["Win Chance"] <= 1.0
+    lines = format_advice(advice, 5)
+    assert lines[0].startswith("Rival: #3") and len(lines) == 5
+
+    hints = len(advisor.hints)
+    advisor.advise(player, game.players, 5)
+    assert len(advisor.hints) == hints
+
+    for action in advice["Best Chance"]["Plan"]:
+        game.apply(action)
+
+def test_no_advice_without_an_opponent():
+    game = HeadlessGame(1, 1, 2)
+    assert Advisor(round_limit=2).advise(game.players[0], game.players, 2) is None
+    assert format_advice(None, 2) == ["No one to play against."]
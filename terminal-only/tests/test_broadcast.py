@@ -0,0 +1,67 @@
+import io
+import json
+import pytest
+from Important_Programs.broadcast import Broadcaster, Subscription
+from Important_Programs.game_play import GamePlay, play_steal, play_work
+from Important_Programs.Input_Handling import ScriptedInput, Security
+from Important_Programs.simulation import HeadlessGame
+
+def test_every_subscriber_gets_the_same_bytes():
+    broadcaster = Broadcaster()
+    first, second = broadcaster.subscribe(), broadcaster.subscribe()
+    broadcaster("turn_start", {"player": 1, "round": 1})
+    data = first.get(timeout=1)
+    assert data is second.get(timeout=1)
+    assert json.loads(data) == {"type": "turn_start", "seq": 1, "player": 1, "round": 1}
+
+def test_overflow_policies():
+    oldest, newest = Subscription(2, "drop_oldest"), Subscription(2, "drop_newest")
+    for number in range(3):
+        oldest.offer(("action", 1), number)
+        newest.offer(("action", 1), number)
+    assert oldest.drain() == [1, 2] and oldest.dropped == 1
+    assert newest.drain() == [0, 1] and newest.dropped == 1
+
+def test_coalesce_keeps_the_latest_of_each_key():
+    subscription = Subscription(2, "coalesce")
+    subscription.offer(("action", 1), "a")
+    subscription.offer(("action", 2), "b")
+    subscription.offer(("action", 1), "c")
+    assert subscription.drain() == ["b", "c"]
+    subscription.offer(("action", 3), "d")
+    subscription.offer(("action", 4), "e")
+    subscription.offer(("action", 5), "f")
+    assert subscription.drain() == ["e", "f"]
+
+def test_unsubscribed_readers_are_woken_and_skipped():
+    broadcaster = Broadcaster()
+    subscription = broadcaster.subscribe()
+    broadcaster.unsubscribe(subscription)
+    broadcaster.publish("round_complete", {"round": 1})
+    assert subscription.get(timeout=1) is None
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        Subscription(policy="drop_everything")
+
+@pytest.fixture
+def terminal(monkeypatch):
+    def play(lines):
+        monkeypatch.setattr(Security, "script", ScriptedInput(io.BytesIO(lines)))
+        game = HeadlessGame(3, 2, 1)
+        events = []
+        terminal_game = GamePlay(game.players, 1, game.gamelogic,
+                                 on_event=lambda *event: events.append(event))
+        return terminal_game, game.players[0], events
+    return play
+
+def test_terminal_actions_are_broadcast(terminal):
+    game, player, events = terminal(b"\n")
+    play_work(game, player)
+    [(event_type, payload)] = events
+    assert event_type == "action" and payload["action"] == "work" and payload["amount"] > 0
+
+def test_cancelled_terminal_actions_are_not_broadcast(terminal):
+    game, player, events = terminal(b"0\n\n")
+    play_steal(game, player)
+    assert events == []
@@ -0,0 +1,91 @@
+import io
+import socket
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from Important_Programs import cluster
+from Important_Programs.cluster import Coordinator, receive_message, send_message, work
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import run_batch
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cluster, "time", SimpleNamespace(monotonic=clock, sleep=time.sleep))
+    with Coordinator(("127.0.0.1", 0), 0, 12, 3, 2, chunk_size=4, lease_timeout=10.0) as coordinator:
+        coordinator.clock = clock
+        yield coordinator
+
+def chunk_of(lease):
+    return lease["start"], lease["stop"]
+
+def test_expired_leases_are_handed_to_another_worker(coordinator):
+    first = coordinator.lease()
+    second = coordinator.lease()
+    coordinator.clock.now = 5.0
+    assert chunk_of(coordinator.lease()) == (8, 12)
+    assert coordinator.lease()["type"] == "wait"
+    coordinator.clock.now = 11.0
+    retries = [coordinator.lease(), coordinator.lease()]
+    assert {chunk_of(retry) for retry in retries} == {chunk_of(first), chunk_of(second)}
+    assert not {retry["lease"] for retry in retries} & {first["lease"], second["lease"]}
+    assert coordinator.lease()["type"] == "wait"
+
+def test_a_chunk_played_twice_is_merged_once(coordinator):
+    first = coordinator.lease()
+    coordinator.clock.now = 11.0
+    retry = coordinator.lease()
+    assert chunk_of(retry) == chunk_of(first)
+    results = run_batch(DEFAULT_SCENARIO, *chunk_of(first), 3, 2)
+    coordinator.complete(retry["lease"], chunk_of(retry), results)
+    coordinator.complete(first["lease"], chunk_of(first), results)
+    assert coordinator.aggregate.games == 4
+    assert chunk_of(first) not in coordinator.remaining
+
+def test_released_leases_go_to_the_front_of_the_queue(coordinator):
+    first = coordinator.lease()
+    coordinator.release(first["lease"])
+    assert chunk_of(coordinator.lease()) == chunk_of(first)
+
+def test_a_disconnected_worker_gives_its_lease_back(coordinator):
+    threading.Thread(target=coordinator.serve_forever, daemon=True).start()
+    try:
+        with socket.create_connection(coordinator.server_address[:2]) as connection:
+            with connection.makefile("rwb") as file:
+                send_message(file, {"type": "hello"})
+                assert receive_message(file)["player_count"] == 3
+                send_message(file, {"type": "lease"})
+                lease = receive_message(file)
+        deadline = time.monotonic() + 5
+        while coordinator.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert coordinator.pending[0] == chunk_of(lease)
+
+        workers = [threading.Thread(target=work, args=coordinator.server_address[:2]) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        aggregate = coordinator.wait(timeout=30)
+        for worker in workers:
+            worker.join(timeout=5)
+    finally:
+        coordinator.shutdown()
+    merged, expected = aggregate.to_dict(), run_batch(DEFAULT_SCENARIO, 0, 12, 3, 2).to_dict()
+    # Chunks are merged in the order they come back, so sums may differ in their last bits
+    for field in ("winning_bank_sum", "bank_sum", "bank_square_sum"):
+        assert merged.pop(field) == pytest.approx(expected.pop(field))
+    assert merged == expected
+
+def test_malformed_messages_are_rejected():
+    with pytest.raises(ValueError):
+        receive_message(io.BytesIO(cluster.MESSAGE_HEADER.pack(cluster.MAX_MESSAGE_SIZE + 1)))
+    with pytest.raises(ValueError):
+        receive_message(io.BytesIO(cluster.MESSAGE_HEADER.pack(2) + b"[]"))
+    assert receive_message(io.BytesIO(b"\x00\x00")) is None
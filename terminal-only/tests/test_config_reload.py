@@ -0,0 +1,82 @@
+import json
+import time
+import pytest
+from Important_Programs import config_reload
+from Important_Programs.config_reload import ScenarioWatcher
+from Important_Programs.scenario import load_scenario
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "scenario.json"
+    path.write_text(json.dumps({"starting_bank": 100}))
+    return path
+
+def edit(path, data):
+    path.write_text(json.dumps(data))
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+def test_edits_wait_for_the_next_swap(path):
+    watcher = ScenarioWatcher(str(path))
+    assert (watcher.version, watcher.current.starting_bank) == (1, 100.0)
+    assert not watcher.check()
+    edit(path, {"starting_bank": 2500})
+    assert watcher.check()
+    assert (watcher.version, watcher.pending[0]) == (1, 2)
+    assert watcher.swap().starting_bank == 2500.0 and watcher.version == 2
+    assert watcher.swap() is watcher.current
+
+def test_broken_edits_keep_the_last_good_scenario(path, capsys):
+    watcher = ScenarioWatcher(str(path))
+    edit(path, {"starting_bank": "lots"})
+    assert not watcher.check()
+    assert "Kept scenario version 1" in capsys.readouterr().out
+    path.write_text("{\"starting_bank\": ")
+    assert not watcher.check()
+    path.unlink()
+    assert not watcher.check()
+    edit(path, {"starting_bank": 7})
+    assert watcher.check() and watcher.swap().starting_bank == 7.0 and watcher.version == 2
+
+def test_running_games_keep_their_scenario(path):
+    watcher = ScenarioWatcher(str(path))
+    game = HeadlessGame(1, 2, 3, watcher.current, on_event=watcher.round_boundary)
+    edit(path, {"starting_bank": 2500})
+    watcher.check()
+    game.apply(("end",))
+    assert watcher.version == 1
+    game.apply(("end",))
+    assert watcher.version == 2
+    assert game.gamelogic.scenario.starting_bank == 100.0
+    assert HeadlessGame(1, 2, 3, watcher.current).gamelogic.scenario.starting_bank == 2500.0
+
+def test_the_background_thread_picks_up_edits(path):
+    with ScenarioWatcher(str(path), interval=0.01) as watcher:
+        edit(path, {"starting_bank": 12345})
+        wait_for(lambda: watcher.pending[0] == 2)
+    assert watcher.thread is None
+    assert watcher.swap().starting_bank == 12345.0
+
+def test_unloadable_files_are_rejected_up_front(tmp_path):
+    path = tmp_path / "scenario.yaml"
+    path.write_text("starting_bank: 1")
+    with pytest.raises(ValueError):
+        ScenarioWatcher(str(path))
+
+def test_unexpected_load_errors_do_not_stop_the_watcher(path, monkeypatch, capsys):
+    def broken(path):
+        raise AttributeError("'list' object has no attribute 'items'")
+    with ScenarioWatcher(str(path), interval=0.01) as watcher:
+        monkeypatch.setattr(config_reload, "load_scenario", broken)
+        edit(path, {"starting_bank": 1})
+        wait_for(lambda: "could not be loaded" in capsys.readouterr().out)
+        assert watcher.thread.is_alive()
+        monkeypatch.setattr(config_reload, "load_scenario", load_scenario)
+        edit(path, {"starting_bank": 4321})
+        wait_for(lambda: watcher.pending[0] == 2)
+    assert watcher.swap().starting_bank == 4321.0
@@ -0,0 +1,81 @@
+from collections import deque
+from types import SimpleNamespace
+import pytest
+from Important_Programs import dashboard as dashboard_module, registry
+from Important_Programs.dashboard import Dashboard
+from Important_Programs.registry import Registry
+from Important_Programs.simulation import HeadlessGame
+
+class Keys:
+    """
+    Stands in for the curses screen, handing out scripted keys.
+    """
+
+    def __init__(self, keys):
+        self.keys = deque(keys)
+
+    def getkey(self):
+        return self.keys.popleft()
+
+def dashboard(keys, player_count=3):
+    # Skips Dashboard.__init__, which needs a real terminal
+    board = Dashboard.__new__(Dashboard)
+    board.screen = Keys(keys)
+    board.game = HeadlessGame(2, player_count, 2)
+    board.advisor = None
+    board.events = deque()
+    board.prompt = ""
+    board.redraw = lambda: None
+    return board
+
+@pytest.mark.parametrize("keys, choice", [
+    (["2"], 2),
+    (["9", "3"], 3),
+    (["\x1b"], None),
+    (["0"], None),
+    (["\n"], None),
+])
+def test_single_digit_choices_take_one_key(keys, choice):
+    assert dashboard(keys).ask_number("Pick", [2, 3]) == choice
+
+def test_numbers_past_nine_are_typed_in_full():
+    board = dashboard(["1", "2"])
+    assert board.ask_number("Pick", range(1, 13)) == 12
+    board = dashboard(["1", "\n"])
+    assert board.ask_number("Pick", range(1, 13)) == 1
+    board = dashboard(["1", "KEY_BACKSPACE", "9"])
+    assert board.ask_number("Pick", range(1, 13)) == 9
+
+def test_steal_chooses_a_target_with_one_key():
+    board = dashboard(["2", "3"])
+    assert board.choose_action() == ("steal", 3)
+
+def test_cancelled_prompts_take_no_action():
+    assert dashboard(["2", "\x1b"]).choose_action() == ()
+    assert dashboard(["5", "0"]).choose_action() == ()
+    assert dashboard(["q"]).choose_action() is None
+
+def test_ask_ignores_invalid_keys():
+    board = dashboard(["x", "7", "t"])
+    assert board.ask("Search", "tls") == "t"
+    assert board.prompt == ""
+
+def test_advice_is_on_the_menu_and_takes_no_action():
+    board = dashboard(["7"])
+    assert board.actions()["7"].name == "advice"
+    assert board.choose_action() == ()
+    assert board.advisor is not None and board.events
+
+def test_plugin_actions_are_on_the_menu(monkeypatch):
+    def dance_plugin():
+        def register(into):
+            into.register("dance", label="Dance", resolve=lambda game, player, args, outcome: None, arity=0)
+        return register
+    monkeypatch.setattr(registry, "entry_points", lambda group: [SimpleNamespace(name="dance", load=dance_plugin)])
+    actions = Registry("action", "test.actions")
+    actions.register("description", label="Player Description")
+    actions.register("work", label="Work")
+    monkeypatch.setattr(dashboard_module, "ACTIONS", actions)
+    board = dashboard(["2"])
+    assert {key: entry.label for key, entry in board.actions().items()} == {"1": "Work", "2": "Dance"}
+    assert board.choose_action() == ("dance",)
@@ -0,0 +1,51 @@
+import random
+import pytest
+from Important_Programs.distribution import (BankDistribution, analyse, plan_distribution, plan_effects,
+                                             win_probabilities)
+from Important_Programs.scenario import DEFAULT_SCENARIO
+
+def check(distribution, mean):
+    assert sum(distribution.probabilities) == pytest.approx(1.0)
+    assert distribution.mean() == pytest.approx(mean)
+
+def test_operations_keep_probability_and_mean_exact():
+    start = BankDistribution.point(100.3, 1.0)
+    check(start, 100.3)
+    check(start.plus_uniform(-7.25, 250.5), 100.3 + (250.5 - 7.25) / 2)
+    check(start.plus_outcomes([(-10.0, 0.9), (1000.4, 0.1)]), 100.3 - 9.0 + 100.04)
+    check(start.mixed(start.plus_outcomes([(50.0, 1.0)]), 0.25), 100.3 + 12.5)
+    check(start.grown(0.05), 100.3 * 1.05)
+    check(BankDistribution.point(-20.0, 1.0).grown(0.05), -20.0)
+
+def test_uniform_sums_match_sampling():
+    distribution = BankDistribution.point(0.0, 1.0).plus_uniform(0, 100).plus_uniform(0, 100)
+    rng = random.Random(1)
+    samples = sorted(rng.uniform(0, 100) + rng.uniform(0, 100) for _ in range(20_000))
+    for fraction in (0.1, 0.5, 0.9):
+        assert distribution.percentile(fraction) == pytest.approx(samples[int(fraction * len(samples))], abs=3)
+        assert distribution.cdf(distribution.percentile(fraction)) == pytest.approx(fraction)
+
+def test_working_every_round_is_certain():
+    distribution = plan_distribution((("work",), ("work",)), 5, income=1234.0)
+    check(distribution, DEFAULT_SCENARIO.starting_bank + 10 * 1234.0)
+    assert distribution.percentile(0.05) == pytest.approx(distribution.percentile(0.95), abs=1.0)
+
+def test_interest_compounds_at_the_end_of_each_round():
+    scenario = DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.1)
+    expected = scenario.starting_bank
+    for _ in range(3):
+        expected = (expected + 2 * 1000) * 1.1
+    check(plan_distribution((("work",), ("work",)), 3, 1000, scenario), expected)
+
+@pytest.mark.parametrize("plan", [(("work",),), (("steal", 2), ("end",)), (("end",), ("work",))])
+def test_plans_must_be_complete_turns_of_fixed_payouts(plan):
+    with pytest.raises(ValueError):
+        plan_effects(plan, DEFAULT_SCENARIO, 0.0)
+
+def test_win_probabilities_add_up():
+    players = analyse(["worker", "treasure", "gambler", "investor"], incomes=[5000, 0, 0, 0], rounds=4)
+    assert sum(player["Win Probability"] for player in players) == pytest.approx(1.0, abs=1e-3)
+    twins = [plan_distribution((("search", "treasure"),), 3)] * 2
+    assert win_probabilities(twins) == pytest.approx([0.5, 0.5], abs=1e-3)
+    percentiles = list(players[1]["Percentiles"].values())
+    assert percentiles == sorted(percentiles)
@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+import pytest
+from Important_Programs.high_scores import HighScoreStore
+from Important_Programs.simulation import HeadlessGame
+
+def finished_players(seed):
+    game = HeadlessGame(seed, 3, 2, strategies=("worker",))
+    game.start_game()
+    return game.players
+
+def test_batched_games_are_written_on_flush(tmp_path):
+    with HighScoreStore(str(tmp_path / "scores.db"), batch_size=10) as store:
+        players = finished_players(1)
+        store.record_game(players, 2, [(players[0].name, "Millionaire")])
+        assert store.pending
+        stats = store.career_stats(players[0].name)
+        assert not store.pending
+        assert stats["Games Played"] == 1
+        assert stats["Wins"] == 1
+        assert stats["Achievements"] == 1
+        assert store.top_players(1)[0][0] == players[0].name
+
+def test_stats_accumulate_across_games(tmp_path):
+    path = str(tmp_path / "scores.db")
+    players = finished_players(2)
+    for _ in range(2):
+        with HighScoreStore(path) as store:
+            store.record_game(players, 2)
+    with HighScoreStore(path) as store:
+        assert store.career_stats(players[-1].name)["Games Played"] == 2
+        assert store.career_stats("Nobody") is None
+
+def test_top_by_job_only_ranks_that_job(tmp_path):
+    with HighScoreStore(str(tmp_path / "scores.db")) as store:
+        for seed in range(3):
+            store.record_game(finished_players(seed), 2)
+        rankings = store.connection.execute("SELECT name, job_title, final_bank FROM rankings").fetchall()
+        job_title = rankings[0][1]
+        expected = sorted((bank for _, job, bank in rankings if job == job_title), reverse=True)
+        top = store.top_by_job(job_title, limit=2)
+        assert [bank for _, bank, _ in top] == expected[:2]
+        assert store.top_by_job("Astronaut") == []
+
+def test_games_recorded_from_many_threads_are_all_written(tmp_path):
+    players = finished_players(3)
+    with HighScoreStore(str(tmp_path / "scores.db"), batch_size=3) as store:
+        def record():
+            for _ in range(25):
+                store.record_game(players, 2)
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert store.career_stats(players[0].name)["Games Played"] == 100
+        assert store.connection.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 100
+
+def test_close_releases_the_connection_when_flush_fails(tmp_path, monkeypatch):
+    store = HighScoreStore(str(tmp_path / "scores.db"))
+
+    def fail():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "flush", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.connection.execute("SELECT 1")
+
+def test_batch_size_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        HighScoreStore(str(tmp_path / "scores.db"), batch_size=0)
@@ -0,0 +1,83 @@
+import http.client
+import json
+import threading
+import pytest
+from Important_Programs.http_api import GameServer, GameSession
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.fixture
+def session():
+    return GameSession(1, HeadlessGame(4, 3, 2))
+
+def test_only_the_current_player_may_act(session):
+    with pytest.raises(PermissionError):
+        session.apply(2, ["work"])
+    assert session.apply(1, ["work"])["action"] == "work"
+    assert session.version == 1
+
+def test_state_is_cached_per_viewer_until_the_next_action(session):
+    spectator, player = session.state(), session.state(1)
+    assert session.state() is spectator and session.state(1) is player
+    assert spectator != player
+    session.apply(1, ["work"])
+    assert session.state() is not spectator
+    assert json.loads(session.state())["turn_used"] == 4
+
+def test_unknown_viewers_are_not_cached(session):
+    with pytest.raises(LookupError):
+        session.state(99)
+    assert 99 not in session.cache
+
+def test_observers_receive_deltas(session):
+    observer_id, snapshot = session.add_observer("bank")
+    assert json.loads(snapshot)["seq"] == 0
+    session.apply(1, ["work"])
+    [delta] = json.loads(session.take_deltas(observer_id))
+    assert "Bank" in delta["players"]["1"]
+    assert session.take_deltas(observer_id) == b"[]"
+
+@pytest.fixture
+def server():
+    server = GameServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        connection.request(method, path, None if body is None else json.dumps(body),
+                           {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+def test_http_round_trip(server):
+    status, created = request(server, "POST", "/games", {"players": 2, "rounds": 1, "seed": 7})
+    assert status == 201 and created["players"] == [1, 2]
+    game = created["game"]
+    assert request(server, "POST", f"/games/{game}/actions", {"player": 2, "action": ["work"]})[0] == 409
+    assert request(server, "POST", f"/games/{game}/actions", {"player": 1, "action": ["fly"]})[0] == 400
+    assert request(server, "POST", f"/games/{game}/actions", {"player": 1, "action": ["work"]})[0] == 200
+    assert request(server, "GET", f"/games/{game}?player=9")[0] == 404
+    assert request(server, "GET", "/games/99")[0] == 404
+    status, state = request(server, "GET", f"/games/{game}?player=1")
+    assert status == 200 and state["turn_used"] == 4
+
+def test_only_the_latest_finished_games_are_kept():
+    server = GameServer(("127.0.0.1", 0), finished_kept=2)
+    try:
+        sessions = [server.create_game(2, 1, seed) for seed in range(4)]
+        for session in sessions[:3]:
+            while not session.game.finished:
+                session.apply(session.game.current_player.id, ["end"])
+        assert list(server.sessions) == [2, 3, 4]
+        with pytest.raises(LookupError):
+            server.session(1)
+        assert json.loads(server.session(3).state())["finished"]
+        assert not server.session(4).game.gamelogic.ledger.keep_log
+    finally:
+        server.server_close()
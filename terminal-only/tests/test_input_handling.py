@@ -0,0 +1,48 @@
+import io
+import pytest
+from Important_Programs.Input_Handling import ScriptedInput, Security
+
+class Chunks(io.RawIOBase):
+    """
+    A stream that hands out its data a few bytes at a time, splitting lines across reads.
+    """
+
+    def __init__(self, data, size):
+        self.data = data
+        self.size = size
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        self.reads += 1
+        block, self.data = self.data[:self.size], self.data[self.size:]
+        return block
+
+def test_lines_are_sanitized_unless_asked_for_raw():
+    script = ScriptedInput(io.BytesIO(b"1; rm -rf\r\nJane O'Neil\nlast"))
+    assert script.read_line() == "1 rm rf"
+    assert script.read_line(sanitize=False) == "Jane O'Neil"
+    assert script.read_line() == "last"
+    with pytest.raises(EOFError):
+        script.read_line()
+
+def test_lines_split_across_reads_are_joined():
+    stream = Chunks(b"work\nsteal 2\n\nsearch\n", 3)
+    script = ScriptedInput(stream)
+    assert [script.read_line() for _ in range(4)] == ["work", "steal 2", "", "search"]
+    with pytest.raises(EOFError):
+        script.read_line()
+
+def test_large_scripts_are_read_in_blocks():
+    stream = Chunks(b"1\n" * 100_000, ScriptedInput.BLOCK_SIZE)
+    script = ScriptedInput(stream)
+    for _ in range(100_000):
+        script.read_line()
+    assert stream.reads == 1
+
+def test_validated_input_skips_invalid_lines(monkeypatch):
+    monkeypatch.setattr(Security, "script", ScriptedInput(io.BytesIO(b"x\n9\n2\nMaybe\nyes\n")))
+    assert Security.get_validated_int("", range(1, 4)) == 2
+    assert Security.get_validated_choice("", ["yes", "no"]) == "yes"
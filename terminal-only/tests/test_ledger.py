@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+import pytest
+from Important_Programs.ledger import Ledger
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import Aggregate, HeadlessGame, run_batch
+
+def players():
+    return SimpleNamespace(id=1, bank="$1_000.00", safe=0.0), SimpleNamespace(id=2, bank=500.0, safe=0.0)
+
+def test_balances_are_written_through_and_sum_to_zero():
+    ledger = Ledger()
+    alice, bob = players()
+    ledger.pay(alice, 250.004, "work")
+    ledger.transfer(alice, bob, 100.0, "steal")
+    ledger.transfer(bob, bob, 50.0, "deposit", destination_field="safe")
+    assert (alice.bank, bob.bank, bob.safe) == (1150.0, 550.0, 50.0)
+    assert sum(ledger.balances) == pytest.approx(0.0)
+    assert list(ledger.entries())[1] == ("steal", (1, "bank"), (2, "bank"), 100.0)
+    assert ledger.audit() == []
+
+def test_transactions_roll_back_exactly():
+    ledger = Ledger()
+    alice, bob = players()
+    ledger.pay(alice, 0.1, "work")
+    ledger.commit()
+    with pytest.raises(ValueError):
+        with ledger.transaction():
+            ledger.transfer(alice, bob, 0.2, "steal")
+            ledger.pay(bob, 0.3, "interest")
+            raise ValueError
+    assert (alice.bank, bob.bank, len(ledger)) == (1000.1, 500.0, 1)
+    with pytest.raises(ValueError):
+        ledger.rollback(0)
+
+def test_nested_transactions_commit_with_the_outermost():
+    ledger = Ledger(keep_log=False)
+    alice, _ = players()
+    with ledger.transaction():
+        with ledger.transaction():
+            ledger.pay(alice, 1.0, "work")
+        assert len(ledger.amounts) == 1
+        ledger.pay(alice, 2.0, "work")
+    assert (len(ledger), len(ledger.amounts), ledger.dropped) == (2, 0, 2)
+
+def test_dropping_the_log_keeps_balances_and_audits():
+    kept, dropped = Ledger(), Ledger(keep_log=False)
+    for ledger in (kept, dropped):
+        alice, bob = players()
+        for round_number in range(1, 50):
+            savepoint = ledger.savepoint()
+            ledger.transfer(alice, bob, 3.33, "steal")
+            if round_number % 3 == 0:
+                ledger.rollback(savepoint)
+            ledger.pay(bob, 1.01, "interest")
+            ledger.commit()
+    assert kept.balances == dropped.balances
+    assert dropped.audit() == [] and len(dropped) == len(kept)
+    assert len(dropped.amounts) == 0 and list(dropped.entries()) == []
+
+def test_bulk_runs_keep_no_log():
+    game = HeadlessGame(1, 4, 5, keep_log=False)
+    game.start_game()
+    assert len(game.gamelogic.ledger.amounts) == 0
+    assert game.gamelogic.ledger.audit() == []
+    expected = Aggregate()
+    for seed in range(3):
+        expected.add(HeadlessGame(seed, 3, 2).start_game())
+    assert vars(run_batch(DEFAULT_SCENARIO, 0, 3, 3, 2)) == vars(expected)
@@ -0,0 +1,35 @@
+import pytest
+from Important_Programs.long_horizon import LongHorizonGame
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.mark.parametrize("strategies", [("worker",), ("worker", "random"), ("thief", "worker", "worker")])
+@pytest.mark.parametrize("seed", range(4))
+def test_fast_forwarding_matches_playing_every_turn(seed, strategies):
+    expected = HeadlessGame(seed, 4, 6, strategies=strategies).start_game()
+    assert LongHorizonGame(seed, 4, 6, strategies=strategies).start_game() == expected
+
+@pytest.mark.parametrize("seed", range(4))
+def test_interest_on_idle_pay_is_settled_to_the_cent(seed):
+    scenario = DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.05)
+    expected = HeadlessGame(seed, 4, 6, scenario, ("worker", "thief")).start_game()
+    result = LongHorizonGame(seed, 4, 6, scenario, ("worker", "thief")).start_game()
+    banks = {player.id: player.bank for player in expected.standings}
+    for player in result.standings:
+        assert player.bank == pytest.approx(banks[player.id], abs=0.05)
+        assert player.actions == next(other.actions for other in expected.standings if other.id == player.id)
+
+def test_idle_players_take_no_turns():
+    events = []
+    game = LongHorizonGame(1, 4, 3, strategies=("worker", "random"), on_event=lambda *event: events.append(event))
+    game.start_game()
+    acting = {payload["player"] for event_type, payload in events if event_type in ("turn_start", "action")}
+    assert acting == {2, 4}
+
+def test_a_game_of_only_idle_players_cannot_be_stepped():
+    game = LongHorizonGame(1, 3, 100_000, strategies=("worker",))
+    assert game.current_player is None
+    with pytest.raises(ValueError):
+        game.apply(("work",))
+    result = game.start_game()
+    assert all(player.actions == {"work": 200_000} for player in result.standings)
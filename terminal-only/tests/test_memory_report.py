@@ -0,0 +1,85 @@
+import tracemalloc
+import pytest
+from Important_Programs.memory_report import MemoryReport, deep_size
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.fixture
+def report():
+    tracing = tracemalloc.is_tracing()
+    yield MemoryReport(window=3, threshold=1024)
+    if not tracing:
+        tracemalloc.stop()
+
+def play(report, games, rounds, on_event=None):
+    for seed in range(games):
+        game = HeadlessGame(seed, 4, rounds, on_event=on_event)
+        report.watch(game)
+        game.start_game()
+
+def test_growth_must_be_steady_and_large_enough(report):
+    assert report.growing([1, 2000, 3000, 4000]) == 3999
+    assert report.growing([1, 2000, 1500, 4000]) == 0
+    assert report.growing([1, 2, 3, 4]) == 0
+    assert report.growing([1, 2000, 3000]) == 0
+
+def test_shared_objects_are_counted_once():
+    shared = list(range(100))
+    seen = set()
+    first = deep_size([[shared]], seen)
+    assert deep_size([[shared]], seen) < first
+    assert deep_size([shared], seen) == 0
+
+def test_a_healthy_game_with_a_full_journal_is_not_flagged(report):
+    play(report, 6, 12)
+    assert len(report.samples) == 72 and report.games == 6 and len(report.game_totals) == 5
+    assert report.suspected_leaks() == []
+    assert not any(line.startswith("Suspected leak") for line in report.lines())
+
+class Hoarder:
+    """
+    An event log that never lets go of anything, like a dashboard without a bounded log.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def record_event(self, event_type, payload):
+        self.events.extend(dict(payload) for _ in range(20))
+
+def test_a_callback_that_keeps_every_event_is_flagged(report):
+    play(report, 1, 12, on_event=Hoarder().record_event)
+    assert "Logs" in dict(report.suspected_leaks())
+    lines = report.lines(last=2)
+    assert len([line for line in lines if line.startswith("Game 1, round")]) == 2
+    assert any(line.startswith("Suspected leak: Logs grew at each of the last 3 round boundaries") for line in lines)
+
+def test_the_games_own_callback_still_gets_every_event(report):
+    events = []
+    play(report, 1, 2, on_event=lambda event_type, payload: events.append(event_type))
+    assert events.count("round_complete") == 2 and events[-1] == "game_over"
+
+def test_memory_kept_from_game_to_game_is_flagged(report):
+    hoard = Hoarder()
+    # Games with other seeds differ by a few hundred bytes, so each one leaks well over the asserted 4096
+    def keep_whole_games(event_type, payload):
+        if event_type == "game_over":
+            hoard.events.append(bytearray(8192))
+    play(report, 6, 2, on_event=keep_whole_games)
+    assert dict(report.suspected_leaks())["Traced between games"] >= 3 * 4096
+    assert any(line.startswith("Suspected leak: Traced between games grew at each of the last 3 games")
+               for line in report.lines())
+
+def test_a_dashboard_game_is_reported_once(report, monkeypatch):
+    import main
+    from Important_Programs import dashboard
+
+    def run_dashboard(player_count, round_limit, scenario=None, advisor=None, memory_report=None):
+        game = HeadlessGame(1, player_count, round_limit, scenario)
+        memory_report.watch(game)
+        game.start_game()
+        return game
+
+    monkeypatch.setattr(dashboard, "run_dashboard", run_dashboard)
+    for _ in range(2):
+        main.dashboard_main(player_count=3, round_limit=4, memory_report=report)
+    assert report.games == 2 and len(report.game_totals) == 1 and len(report.game_journals) == 2
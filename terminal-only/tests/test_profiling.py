@@ -0,0 +1,49 @@
+import signal
+import sys
+from collections import Counter
+from Important_Programs.profiling import SamplingProfiler, frame_name, profile_run, subsystem_of
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import run_batch
+
+def test_frames_are_named_by_module_and_qualified_name():
+    assert frame_name(SamplingProfiler.record.__code__) == "profiling.SamplingProfiler.record"
+
+def test_samples_belong_to_the_innermost_subsystem():
+    stack = ("simulate.main", "game_logic.Market.purchase_item", "game_logic.BankManagement.format_currency",
+             "ledger.Ledger.post")
+    assert subsystem_of(stack) == "BankManagement"
+    assert subsystem_of(("simulate.main", "ledger.Ledger.post")) == "Other"
+
+def test_recorded_stacks_run_outermost_first():
+    profiler = SamplingProfiler()
+    def inner():
+        profiler.record(sys._getframe())
+    inner()
+    inner()
+    [(stack, count)] = profiler.stacks.items()
+    assert count == 2 and stack[-1].endswith("inner") and stack[-2].endswith("recorded_stacks_run_outermost_first")
+
+def test_hotspots_and_collapsed_stacks(tmp_path):
+    profiler = SamplingProfiler()
+    profiler.stacks = Counter({
+        ("main", "game_logic.Market.buy", "ledger.Ledger.post"): 3,
+        ("main", "game_logic.Market.buy"): 1,
+        ("main", "game_logic.Employment.work"): 2,
+    })
+    assert profiler.hotspots() == [("Market", 4, [("ledger.Ledger.post", 3), ("game_logic.Market.buy", 1)]),
+                                   ("Employment", 2, [("game_logic.Employment.work", 2)])]
+    path = tmp_path / "stacks.txt"
+    profiler.write_collapsed(str(path))
+    assert path.read_text().splitlines()[0] == "main;game_logic.Employment.work 2"
+    assert profiler.hotspot_lines()[1].split()[:2] == ["Market", "4"]
+
+def test_profiling_a_run_samples_it_and_restores_the_signal_handler(tmp_path, capsys):
+    handler = signal.getsignal(signal.SIGPROF) if hasattr(signal, "SIGPROF") else None
+    path = tmp_path / "run.txt"
+    with profile_run(str(path), interval=0.0005) as profiler:
+        run_batch(DEFAULT_SCENARIO, 0, 200, 4, 5)
+    assert sum(profiler.stacks.values()) > 0
+    assert path.read_text()
+    assert f"to {path}" in capsys.readouterr().out
+    if handler is not None:
+        assert signal.getsignal(signal.SIGPROF) == handler
@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from Important_Programs.record_store import ALIGNMENT, RecordWriter, memmap_records, read_records
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.registry import ACTIONS
+from Important_Programs.simulation import HeadlessGame, run_batch
+
+SIMULATE = Path(__file__).resolve().parent.parent / "simulate.py"
+PLAYED = ("worker", "thief", "random")
+RECORDED_ACTIONS = [name for name, entry in ACTIONS.entries.items() if hasattr(entry, "resolve")]
+
+def results(seeds, player_count=3):
+    return [HeadlessGame(seed, player_count, 3, strategies=PLAYED).start_game() for seed in seeds]
+
+def as_records(results):
+    return [{"seed": result.seed, "round_limit": result.round_limit, "players": sorted(
+        ({"id": standing.id, "bank": standing.bank, "safe": standing.safe, "job": standing.job_title,
+          "rank": standing.rank, "strategy": standing.strategy,
+          "actions": {action: standing.actions.get(action, 0) for action in RECORDED_ACTIONS}}
+         for standing in result.standings), key=lambda player: player["id"])} for result in results]
+
+def test_records_round_trip(tmp_path):
+    path = str(tmp_path / "games.rec")
+    games = results(range(5)) + results(range(5, 7), player_count=2)
+    with RecordWriter(path, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+        for result in games:
+            writer.write(result)
+    assert list(read_records(path)) == as_records(games)
+    with open(path, "rb") as file:
+        assert file.read(8) == b"MGREC001"
+    header_size = os.path.getsize(path) - 7 * writer.record.size
+    assert header_size % ALIGNMENT == 0
+
+def test_reopened_files_are_appended_to(tmp_path):
+    path = str(tmp_path / "games.rec")
+    for seeds in (range(2), range(2, 4)):
+        with RecordWriter(path, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+            for result in results(seeds):
+                writer.write(result)
+    assert [record["seed"] for record in read_records(path)] == [0, 1, 2, 3]
+    with pytest.raises(ValueError):
+        RecordWriter(path, 4, DEFAULT_SCENARIO, PLAYED)
+
+def test_files_ending_with_a_partial_record_are_refused(tmp_path):
+    path, merged = str(tmp_path / "games.rec"), str(tmp_path / "merged.rec")
+    with RecordWriter(path, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+        for result in results(range(2)):
+            writer.write(result)
+    with open(path, "ab") as file:
+        file.write(b"\0" * (writer.record.size // 2))
+    with pytest.raises(ValueError, match="partial record"):
+        RecordWriter(path, 3, DEFAULT_SCENARIO, PLAYED)
+    with RecordWriter(merged, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+        with pytest.raises(ValueError, match="partial record"):
+            writer.append_file(path)
+    assert list(read_records(merged)) == []
+
+def test_games_must_fit_the_seats(tmp_path):
+    with RecordWriter(str(tmp_path / "games.rec"), 2) as writer, pytest.raises(ValueError):
+        writer.pack(results([0])[0])
+
+def test_unknown_strategies_and_worker_parts(tmp_path):
+    part, merged = str(tmp_path / "part"), str(tmp_path / "merged.rec")
+    run_batch(DEFAULT_SCENARIO, 0, 3, 3, 3, PLAYED, record_path=part)
+    with RecordWriter(merged, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+        writer.append_file(part)
+        writer.append_file(part)
+    assert list(read_records(merged)) == as_records(results(range(3)) * 2)
+    with RecordWriter(str(tmp_path / "other.rec"), 3, DEFAULT_SCENARIO, ("worker",)) as writer:
+        writer.write(results([0])[0])
+        with pytest.raises(ValueError):
+            writer.append_file(part)
+    strategies = {player["strategy"] for record in read_records(str(tmp_path / "other.rec")) for player in record["players"]}
+    assert strategies == {"worker", None}
+
+def test_parallel_runs_merge_parts_in_seed_order(tmp_path):
+    path = tmp_path / "run.rec"
+    subprocess.run([sys.executable, str(SIMULATE), "run", "--games", "12", "--workers", "3", "--players", "3",
+                    "--rounds", "3", "--strategies", *PLAYED, "--records", str(path)],
+                   check=True, capture_output=True)
+    assert list(read_records(str(path))) == as_records(results(range(12)))
+    assert os.listdir(tmp_path) == ["run.rec"]
+
+def test_memory_mapped_records_match(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "games.rec")
+    games = results(range(4))
+    with RecordWriter(path, 3, DEFAULT_SCENARIO, PLAYED) as writer:
+        for result in games:
+            writer.write(result)
+    records, header = memmap_records(path)
+    assert list(records["seed"]) == [0, 1, 2, 3]
+    assert [record["players"][0]["bank"] for record in read_records(path)] == list(records["players"]["bank"][:, 0])
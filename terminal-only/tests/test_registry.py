@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+import pytest
+from Important_Programs import registry
+from Important_Programs.registry import ACTIONS, Registry
+from Important_Programs.simulation import HeadlessGame
+
+def install(monkeypatch, **plugins):
+    """
+    Makes `entry_points` list fake plugins, each loaded by calling its value.
+    """
+    loaded = []
+    def load(name):
+        loaded.append(name)
+        return plugins[name]()
+    points = [SimpleNamespace(name=name, load=lambda name=name: load(name)) for name in plugins]
+    monkeypatch.setattr(registry, "entry_points", lambda group: points)
+    return loaded
+
+def dance_plugin():
+    def register(into):
+        into.register("dance", aliases=("boogie",), cost=2, label="Dance")
+    return register
+
+def broken_plugin():
+    raise ImportError("no module named 'dance_moves'")
+
+def test_plugins_are_only_imported_when_first_used(monkeypatch):
+    loaded = install(monkeypatch, dance=dance_plugin)
+    actions = Registry("action", "test.actions")
+    actions.register("work", cost=4)
+    assert actions.resolve("WORK").cost == 4
+    assert not actions.discovered and loaded == []
+    assert actions.resolve("boogie") is None
+    assert actions.discovered and loaded == []
+    entry = actions.resolve("Dance")
+    assert (entry.name, entry.cost, loaded) == ("dance", 2, ["dance"])
+    assert actions.resolve("boogie") is entry
+    actions.get("dance")
+    assert loaded == ["dance"]
+
+def test_a_plugin_that_fails_to_load_is_dropped(monkeypatch, capsys):
+    install(monkeypatch, dance=broken_plugin)
+    actions = Registry("action", "test.actions")
+    assert [entry.name for entry in actions.menu()] == ["dance"]
+    assert actions.get("dance") is None
+    assert "Could not load the action plugin 'dance'" in capsys.readouterr().out
+    assert actions.entries == {} and actions.choices() == [] and actions.get("dance") is None
+
+def test_built_in_entries_win_over_plugins_of_the_same_name(monkeypatch):
+    loaded = install(monkeypatch, work=broken_plugin)
+    actions = Registry("action", "test.actions")
+    actions.register("work", cost=4)
+    actions.discover()
+    assert actions.get("work").cost == 4 and loaded == []
+
+def test_aliases_cannot_be_taken_twice():
+    actions = Registry("action")
+    actions.register("work", aliases=("w",))
+    actions.register("work", aliases=("job",), cost=4)
+    assert actions.get("work").aliases == ("w", "job") and actions.costs["work"] == 4
+    with pytest.raises(ValueError):
+        actions.register("wait", aliases=("W",))
+    assert "wait" not in actions.entries
+
+@pytest.fixture
+def restored_actions(monkeypatch):
+    saved = {field: dict(getattr(ACTIONS, field)) for field in ("entries", "aliases", "costs")}
+    monkeypatch.setattr(ACTIONS, "discovered", False)
+    yield ACTIONS
+    # GamePlay.ACTION_COSTS is the same dict, so each one is restored in place
+    for field, values in saved.items():
+        getattr(ACTIONS, field).clear()
+        getattr(ACTIONS, field).update(values)
+
+def test_plugin_actions_can_be_played_headless(monkeypatch, restored_actions):
+    def nap_plugin():
+        def resolve(game, player, args, outcome):
+            game.gamelogic.ledger.pay(player, 1.0, "nap")
+        return lambda into: into.register("nap", cost=5, arity=0, resolve=resolve)
+    install(monkeypatch, nap=nap_plugin, dance=broken_plugin)
+    game = HeadlessGame(1, 2, 1)
+    bank = game.players[0].bank
+    assert game.apply(("nap",))["bank"] == bank + 1.0
+    assert game.current_player.id == 2
+    with pytest.raises(ValueError):
+        game.apply(("dance",))
+    assert game.current_player.id == 2 and game.turn_used == 0
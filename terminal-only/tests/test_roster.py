@@ -0,0 +1,36 @@
+import gc
+import random
+from collections import Counter
+from Important_Programs.roster import NAME_PARTS, draw_jobs, generate_roster, unique_names
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import HeadlessGame
+
+def test_names_never_repeat_even_past_the_name_space():
+    count = len(NAME_PARTS) ** 2 + 10
+    full_names = unique_names(count, random.Random(1))
+    assert len(set(full_names)) == count
+    assert sum(name.endswith(" 2") for name in full_names) == 10
+
+def test_jobs_repeat_only_once_every_job_is_taken():
+    jobs = DEFAULT_SCENARIO.jobs
+    drawn = draw_jobs(len(jobs) * 2, DEFAULT_SCENARIO, random.Random(2))
+    assert Counter(title for title, _ in drawn) == Counter({title.title(): 2 for title, _, _ in jobs})
+    ranges = {title.title(): (low, high) for title, low, high in jobs}
+    for title, pay in drawn:
+        low, high = ranges[title]
+        assert low <= pay < high + 1
+
+def test_rosters_are_reproducible_and_numbered():
+    first = generate_roster(500, DEFAULT_SCENARIO, random.Random(3), first_id=10)
+    second = generate_roster(500, DEFAULT_SCENARIO, random.Random(3), first_id=10)
+    assert [vars(player) for player in first] == [vars(player) for player in second]
+    assert [player.id for player in first] == list(range(10, 510))
+    assert all(18 <= player.age <= 65 and player.bank == DEFAULT_SCENARIO.starting_bank for player in first)
+
+def test_the_garbage_collector_is_left_as_it_was():
+    generate_roster(10, DEFAULT_SCENARIO)
+    assert gc.isenabled()
+
+def test_large_games_use_the_bulk_roster():
+    game = HeadlessGame(4, HeadlessGame.BULK_ROSTER_SIZE, 1)
+    assert len({player.name for player in game.players}) == HeadlessGame.BULK_ROSTER_SIZE
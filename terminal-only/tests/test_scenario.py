@@ -0,0 +1,52 @@
+import dataclasses
+import json
+from pathlib import Path
+import pytest
+from Important_Programs.scenario import DEFAULT_SCENARIO, compile_scenario, load_scenario
+
+SCENARIOS = Path(__file__).resolve().parent.parent / "scenarios"
+
+def test_missing_parameters_keep_their_defaults():
+    assert compile_scenario({}) == DEFAULT_SCENARIO
+    assert compile_scenario({"starting_bank": 5}).starting_bank == 5.0
+
+def test_round_trips_through_its_file_layout():
+    assert compile_scenario(DEFAULT_SCENARIO.to_dict()) == DEFAULT_SCENARIO
+
+def test_scenarios_are_immutable():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        DEFAULT_SCENARIO.starting_bank = 1.0
+
+def test_with_changes_validates():
+    changed = DEFAULT_SCENARIO.with_changes(steal_success_chance=0.25)
+    assert changed.steal_success_chance == 0.25
+    assert DEFAULT_SCENARIO.steal_success_chance == 0.5
+    with pytest.raises(ValueError):
+        DEFAULT_SCENARIO.with_changes(steal_success_chance=2)
+
+@pytest.mark.parametrize("data", [
+    {"unknown": 1},
+    {"round_choices": []},
+    {"steal_fraction": [0.5, 0.1]},
+    {"lottery_rewards": ["a"]},
+    {"shop_items": {}},
+    {"jobs": {"Clerk": [1.5, 2]}},
+    {"shop_items": ["House"]},
+    {"jobs": ["Clerk"]},
+    {"starting_bank": float("nan")},
+    {"bank_interest_rate": float("nan")},
+    {"treasure_range": [0, float("inf")]},
+    {"lottery_rewards": [1, float("nan")]},
+])
+def test_invalid_parameters_are_rejected(data):
+    with pytest.raises(ValueError):
+        compile_scenario(data)
+
+def test_loads_toml_and_json(tmp_path):
+    toml_scenario = load_scenario(str(SCENARIOS / "high_stakes.toml"))
+    assert toml_scenario.starting_bank == 100_000.0
+    path = tmp_path / "scenario.json"
+    path.write_text(json.dumps({"round_choices": [3]}))
+    assert load_scenario(str(path)).round_choices == (3,)
+    with pytest.raises(ValueError):
+        load_scenario(str(tmp_path / "scenario.yaml"))
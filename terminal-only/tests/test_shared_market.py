@@ -0,0 +1,85 @@
+import random
+import sys
+import threading
+import time
+import pytest
+from Important_Programs.shared_market import SharedMarket
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.fixture
+def contended():
+    # Switch threads as often as possible, so a check and its decrement are likely to be interleaved
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+class YieldingCounts(list):
+    """
+    Shard counters that hand the GIL to another thread on every read, widening any check-then-act race.
+    """
+
+    def __getitem__(self, index):
+        value = super().__getitem__(index)
+        time.sleep(0)
+        return value
+
+def run_threads(count, target):
+    barrier = threading.Barrier(count)
+    def start(number):
+        barrier.wait()
+        target(number)
+    threads = [threading.Thread(target=start, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_stock_is_spread_over_the_shards():
+    market = SharedMarket(stock={"House": 10}, shards=4, rng=random.Random(1))
+    house = [item.name for item in market.items].index("House")
+    assert market.counts[house] == [3, 3, 2, 2]
+    assert market.remaining(house) == 10
+    assert all(market.remaining(index) == 0 for index in range(len(market.items)) if index != house)
+
+def test_a_sold_out_home_shard_falls_back_to_the_others():
+    market = SharedMarket(stock=0, shards=3, rng=random.Random(1))
+    market.restock(0, 2, shard=2)
+    assert market.take(0, 0) and market.take(0, 1)
+    assert not market.take(0, 2)
+
+def test_invalid_markets_are_rejected():
+    with pytest.raises(ValueError):
+        SharedMarket(shards=0)
+    with pytest.raises(ValueError):
+        SharedMarket(stock=-1)
+
+def test_concurrent_takes_never_oversell(contended):
+    market = SharedMarket(stock=500, shards=4, rng=random.Random(1))
+    market.counts[0] = YieldingCounts(market.counts[0])
+    taken = [0] * 16
+    def buyer(number):
+        shard = market.connect()
+        while market.take(0, shard):
+            taken[number] += 1
+    run_threads(16, buyer)
+    assert sum(taken) == 500
+    assert market.counts[0] == [0, 0, 0, 0]
+
+def test_concurrent_games_never_oversell(contended):
+    market = SharedMarket(stock=40, shards=4, rng=random.Random(1))
+    market.counts[0] = YieldingCounts(market.counts[0])
+    games = [HeadlessGame(seed, 3, 50, market=market) for seed in range(12)]
+    bought = [0] * len(games)
+    def play(number):
+        game = games[number]
+        for player in game.players:
+            game.gamelogic.ledger.pay(player, 1e12, "setup")
+        while not game.finished:
+            outcome = game.apply(("buy", 0))
+            bought[number] += outcome["bought"]
+    run_threads(len(games), play)
+    assert sum(bought) == 40
+    assert market.remaining(0) == 0
+    for game, count in zip(games, bought):
+        assert sum(len(player.inventory) for player in game.players) == count
@@ -0,0 +1,60 @@
+import time
+import pytest
+from Important_Programs.simultaneous import PlanMailbox, SimultaneousGame, strategy_submitter
+
+def test_results_do_not_depend_on_thread_timing():
+    def slow(strategy):
+        submit = strategy_submitter(strategy)
+
+        def delayed(game, player):
+            time.sleep(0.01 * (5 - player.id))
+            return submit(game, player)
+        return delayed
+
+    first = SimultaneousGame(3, 4, 3).start_game()
+    game = SimultaneousGame(3, 4, 3)
+    second = game.start_game({player.id: slow(game.strategies[player.id]) for player in game.players})
+    assert first == second
+
+def test_invalid_and_missing_plans_get_the_default_plan():
+    game = SimultaneousGame(1, 3, 1, deadline=0.2)
+    submitters = {
+        1: lambda game, player: [("work",)] * 3,
+        2: lambda game, player: time.sleep(1),
+        3: lambda game, player: 1 / 0,
+    }
+    plans = game.collect_plans(submitters)
+    assert plans[1] == list(game.default_plan)
+    assert plans[2] == list(game.default_plan)
+    assert plans[3] == list(game.default_plan)
+
+def test_steals_resolve_after_everything_else():
+    game = SimultaneousGame(2, 3, 1)
+    outcomes = game.resolve_round({1: [("steal", 2)], 2: [("work",)], 3: [("steal", 2), ("work",)]})
+    assert [(outcome["player"], outcome["action"]) for outcome in outcomes] == [
+        (2, "work"), (3, "work"), (1, "steal"), (3, "steal")]
+
+def test_late_plans_are_not_played_in_the_next_round():
+    mailbox = PlanMailbox()
+    game = SimultaneousGame(1, 2, 3, deadline=0.3)
+    submitters = {player_id: mailbox.submitter_for(player_id, 0.1) for player_id in (1, 2)}
+    mailbox.submit(1, [("search", "treasure")], 1)
+    first = game.play_round(submitters)
+    assert [outcome["action"] for outcome in first if outcome["player"] == 1] == ["search"]
+
+    # Player 2 missed round 1; their late plan for it must not become their round 2 turn
+    mailbox.submit(2, [("search", "stocks")], 1)
+    second = game.play_round(submitters)
+    assert [outcome["action"] for outcome in second if outcome["player"] == 2] == ["work", "work"]
+
+def test_mailbox_rejects_stale_and_repeated_plans():
+    mailbox = PlanMailbox()
+    mailbox.submit(1, [("work",)], 1)
+    with pytest.raises(ValueError):
+        mailbox.submit(1, [("work",)], 1)
+    with pytest.raises(ValueError):
+        mailbox.submit(1, [("work",)], 3)
+    mailbox.start_round(1, 2)
+    with pytest.raises(ValueError):
+        mailbox.submit(2, [("work",)], 1)
+    mailbox.submit(2, [("work",)], 3)
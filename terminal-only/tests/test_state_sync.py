@@ -0,0 +1,66 @@
+import json
+import pytest
+from Important_Programs.scenario import compile_scenario
+from Important_Programs.shared_market import SharedMarket
+from Important_Programs.simulation import HeadlessGame
+from Important_Programs.state_sync import StateTracker
+
+@pytest.fixture
+def game():
+    return HeadlessGame(5, 3, 2)
+
+def tracker_for(game):
+    tracker = StateTracker(game.players, game.gamelogic.market, game.gamelogic.ledger)
+    tracker.add_observer("spectator", "normal")
+    tracker.add_observer("banker", "bank")
+    tracker.add_observer("other banker", "bank")
+    tracker.add_observer("player 1", "normal", player_id=1)
+    return tracker
+
+def test_deltas_only_hold_what_each_observer_may_see(game):
+    tracker = tracker_for(game)
+    tracker.record(game.apply(("work",)))
+    deltas = tracker.flush()
+    assert "spectator" not in deltas
+    banker = json.loads(deltas["banker"])
+    assert banker["seq"] == 1
+    assert set(banker["players"]["1"]) == {"Bank"}
+    assert deltas["banker"] is deltas["other banker"]
+    assert "Bank" in json.loads(deltas["player 1"])["players"]["1"]
+
+def test_nothing_changed_means_no_deltas(game):
+    tracker = tracker_for(game)
+    tracker.touch(2)
+    assert tracker.flush() == {}
+    assert tracker.sequence == 0
+
+@pytest.mark.parametrize("scenario", [None, compile_scenario({"bank_interest_rate": 0.05})])
+def test_snapshot_plus_deltas_matches_the_game(scenario):
+    # Interest is accrued at the end of the game outside any action, so only the ledger reports it
+    game = HeadlessGame(5, 3, 4, scenario=scenario)
+    tracker = tracker_for(game)
+    state = json.loads(tracker.snapshot("banker"))
+    while not game.finished:
+        tracker.record(game.apply(("work",) if game.current_player.id % 2 else ("steal", 1)))
+        delta = tracker.flush().get("banker")
+        if delta:
+            for player_id, changes in json.loads(delta).get("players", {}).items():
+                state["players"][player_id].update(changes)
+    for player in game.players:
+        assert state["players"][str(player.id)]["Bank"] == game.gamelogic.deformat_currency(player.bank)
+        assert "Safe" not in state["players"][str(player.id)]
+
+def test_shared_stock_bought_by_another_game_is_published():
+    scenario = compile_scenario({"starting_bank": 10_000_000})
+    market = SharedMarket(scenario, stock=5, shards=1)
+    game, other = HeadlessGame(5, 2, 2, scenario, market=market), HeadlessGame(6, 2, 2, scenario, market=market)
+    tracker = tracker_for(game)
+    name = game.gamelogic.market.items[0].name
+    assert json.loads(tracker.snapshot("spectator"))["stock"][name] == 5
+    other.apply(("buy", 0))
+    tracker.record(game.apply(("work",)))
+    assert json.loads(tracker.flush()["spectator"])["stock"] == {name: 4}
+
+def test_unknown_visibility_is_rejected(game):
+    with pytest.raises(ValueError):
+        StateTracker(game.players, game.gamelogic.market).add_observer(1, "everything")
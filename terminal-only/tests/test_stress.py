@@ -0,0 +1,45 @@
+import random
+from contextlib import nullcontext
+import pytest
+from Important_Programs import stress
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import HeadlessGame
+
+@pytest.mark.parametrize("scenario", [DEFAULT_SCENARIO, DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.05)])
+def test_random_inputs_break_no_invariant(scenario):
+    assert stress.stress(0, 20, 3, 3, scenario) > 0
+
+def test_malformed_inputs_are_rejected_without_changes():
+    game = HeadlessGame(1, 2, 2)
+    for action in [("steal", 1), ("steal", 0), ("buy", -1), ("use", 0), ("fly",), (), None, "work"]:
+        assert stress.check_action(game, action) is None
+
+def test_interest_owed_is_not_paid_before_the_action_is_checked():
+    game = HeadlessGame(1, 2, 3, DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.05))
+    for _ in range(2):
+        game.apply(("end",))
+    player = game.current_player
+    bank, touched = player.bank, dict(game.gamelogic.accounts.touched)
+    assert stress.check_action(game, ("fly",)) is None
+    assert (player.bank, game.gamelogic.accounts.touched) == (bank, touched)
+    assert stress.check_action(game, ("buy", 0)) is None
+
+def test_a_rejected_action_that_keeps_its_interest_is_caught(monkeypatch):
+    game = HeadlessGame(1, 2, 3, DEFAULT_SCENARIO.with_changes(bank_interest_rate=0.05))
+    for _ in range(2):
+        game.apply(("end",))
+    monkeypatch.setattr(game.gamelogic.ledger, "transaction", nullcontext)
+    assert stress.check_action(game, ("fly",)) == "a rejected action changed the game state"
+
+def test_random_inputs_are_reproducible():
+    game = HeadlessGame(1, 3, 2)
+    first = [stress.random_input(game, random.Random(5)) for _ in range(3)]
+    assert first == [stress.random_input(game, random.Random(5)) for _ in range(3)]
+
+def test_failures_are_shrunk_to_the_smallest_game(monkeypatch):
+    monkeypatch.setattr(stress, "check_action", lambda game, action: "broken")
+    with pytest.raises(stress.InvariantViolation) as caught:
+        stress.stress(3, 6, 4, 3)
+    violation = caught.value
+    assert (violation.seed, violation.player_count, violation.round_limit, violation.step) == (3, 1, 1, 0)
+    assert "seed=3" in str(violation)
@@ -0,0 +1,51 @@
+import pytest
+from Important_Programs import sweep
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.simulation import Aggregate, HeadlessGame, run_batch, split_seeds
+from Important_Programs.sweep import ResultCache, grid_design, random_design, run_sweep
+
+def test_seeded_games_are_reproducible():
+    first = HeadlessGame(7, 4, 5).start_game()
+    second = HeadlessGame(7, 4, 5).start_game()
+    assert first == second
+
+def test_split_batches_merge_to_the_whole():
+    whole = run_batch(DEFAULT_SCENARIO, 0, 20, 3, 3)
+    parts = Aggregate()
+    for start, stop in split_seeds(0, 20, 3):
+        parts.merge(run_batch(DEFAULT_SCENARIO, start, stop, 3, 3))
+    assert parts.games == whole.games == 20
+    assert parts.wins == whole.wins
+    assert parts.entries == whole.entries
+    assert parts.bank_min == whole.bank_min and parts.bank_max == whole.bank_max
+    for strategy, total in whole.bank_sum.items():
+        assert parts.bank_sum[strategy] == pytest.approx(total)
+
+def test_aggregates_round_trip():
+    aggregate = run_batch(DEFAULT_SCENARIO, 0, 5, 3, 3)
+    assert Aggregate.from_dict(aggregate.to_dict()).to_dict() == aggregate.to_dict()
+
+def test_designs():
+    assert grid_design({"a": [1, 2], "b": [3]}) == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+    points = random_design({"a": {"low": 0, "high": 1}, "b": [5]}, 4, seed=1)
+    assert points == random_design({"a": {"low": 0, "high": 1}, "b": [5]}, 4, seed=1)
+    assert all(0 <= point["a"] <= 1 and point["b"] == 5 for point in points)
+
+def test_cache_keys_change_with_the_inputs(monkeypatch):
+    key = ResultCache.key(DEFAULT_SCENARIO, 0, 10, 4, 5, ("random",))
+    assert key == ResultCache.key(DEFAULT_SCENARIO, 0, 10, 4, 5, ("random",))
+    assert key != ResultCache.key(DEFAULT_SCENARIO.with_changes(starting_bank=1), 0, 10, 4, 5, ("random",))
+    monkeypatch.setattr(sweep, "ENGINE_VERSION", "test")
+    assert key != ResultCache.key(DEFAULT_SCENARIO, 0, 10, 4, 5, ("random",))
+
+def test_sweeps_reuse_cached_points(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    points = grid_design({"steal_success_chance": [0.2, 0.8]})
+    first = run_sweep(points, 0, 6, 3, 3, workers=1, cache=cache)
+
+    def no_workers(*args, **kwargs):
+        raise AssertionError("A cached point was simulated again.")
+
+    monkeypatch.setattr(sweep, "ProcessPoolExecutor", no_workers)
+    second = run_sweep(points, 0, 6, 3, 3, workers=1, cache=cache)
+    assert [aggregate.to_dict() for _, aggregate in first] == [aggregate.to_dict() for _, aggregate in second]
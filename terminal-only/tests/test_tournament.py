@@ -0,0 +1,44 @@
+import pytest
+from Important_Programs.scenario import DEFAULT_SCENARIO
+from Important_Programs.tournament import Tournament, expected_score, play_match
+
+STRATEGIES = ("worker", "thief", "treasure", "gambler", "investor")
+
+def test_expected_scores_are_symmetric():
+    assert expected_score(1500, 1500) == 0.5
+    assert expected_score(1900, 1500) == pytest.approx(10 / 11)
+    assert expected_score(1900, 1500) + expected_score(1500, 1900) == pytest.approx(1.0)
+
+def test_every_game_hands_out_one_point_per_pairing():
+    scores = play_match(DEFAULT_SCENARIO, ("worker", "thief", "gambler"), range(6), 3)
+    assert sum(scores.values()) == 6 * 3
+
+def test_groups_avoid_repeating_the_last_round():
+    tournament = Tournament(STRATEGIES)
+    first = tournament.pair_round()
+    assert [len(group) for group in first] == [2, 2]
+    tournament.previous = {frozenset(group) for group in first}
+    assert not {frozenset(group) for group in tournament.pair_round()} & tournament.previous
+
+def test_close_matches_get_more_games():
+    tournament = Tournament(STRATEGIES)
+    tournament.ratings.update(worker=1500, thief=1500, treasure=2300, gambler=1400)
+    allocation = dict(tournament.allocate([("worker", "thief"), ("treasure", "gambler")], 10))
+    assert sum(allocation.values()) == 10
+    assert allocation["worker", "thief"] > allocation["treasure", "gambler"] >= 1
+    assert tournament.allocate([("worker", "thief"), ("treasure", "gambler")], 1) == [(("worker", "thief"), 1)]
+
+def test_ratings_are_conserved_and_the_budget_respected():
+    tournament = Tournament(STRATEGIES[:4], budget=30, games_per_round=8, round_limit=3, tolerance=0)
+    while tournament.games_played < tournament.budget:
+        tournament.play_round()
+    assert tournament.games_played == 30 and tournament.next_seed == 30
+    assert sum(tournament.ratings.values()) == pytest.approx(1500 * 4)
+    assert [strategy for strategy, _, _ in tournament.standings()] == \
+           sorted(tournament.ratings, key=lambda strategy: -tournament.ratings[strategy])
+
+def test_rejects_tournaments_without_opponents():
+    with pytest.raises(ValueError):
+        Tournament(["worker", "worker"])
+    with pytest.raises(ValueError):
+        Tournament(STRATEGIES, table_size=1)
@@ -0,0 +1,44 @@
+from Important_Programs.trace import diff_traces, open_trace, record_traces
+
+def test_the_same_seeds_give_identical_traces(tmp_path):
+    first, second = str(tmp_path / "a.trace"), str(tmp_path / "b.trace.gz")
+    assert record_traces(first, 0, 3, 3, 2) == 3
+    record_traces(second, 0, 3, 3, 2)
+    assert diff_traces(first, second) is None
+
+def test_comments_are_ignored(tmp_path):
+    path = str(tmp_path / "a.trace")
+    record_traces(path, 0, 1, 2, 1)
+    with open_trace(path) as file:
+        lines = file.readlines()
+    commented = str(tmp_path / "b.trace")
+    with open_trace(commented, "w") as file:
+        file.writelines(["# another engine\n"] + lines)
+    assert diff_traces(path, commented) is None
+
+def test_the_first_divergence_is_reported_with_context(tmp_path):
+    path = str(tmp_path / "a.trace")
+    record_traces(path, 0, 2, 2, 2)
+    with open_trace(path) as file:
+        lines = file.readlines()
+    changed_at = next(index for index, line in enumerate(lines) if index > 10 and line.startswith("action\t"))
+    changed = list(lines)
+    changed[changed_at] = changed[changed_at].replace('"bank":', '"bank":0,"was":', 1)
+    other = str(tmp_path / "b.trace")
+    with open_trace(other, "w") as file:
+        file.writelines(changed)
+
+    difference = diff_traces(path, other, context=3)
+    assert difference["line_a"] == difference["line_b"] == changed_at + 1
+    assert difference["a"] == lines[changed_at].rstrip("\n")
+    assert difference["b"] == changed[changed_at].rstrip("\n")
+    assert difference["game"].startswith("game\t")
+    assert difference["before"] == [line.rstrip("\n") for line in lines[changed_at - 3:changed_at]]
+    assert difference["after_a"] == difference["after_b"] == [line.rstrip("\n") for line in lines[changed_at + 1:changed_at + 4]]
+
+def test_a_shorter_trace_diverges_where_it_ends(tmp_path):
+    longer, shorter = str(tmp_path / "a.trace"), str(tmp_path / "b.trace")
+    record_traces(longer, 0, 2, 2, 1)
+    record_traces(shorter, 0, 1, 2, 1)
+    difference = diff_traces(longer, shorter)
+    assert difference["b"] is None and difference["a"].startswith("game\t")